@@ -84,6 +84,7 @@ class MusicArtistXPersonActivityInline(admin.TabularInline):
 
 
 class MusicArtistXSongInline(admin.TabularInline):
+    form = forms.admin.MusicArtistXSongForm
     model = models.MusicArtistXSong
     extra = 1
 
@@ -129,6 +130,7 @@ class PersonXPhotoInline(admin.TabularInline):
 
 
 class PersonXSongInline(admin.TabularInline):
+    form = forms.admin.PersonXSongForm
     model = models.PersonXSong
     extra = 1
 
@@ -147,6 +149,7 @@ class PersonXSongArrangementInline(admin.TabularInline):
 
 
 class PersonXSongPerformanceInline(admin.TabularInline):
+    form = forms.admin.PersonXSongPerformanceForm
     model = models.PersonXSongPerformance
     extra = 1
 
@@ -0,0 +1,14 @@
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
+
+
+class PkCountPaginator(Paginator):
+    """Counts primary keys only, leaving out annotations and ordering.
+
+    For changelists whose get_queryset adds expensive annotations that don't
+    affect the number of rows.
+    """
+
+    @cached_property
+    def count(self) -> int:
+        return self.object_list.order_by().values('pk').count()
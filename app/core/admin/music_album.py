@@ -69,7 +69,9 @@ class MusicAlbumEditionAdmin(admin.ModelAdmin):
     inlines = [
         _inlines.MusicAlbumEditionXSongRecordingInline
     ]
-    list_display = ('_description', 'year_produced')
+    list_display = (
+        '_description', 'year_produced', 'track_count', 'duration',
+    )
     list_select_related = ('music_album',)
     ordering = ('music_album__title', 'name')
     search_fields = ('music_album__title', 'name')
@@ -1,9 +1,9 @@
 from django.contrib import admin
-from django.db.models import Count
 
 from .. import forms
 from ..models import music_artist
 from . import _inlines
+from ._paginators import PkCountPaginator
 
 
 @admin.register(music_artist.MusicArtist)
@@ -18,30 +18,29 @@ class MusicArtistAdmin(admin.ModelAdmin):
         '_personnel_count', 'website',
     )
     ordering = ('name',)
+    paginator = PkCountPaginator
     search_fields = ('name',)
+    show_full_result_count = False
 
     def get_queryset(self, request):
         qs = super().get_queryset(request)
-        return (
-            qs
-            .annotate(
-                Count('arrangements', distinct=True),
-                Count('music_albums', distinct=True),
-                Count('personnel', distinct=True),
-            )
-        )
+        return qs.with_counts()
 
     @staticmethod
+    @admin.display(description='album count', ordering='album_count')
     def _album_count(obj):
-        return obj.music_albums__count
+        return obj.album_count
 
     @staticmethod
+    @admin.display(
+        description='arrangement count', ordering='arrangement_count')
     def _arrangement_count(obj):
-        return obj.arrangements__count
+        return obj.arrangement_count
 
     @staticmethod
+    @admin.display(description='personnel count', ordering='personnel_count')
     def _personnel_count(obj):
-        return obj.personnel__count
+        return obj.personnel_count
 
 
 @admin.register(music_artist.MusicArtistActivity)
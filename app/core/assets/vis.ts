@@ -18,7 +18,53 @@ const defaultOptions = {
 };
 
 
-const visData = JSON.parse(document.getElementById("vis-data")!.textContent!);
+// Expands VisNetwork.to_compact() back into vis nodes and edges; plain
+// to_json() payloads pass through
+function decodeNetwork(data: any): {nodes: any[], edges: any[]} {
+    if (data.format !== "compact") {
+        return data;
+    }
+    const strings: string[] = data.strings;
+    const ids = data.ids.map((i: number) => strings[i]);
+    const columns = data.nodes;
+    const nodes = columns.label.map((label: number, i: number) => {
+        const node: any = {
+            ...data.nodeStyles[columns.style[i]],
+            id: ids[i],
+            label: strings[label],
+        };
+        if (strings[columns.group[i]]) {
+            node.group = strings[columns.group[i]];
+        }
+        if (columns.mass[i] !== null) {
+            node.mass = columns.mass[i];
+        }
+        if (columns.value[i] !== null) {
+            node.value = columns.value[i];
+        }
+        return node;
+    });
+    const bytes = Uint8Array.from(atob(data.edges), (c) => c.charCodeAt(0));
+    const view = new DataView(bytes.buffer);
+    const edges = [];
+    for (let offset = 0; offset < bytes.length; offset += 16) {
+        const edge: any = {
+            ...data.edgeStyles[view.getInt32(offset + 8, true)],
+            from: ids[view.getInt32(offset, true)],
+            to: ids[view.getInt32(offset + 4, true)],
+        };
+        const value = view.getInt32(offset + 12, true);
+        if (value !== -1) {
+            edge.value = value;
+        }
+        edges.push(edge);
+    }
+    return {nodes, edges};
+}
+
+
+const visData = decodeNetwork(
+    JSON.parse(document.getElementById("vis-data")!.textContent!));
 let visOptions;
 let element = document.getElementById("vis-options");
 if (element !== null) {
@@ -32,4 +78,42 @@ console.log(visData);
 console.log(visOptions);
 
 const container = document.getElementById("vis-container");
-new Network(container!, visData, visOptions);
+const network = new Network(container!, visData, visOptions);
+
+// Coarse graphs: double-clicking a cluster replaces it with its members
+const clusterUrlElement = document.getElementById("vis-cluster-url");
+if (clusterUrlElement !== null) {
+    const clusterUrl: string = JSON.parse(clusterUrlElement.textContent!);
+    const expanded: string[] = [];
+    network.on("doubleClick", async (params) => {
+        const nodeId = params.nodes[0];
+        if (typeof nodeId !== "string" || !nodeId.startsWith("cluster-")) {
+            return;
+        }
+        const clusterId = nodeId.slice("cluster-".length);
+        // Edges to clusters already expanded come back by member
+        const query = new URLSearchParams({expanded: expanded.join(",")});
+        const response = await fetch(
+            clusterUrl.replace("__cluster__", encodeURIComponent(clusterId))
+            + "?" + query);
+        if (!response.ok) {
+            return;
+        }
+        const cluster = decodeNetwork(await response.json());
+        const nodes = visData.nodes.filter((node: any) => node.id !== nodeId);
+        const nodeIds = new Set(nodes.map((node: any) => node.id));
+        nodes.push(...cluster.nodes);
+        cluster.nodes.forEach((node: any) => nodeIds.add(node.id));
+        // Members now stand in for the cluster node on the edges they bring
+        const edges = visData.edges
+            .filter((edge: any) => edge.from !== nodeId && edge.to !== nodeId)
+            .concat(cluster.edges)
+            .filter((edge: any) => (
+                nodeIds.has(edge.from) && nodeIds.has(edge.to)
+            ));
+        expanded.push(clusterId);
+        visData.nodes = nodes;
+        visData.edges = edges;
+        network.setData(visData);
+    });
+}
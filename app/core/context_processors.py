@@ -1,15 +1,54 @@
+import time
+
+from django.core.cache import cache
+from django.utils.functional import SimpleLazyObject
+
 from core.models.config import Config, Options
 
 DEFAULTS = {
     Options.ROOT_HEADER_TEXT.value: 'Home'
 }
 
+CACHE_KEY = 'core:config'
+
+# Bounds how long a stale copy can outlive a missed invalidation
+CACHE_TIMEOUT = 60 * 60
+
+# Other processes only learn about a change through the shared cache, so the
+# copy kept in each process has to expire on its own.
+LOCAL_TTL = 10
+
+_local_config: tuple[dict | None, float] = (None, 0.0)
+
+
+def get_config() -> dict[str, str]:
+    """Config options, from process memory, then the cache, then the
+    database.
+    """
+
+    global _local_config
+    now = time.monotonic()
+    config, expires = _local_config
+    if config is not None and now < expires:
+        return config
+    config = cache.get(CACHE_KEY)
+    if config is None:
+        config = {d['option']: d['value'] for d in Config.objects.values()}
+        for option in Options:
+            if option not in config:
+                config[option] = DEFAULTS[option]
+        cache.set(CACHE_KEY, config, CACHE_TIMEOUT)
+    _local_config = config, now + LOCAL_TTL
+    return config
+
+
+def clear_config_cache() -> None:
+    global _local_config
+    cache.delete(CACHE_KEY)
+    _local_config = None, 0.0
+
 
 def config_context(_request) -> dict:
-    config = {d['option']: d['value'] for d in Config.objects.values()}
-    for option in Options:
-        if option not in config:
-            config[option] = DEFAULTS[option]
     return {
-        'CONFIG': config,
+        'CONFIG': SimpleLazyObject(get_config),
     }
@@ -17,6 +17,7 @@ from .fields import (
     MusicArtistXPersonChoiceField,
     PersonChoiceField,
     PersonXPhotoChoiceField,
+    SongChoiceField,
     SongPerformanceChoiceField,
     SongRecordingChoiceField,
 )
@@ -90,6 +91,14 @@ class MusicArtistXPersonActivityForm(ModelForm):
         }
 
 
+class MusicArtistXSongForm(ModelForm):
+    class Meta:
+        field_classes = {
+            'music_artist': MusicArtistChoiceField,
+            'song': SongChoiceField,
+        }
+
+
 class MusicArtistXSongPerformanceForm(ModelForm):
     class Meta:
         field_classes = {
@@ -120,6 +129,22 @@ class PersonXPhotoForm(ModelForm):
         }
 
 
+class PersonXSongForm(ModelForm):
+    class Meta:
+        field_classes = {
+            'person': PersonChoiceField,
+            'song': SongChoiceField,
+        }
+
+
+class PersonXSongPerformanceForm(ModelForm):
+    class Meta:
+        field_classes = {
+            'person': PersonChoiceField,
+            'song_performance': SongPerformanceChoiceField,
+        }
+
+
 class SongRecordingForm(ModelForm):
     class Meta:
         field_classes = {
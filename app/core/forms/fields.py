@@ -1,7 +1,33 @@
 from itertools import islice
 
+from django.db.models import QuerySet
+from django.db.models.functions import Upper
 from django.forms import ModelChoiceField
 
+from .widgets import AutocompleteSelect
+
+
+class AutocompleteChoiceField(ModelChoiceField):
+    """Choice field whose options are loaded from core:autocomplete.
+
+    `search_field` is matched by prefix and should have an index on its
+    upper-cased value with text_pattern_ops.
+    """
+
+    autocomplete_kind: str
+    search_field: str
+
+    def __init__(self, queryset, **kwargs):
+        kwargs.setdefault('widget', AutocompleteSelect(self.autocomplete_kind))
+        super().__init__(queryset, **kwargs)
+
+    def search(self, term: str) -> QuerySet:
+        return (
+            self.queryset
+            .filter(**{f'{self.search_field}__istartswith': term})
+            .order_by(Upper(self.search_field), 'pk')
+        )
+
 
 class AccountAssetChoiceField(ModelChoiceField):
     def __init__(self, queryset, **kwargs):
@@ -81,7 +107,10 @@ class MusicArtistXPersonChoiceField(ModelChoiceField):
         return f'{obj.music_artist.name} : {obj.person.full_name}'
 
 
-class PersonChoiceField(ModelChoiceField):
+class PersonChoiceField(AutocompleteChoiceField):
+    autocomplete_kind = 'person'
+    search_field = 'preferred_name'
+
     def label_from_instance(self, obj) -> str:
         return obj.preferred_name
 
@@ -101,7 +130,10 @@ class PersonXPhotoChoiceField(ModelChoiceField):
         )
 
 
-class SongChoiceField(ModelChoiceField):
+class SongChoiceField(AutocompleteChoiceField):
+    autocomplete_kind = 'song'
+    search_field = 'title'
+
     def __init__(self, queryset, **kwargs):
         if queryset is not None:
             queryset = (
@@ -116,7 +148,10 @@ class SongChoiceField(ModelChoiceField):
         return f'{obj.title} [{artists}]'
 
 
-class SongPerformanceChoiceField(ModelChoiceField):
+class SongPerformanceChoiceField(AutocompleteChoiceField):
+    autocomplete_kind = 'song-performance'
+    search_field = 'song_arrangement__title'
+
     def __init__(self, queryset, **kwargs):
         if queryset is not None:
             queryset = (
@@ -136,7 +171,10 @@ class SongPerformanceChoiceField(ModelChoiceField):
         return f'{label} [{obj.performance_type}]'
 
 
-class SongRecordingChoiceField(ModelChoiceField):
+class SongRecordingChoiceField(AutocompleteChoiceField):
+    autocomplete_kind = 'song-recording'
+    search_field = 'song_performance__song_arrangement__title'
+
     def __init__(self, queryset, **kwargs):
         if queryset is not None:
             queryset = (
@@ -0,0 +1,68 @@
+from django.conf import settings
+from django.forms import Media, Select
+from django.urls import reverse
+
+
+class AutocompleteSelect(Select):
+    """Select2 widget backed by core:autocomplete.
+
+    Only the selected option is rendered; everything else is fetched a page at
+    a time while typing. Reuses the select2 copy bundled with the admin.
+    """
+
+    def __init__(self, kind: str, attrs=None, choices=()):
+        super().__init__(attrs, choices)
+        self.kind = kind
+
+    def build_attrs(self, base_attrs, extra_attrs=None) -> dict:
+        attrs = super().build_attrs(base_attrs, extra_attrs=extra_attrs)
+        attrs.setdefault('class', '')
+        attrs.update({
+            'class': f'{attrs["class"]} core-autocomplete'.strip(),
+            'data-ajax--cache': 'true',
+            'data-ajax--delay': 250,
+            'data-ajax--type': 'GET',
+            'data-ajax--url': reverse('core:autocomplete', args=[self.kind]),
+            'data-allow-clear': 'false' if self.is_required else 'true',
+            'data-placeholder': '',
+            'data-theme': 'admin-autocomplete',
+        })
+        return attrs
+
+    def optgroups(self, name, value, attrs=None) -> list:
+        field = self.choices.field
+        options = []
+        if not self.is_required:
+            options.append(self.create_option(name, '', '', False, 0))
+        selected = [x for x in value if x not in field.empty_values]
+        if selected:
+            to_field_name = field.to_field_name or 'pk'
+            qs = field.queryset.filter(**{f'{to_field_name}__in': selected})
+            for obj in qs:
+                options.append(self.create_option(
+                    name,
+                    field.prepare_value(obj),
+                    field.label_from_instance(obj),
+                    True,
+                    len(options),
+                    attrs=attrs,
+                ))
+        return [(None, options, 0)]
+
+    @property
+    def media(self) -> Media:
+        extra = '' if settings.DEBUG else '.min'
+        return Media(
+            js=(
+                f'admin/js/vendor/jquery/jquery{extra}.js',
+                f'admin/js/vendor/select2/select2.full{extra}.js',
+                'admin/js/jquery.init.js',
+                'core/js/autocomplete.js',
+            ),
+            css={
+                'screen': (
+                    f'admin/css/vendor/select2/select2{extra}.css',
+                    'admin/css/autocomplete.css',
+                ),
+            },
+        )
@@ -0,0 +1,196 @@
+"""Regenerates resized images and fills in missing SHA-256 digests.
+
+Rows are walked in primary key order, resized in a process pool, and written
+back in batches. A row is only picked up when its digest or one of its resized
+images is missing, so an interrupted run can simply be started again; the last
+primary key of each finished batch is also reported for use with --after-pk.
+"""
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import hashlib
+import os
+
+from django.core.files.base import ContentFile
+from django.core.management.base import BaseCommand
+from django.db import connections
+from django.db.models import Q
+
+from core.models import MusicAlbumArtwork, Photo
+from core.models._utils import resize_image_data
+
+MODELS = {
+    'music_album_artwork': MusicAlbumArtwork,
+    'photo': Photo,
+}
+
+
+def image_source(field_file) -> str | bytes:
+    """The path for workers to read, or the content itself when the storage
+    has no local files.
+    """
+
+    try:
+        return field_file.path
+    except NotImplementedError:
+        with field_file.open('rb') as f:
+            return f.read()
+
+
+def process_image(
+        pk: int,
+        source: str | bytes,
+        file_name: str,
+        sizes: list[tuple[str, tuple[int, int]]],
+) -> tuple[int, str, dict]:
+    """Worker function; reads the full image once, then hashes and resizes."""
+
+    if isinstance(source, bytes):
+        content = source
+    else:
+        with open(source, 'rb') as f:
+            content = f.read()
+    sha256 = hashlib.sha256(content).hexdigest()
+    return pk, sha256, resize_image_data(content, file_name, sizes)
+
+
+class Command(BaseCommand):
+    help = (
+        "Regenerates image_large/medium/small/thumbnail and image_full_sha256"
+        " for Photo and MusicAlbumArtwork records."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            '--model', action='append', choices=sorted(MODELS),
+            dest='models',
+            help="Limit to one model; may be repeated. Defaults to all.",
+        )
+        parser.add_argument(
+            '--batch-size', type=int, default=100,
+            help="Rows resized and written back per batch.",
+        )
+        parser.add_argument(
+            '--workers', type=int, default=os.cpu_count(),
+            help="Worker processes. Defaults to the number of CPUs.",
+        )
+        parser.add_argument(
+            '--after-pk', type=int, default=0,
+            help="Skip rows up to and including this primary key.",
+        )
+        parser.add_argument(
+            '--regenerate', action='store_true',
+            help=(
+                "Process every row, not only those with missing values."
+                " Use after changing ImageSize."
+            ),
+        )
+
+    def handle(self, *args, **options) -> None:
+        models = options['models'] or sorted(MODELS)
+        # Forked workers must not share the parent's database connection.
+        connections.close_all()
+        with ProcessPoolExecutor(max_workers=options['workers']) as executor:
+            for label in models:
+                self.backfill(
+                    executor,
+                    MODELS[label],
+                    batch_size=options['batch_size'],
+                    after_pk=options['after_pk'],
+                    regenerate=options['regenerate'],
+                )
+
+    @staticmethod
+    def get_queryset(model, after_pk: int, regenerate: bool):
+        field_names = [f'image_{x.name.lower()}' for x in model.ImageSize]
+        qs = (
+            model.objects
+            .exclude(image_full='')
+            .filter(pk__gt=after_pk)
+            .only('pk', 'image_full', 'image_full_sha256', *field_names)
+            .order_by('pk')
+        )
+        if not regenerate:
+            missing = Q(image_full_sha256__isnull=True)
+            for field_name in field_names:
+                missing |= Q(**{f'{field_name}__isnull': True})
+                missing |= Q(**{field_name: ''})
+            qs = qs.filter(missing)
+        return qs
+
+    def backfill(
+            self,
+            executor: ProcessPoolExecutor,
+            model,
+            batch_size: int,
+            after_pk: int,
+            regenerate: bool,
+    ) -> None:
+        qs = self.get_queryset(model, after_pk, regenerate)
+        total = qs.count()
+        self.stdout.write(f'{model.__name__}: {total} to process')
+        done = 0
+        batch = []
+        for obj in qs.iterator(chunk_size=batch_size):
+            batch.append(obj)
+            if len(batch) == batch_size:
+                done += self.process_batch(executor, model, batch)
+                self.report(model, done, total, batch[-1].pk)
+                batch = []
+        if batch:
+            done += self.process_batch(executor, model, batch)
+            self.report(model, done, total, batch[-1].pk)
+
+    def process_batch(
+            self, executor: ProcessPoolExecutor, model, batch: list) -> int:
+        """Resizes one batch in the pool and writes it back; returns count."""
+
+        sizes = [(x.name.lower(), x.value) for x in model.ImageSize]
+        field_names = [f'image_{name}' for name, _ in sizes]
+        objs = {obj.pk: obj for obj in batch}
+        futures = [
+            executor.submit(
+                process_image,
+                obj.pk, image_source(obj.image_full), obj.image_full.name,
+                sizes,
+            )
+            for obj in batch
+        ]
+        results = {}
+        for future in as_completed(futures):
+            try:
+                pk, sha256, images = future.result()
+            except Exception as e:
+                self.stderr.write(f'{model.__name__}: {e}')
+                continue
+            results[pk] = sha256, images
+        # Identical images uploaded twice would violate the unique digest
+        duplicates = set(
+            model.objects
+            .filter(image_full_sha256__in=[x[0] for x in results.values()])
+            .exclude(pk__in=results.keys())
+            .values_list('image_full_sha256', flat=True)
+        )
+        updated = []
+        for pk, (sha256, images) in results.items():
+            obj = objs[pk]
+            if sha256 in duplicates:
+                self.stderr.write(
+                    f'{model.__name__} {pk}: duplicate image, skipped')
+                continue
+            obj.image_full_sha256 = sha256
+            for field_name, (file_name, content) in images.items():
+                field = getattr(obj, field_name)
+                # Replace in place so repeated runs don't leave suffixed copies
+                if field:
+                    field.storage.delete(field.name)
+                field.storage.delete(file_name)
+                field.save(file_name, ContentFile(content), save=False)
+            duplicates.add(sha256)
+            updated.append(obj)
+        model.objects.bulk_update(
+            updated, ['image_full_sha256', *field_names])
+        return len(updated)
+
+    def report(self, model, done: int, total: int, last_pk: int) -> None:
+        self.stdout.write(
+            f'{model.__name__}: {done}/{total} (last pk {last_pk})')
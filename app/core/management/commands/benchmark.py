@@ -0,0 +1,95 @@
+"""Times hot paths against a generated data set and writes JSON results.
+
+The data set is created inside a transaction that is rolled back afterwards,
+so the command can be pointed at a development database. Results include the
+current commit so runs can be compared across changes, e.g.:
+
+    manage.py benchmark --scale 10 --output var/bench/$(git rev-parse HEAD).json
+"""
+
+import datetime
+import json
+import platform
+import subprocess
+
+import django
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from core.utils import benchmark
+
+
+def get_commit() -> str | None:
+    try:
+        result = subprocess.run(
+            ['git', 'rev-parse', 'HEAD'],
+            cwd=settings.BASE_DIR, capture_output=True, text=True, check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+class Command(BaseCommand):
+    help = (
+        "Generates synthetic data scaled by --scale, times network builders,"
+        " account hierarchy and register views, and rolls the data back."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            '--scale', type=int, default=1,
+            help="Multiplier for the number of generated rows.",
+        )
+        parser.add_argument(
+            '--repeat', type=int, default=5,
+            help="Timed runs per case.",
+        )
+        parser.add_argument(
+            '--seed', type=int, default=0,
+            help="Random seed for the generated data.",
+        )
+        parser.add_argument(
+            '--case', action='append', dest='cases',
+            help="Only run cases whose name contains this; may be repeated.",
+        )
+        parser.add_argument(
+            '--output',
+            help="Write results to this file instead of stdout.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        cases = benchmark.get_cases()
+        if options['cases']:
+            cases = [
+                case for case in cases
+                if any(x in case.name for x in options['cases'])
+            ]
+        with transaction.atomic():
+            self.stderr.write(f'Generating data at scale {options["scale"]}')
+            counts = benchmark.generate(options['scale'], options['seed'])
+            results = []
+            for case in cases:
+                result = benchmark.time_case(case, options['repeat'])
+                self.stderr.write(
+                    f'{case.name}: {result["median"]:.4f}s median,'
+                    f' {result["queries"]} queries'
+                )
+                results.append(result)
+            transaction.set_rollback(True)
+        output = json.dumps({
+            'commit': get_commit(),
+            'timestamp': datetime.datetime.now(datetime.UTC).isoformat(),
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'scale': options['scale'],
+            'seed': options['seed'],
+            'counts': counts,
+            'results': results,
+        }, indent=2)
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                f.write(output + '\n')
+        else:
+            self.stdout.write(output)
@@ -0,0 +1,45 @@
+"""Imports CatalogItems from a CSV file with a header row.
+
+Columns are those accepted by core.utils.catalog.import_catalog_items; unknown
+columns are ignored. Items are matched to existing rows by any identifier.
+"""
+
+import csv
+from itertools import batched
+import sys
+
+from django.core.management.base import BaseCommand
+
+from core.utils.catalog import import_catalog_items
+
+
+class Command(BaseCommand):
+    help = "Creates or updates CatalogItems and their subtypes from CSV."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument('path', help="CSV file, or - for stdin.")
+        parser.add_argument(
+            '--batch-size', type=int, default=1000,
+            help="Rows validated, matched and written per batch.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        if options['path'] == '-':
+            self.import_file(sys.stdin, options['batch_size'])
+        else:
+            with open(options['path'], newline='') as f:
+                self.import_file(f, options['batch_size'])
+
+    def import_file(self, f, batch_size: int) -> None:
+        created = updated = skipped = 0
+        for n, batch in enumerate(batched(csv.DictReader(f), batch_size)):
+            result = import_catalog_items(batch)
+            created += result.created
+            updated += result.updated
+            skipped += len({i for i, _, _ in result.errors})
+            for i, column, message in result.errors:
+                # Line 1 is the header
+                line = n * batch_size + i + 2
+                self.stderr.write(f'line {line}: {column}: {message}')
+        self.stdout.write(
+            f'{created} created, {updated} updated, {skipped} skipped')
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from core.models import MusicAlbumEdition
+
+
+class Command(BaseCommand):
+    help = (
+        "Recomputes the stored duration, track count and disc count of every"
+        " MusicAlbumEdition, e.g., after bulk edits that bypass signals."
+    )
+
+    def handle(self, *args, **options) -> None:
+        count = MusicAlbumEdition.objects.all().update_statistics()
+        self.stdout.write(f'Updated {count} music album editions')
@@ -0,0 +1,45 @@
+from django.core.management.base import BaseCommand
+
+from core.models import PointOfSale
+
+
+class Command(BaseCommand):
+    help = (
+        "Lists points of sale whose line item total differs from the"
+        " reference total or the debits of their linked Txn."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            '--year', type=int,
+            help="Only points of sale dated in this year.",
+        )
+        parser.add_argument(
+            '--unlinked', action='store_true',
+            help="Also list points of sale without a Txn.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        qs = PointOfSale.objects.with_totals()
+        if options['year']:
+            qs = qs.filter(point_of_sale_date__year=options['year'])
+        excluded = [PointOfSale.TxnStatus.MATCHED]
+        if not options['unlinked']:
+            excluded.append(PointOfSale.TxnStatus.UNLINKED)
+        qs = (
+            qs.exclude(txn_status__in=excluded)
+            .select_related('party')
+            .order_by('point_of_sale_date', 'pk')
+        )
+        count = 0
+        for pos in qs:
+            count += 1
+            self.stdout.write(
+                f'{pos.point_of_sale_date} {pos.pk} {pos.party}:'
+                f' {PointOfSale.TxnStatus(pos.txn_status).label};'
+                f' {pos.line_item_count} line items'
+                f' totalling {pos.line_item_total:.2f},'
+                f' txn {pos.txn_id} reference total {pos.txn_ref_total}'
+                f' and debits {pos.txn_total:.2f}'
+            )
+        self.stdout.write(f'{count} points of sale to reconcile')
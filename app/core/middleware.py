@@ -0,0 +1,160 @@
+"""Per-request database query accounting.
+
+QueryBudgetMiddleware wraps every database connection for the duration of a
+request, counting queries, time spent in the database and how often each SQL
+statement repeats. Requests over the configured budget are logged, and totals
+per view are kept in process memory for the query stats page.
+
+Budgets come from the QUERY_BUDGET setting; a view may override any of the
+defaults under VIEWS, keyed by URL name (or dotted path for unnamed URLs):
+
+    QUERY_BUDGET = {
+        'MAX_QUERIES': 50,
+        'MAX_DURATION': 0.5,
+        'MAX_DUPLICATES': 5,
+        'VIEWS': {
+            'core:txn-register': {'MAX_QUERIES': 10},
+        },
+    }
+"""
+
+from collections import Counter
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+import logging
+import re
+import threading
+import time
+
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUDGET = {
+    'MAX_QUERIES': 50,
+    'MAX_DURATION': 0.5,
+    'MAX_DUPLICATES': 5,
+}
+
+_IN_LIST = re.compile(r'\((?:%s, )*%s\)')
+
+
+def fingerprint(sql: str) -> str:
+    """SQL with IN lists collapsed, so N+1 lookups share one fingerprint."""
+
+    return _IN_LIST.sub('(...)', sql)
+
+
+class QueryRecorder:
+    """execute_wrapper that records the queries of one request."""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.fingerprints = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.duration += time.perf_counter() - start
+            self.fingerprints[fingerprint(sql)] += 1
+
+    @property
+    def duplicates(self) -> dict[str, int]:
+        return {sql: n for sql, n in self.fingerprints.items() if n > 1}
+
+
+@dataclass
+class ViewStats:
+    requests: int = 0
+    queries: int = 0
+    duration: float = 0.0
+    max_queries: int = 0
+    over_budget: int = 0
+    duplicates: Counter = field(default_factory=Counter)
+
+    @property
+    def mean_queries(self) -> float:
+        return self.queries / self.requests if self.requests else 0.0
+
+    @property
+    def mean_duration(self) -> float:
+        return self.duration / self.requests if self.requests else 0.0
+
+
+class QueryStats:
+    """Totals per view since the process started."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._views: dict[str, ViewStats] = {}
+
+    def record(
+            self, view_name: str, recorder: QueryRecorder, over_budget: bool):
+        with self._lock:
+            stats = self._views.setdefault(view_name, ViewStats())
+            stats.requests += 1
+            stats.queries += recorder.count
+            stats.duration += recorder.duration
+            stats.max_queries = max(stats.max_queries, recorder.count)
+            stats.over_budget += over_budget
+            stats.duplicates.update(recorder.duplicates)
+
+    def items(self) -> list[tuple[str, ViewStats]]:
+        with self._lock:
+            return sorted(self._views.items())
+
+    def clear(self):
+        with self._lock:
+            self._views.clear()
+
+
+query_stats = QueryStats()
+
+
+def get_budget(view_name: str) -> dict:
+    config = getattr(settings, 'QUERY_BUDGET', {})
+    budget = DEFAULT_BUDGET.copy()
+    budget.update(
+        (k, v) for k, v in config.items() if k in DEFAULT_BUDGET)
+    budget.update(config.get('VIEWS', {}).get(view_name, {}))
+    return budget
+
+
+class QueryBudgetMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        recorder = QueryRecorder()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(recorder))
+            response = self.get_response(request)
+        if request.resolver_match is not None:
+            self.check(request, recorder)
+        return response
+
+    @staticmethod
+    def check(request, recorder: QueryRecorder):
+        view_name = request.resolver_match.view_name
+        budget = get_budget(view_name)
+        duplicates = recorder.duplicates
+        problems = []
+        if recorder.count > budget['MAX_QUERIES']:
+            problems.append(f'{recorder.count} queries')
+        if recorder.duration > budget['MAX_DURATION']:
+            problems.append(f'{recorder.duration:.3f}s in the database')
+        worst = max(duplicates.items(), key=lambda x: x[1], default=None)
+        if worst and worst[1] > budget['MAX_DUPLICATES']:
+            problems.append(f'{worst[1]} repeats of: {worst[0]}')
+        query_stats.record(view_name, recorder, bool(problems))
+        if problems:
+            logger.warning(
+                'Query budget exceeded by %s %s (%s): %s',
+                request.method, request.path, view_name, '; '.join(problems)
+            )
@@ -0,0 +1,60 @@
+# Generated by Django 5.0 on 2024-08-12 14:05
+
+from django.db import migrations, models
+from django.db.models import Count, Max, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+
+
+def update_statistics(apps, schema_editor):
+    MusicAlbumEdition = apps.get_model('core', 'MusicAlbumEdition')
+    MusicAlbumEditionXSongRecording = apps.get_model(
+        'core', 'MusicAlbumEditionXSongRecording')
+    tracks = (
+        MusicAlbumEditionXSongRecording.objects
+        .filter(music_album_edition=OuterRef('pk'))
+        .order_by()
+        .values('music_album_edition')
+    )
+    MusicAlbumEdition.objects.update(
+        duration=Subquery(
+            tracks
+            .annotate(total=Sum('song_recording__duration'))
+            .values('total')
+        ),
+        total_discs=Coalesce(
+            Subquery(
+                tracks.annotate(total=Max('disc_number')).values('total')
+            ),
+            1
+        ),
+        track_count=Coalesce(
+            Subquery(tracks.annotate(total=Count('pk')).values('total')),
+            0
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0031_delete_beerxuser'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='musicalbumedition',
+            name='duration',
+            field=models.DurationField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='musicalbumedition',
+            name='track_count',
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+        ),
+        migrations.AlterField(
+            model_name='musicalbumedition',
+            name='total_discs',
+            field=models.PositiveSmallIntegerField(default=1, editable=False),
+        ),
+        migrations.RunPython(update_statistics, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,134 @@
+# Generated by Django 5.0 on 2024-08-19 19:42
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.operations
+import django.contrib.postgres.search
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0032_musicalbumedition_duration_and_more'),
+    ]
+
+    operations = [
+        django.contrib.postgres.operations.TrigramExtension(),
+        migrations.AddField(
+            model_name='musicartist',
+            name='search_vector',
+            field=models.GeneratedField(db_persist=True, expression=django.contrib.postgres.search.SearchVector('name', 'disambiguator', config='simple'), output_field=django.contrib.postgres.search.SearchVectorField()),
+        ),
+        migrations.AddField(
+            model_name='musicalbum',
+            name='search_vector',
+            field=models.GeneratedField(db_persist=True, expression=django.contrib.postgres.search.SearchVector('title', 'disambiguator', config='simple'), output_field=django.contrib.postgres.search.SearchVectorField()),
+        ),
+        migrations.AddField(
+            model_name='song',
+            name='search_vector',
+            field=models.GeneratedField(db_persist=True, expression=django.contrib.postgres.search.SearchVector('title', config='simple'), output_field=django.contrib.postgres.search.SearchVectorField()),
+        ),
+        migrations.AddField(
+            model_name='songarrangement',
+            name='search_vector',
+            field=models.GeneratedField(db_persist=True, expression=django.contrib.postgres.search.SearchVector('title', 'description', config='simple'), output_field=django.contrib.postgres.search.SearchVectorField()),
+        ),
+        migrations.AddField(
+            model_name='person',
+            name='search_vector',
+            field=models.GeneratedField(db_persist=True, expression=django.contrib.postgres.search.SearchVector('preferred_name', 'first_name', 'middle_name', 'last_name', 'nickname', config='simple'), output_field=django.contrib.postgres.search.SearchVectorField()),
+        ),
+        migrations.AddField(
+            model_name='motionpicture',
+            name='search_vector',
+            field=models.GeneratedField(db_persist=True, expression=django.contrib.postgres.search.SearchVector('title', 'disambiguator', config='simple'), output_field=django.contrib.postgres.search.SearchVectorField()),
+        ),
+        migrations.AddField(
+            model_name='videogame',
+            name='search_vector',
+            field=models.GeneratedField(db_persist=True, expression=django.contrib.postgres.search.SearchVector('title', 'disambiguator', config='simple'), output_field=django.contrib.postgres.search.SearchVectorField()),
+        ),
+        migrations.AddField(
+            model_name='book',
+            name='search_vector',
+            field=models.GeneratedField(db_persist=True, expression=django.contrib.postgres.search.SearchVector('title', config='simple'), output_field=django.contrib.postgres.search.SearchVectorField()),
+        ),
+        migrations.AddField(
+            model_name='catalogitem',
+            name='search_vector',
+            field=models.GeneratedField(db_persist=True, expression=django.contrib.postgres.search.SearchVector('name', config='simple'), output_field=django.contrib.postgres.search.SearchVectorField()),
+        ),
+        migrations.AddIndex(
+            model_name='musicartist',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='music_artist_search'),
+        ),
+        migrations.AddIndex(
+            model_name='musicartist',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['name'], name='music_artist_name_trgm', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='musicalbum',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='music_album_search'),
+        ),
+        migrations.AddIndex(
+            model_name='musicalbum',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['title'], name='music_album_title_trgm', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='song',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='song_search'),
+        ),
+        migrations.AddIndex(
+            model_name='song',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['title'], name='song_title_trgm', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='songarrangement',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='song_arrangement_search'),
+        ),
+        migrations.AddIndex(
+            model_name='songarrangement',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['title'], name='song_arrangement_title_trgm', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='person',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='person_search'),
+        ),
+        migrations.AddIndex(
+            model_name='person',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['preferred_name'], name='person_preferred_name_trgm', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='motionpicture',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='motion_picture_search'),
+        ),
+        migrations.AddIndex(
+            model_name='motionpicture',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['title'], name='motion_picture_title_trgm', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='videogame',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='video_game_search'),
+        ),
+        migrations.AddIndex(
+            model_name='videogame',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['title'], name='video_game_title_trgm', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='book',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='book_search'),
+        ),
+        migrations.AddIndex(
+            model_name='book',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['title'], name='book_title_trgm', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='catalogitem',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='catalog_item_search'),
+        ),
+        migrations.AddIndex(
+            model_name='catalogitem',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['name'], name='catalog_item_name_trgm', opclasses=['gin_trgm_ops']),
+        ),
+    ]
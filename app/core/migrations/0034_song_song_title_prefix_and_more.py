@@ -0,0 +1,27 @@
+# Generated by Django 5.0 on 2024-08-21 20:17
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0033_musicartist_search_vector_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='song',
+            index=models.Index(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('title'), name='text_pattern_ops'), name='song_title_prefix'),
+        ),
+        migrations.AddIndex(
+            model_name='songarrangement',
+            index=models.Index(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('title'), name='text_pattern_ops'), name='song_arrangement_title_prefix'),
+        ),
+        migrations.AddIndex(
+            model_name='person',
+            index=models.Index(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('preferred_name'), name='text_pattern_ops'), name='person_preferred_name_prefix'),
+        ),
+    ]
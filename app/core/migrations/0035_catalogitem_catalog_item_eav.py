@@ -0,0 +1,18 @@
+# Generated by Django 5.0 on 2024-08-28 19:42
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0034_song_song_title_prefix_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='catalogitem',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['eav'], name='catalog_item_eav', opclasses=['jsonb_path_ops']),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.0 on 2024-09-02 18:25
+
+import core.models._expressions
+import django.contrib.postgres.fields.ranges
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0035_catalogitem_catalog_item_eav'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='musicartistactivity',
+            name='years',
+            field=models.GeneratedField(db_persist=True, expression=core.models._expressions.YearRange('year_active', 'year_inactive'), output_field=django.contrib.postgres.fields.ranges.IntegerRangeField()),
+        ),
+        migrations.AddField(
+            model_name='musicartistxpersonactivity',
+            name='years',
+            field=models.GeneratedField(db_persist=True, expression=core.models._expressions.YearRange('year_active', 'year_inactive'), output_field=django.contrib.postgres.fields.ranges.IntegerRangeField()),
+        ),
+        migrations.AddField(
+            model_name='personxpersonrelationshipactivity',
+            name='years',
+            field=models.GeneratedField(db_persist=True, expression=core.models._expressions.YearRange('from_year', 'until_year'), output_field=django.contrib.postgres.fields.ranges.IntegerRangeField()),
+        ),
+        migrations.AddIndex(
+            model_name='musicartistactivity',
+            index=django.contrib.postgres.indexes.GistIndex(fields=['years'], name='music_artist_activity_years'),
+        ),
+        migrations.AddIndex(
+            model_name='musicartistxpersonactivity',
+            index=django.contrib.postgres.indexes.GistIndex(fields=['years'], name='music_artist_member_years'),
+        ),
+        migrations.AddIndex(
+            model_name='personxpersonrelationshipactivity',
+            index=django.contrib.postgres.indexes.GistIndex(fields=['years'], name='person_relationship_years'),
+        ),
+    ]
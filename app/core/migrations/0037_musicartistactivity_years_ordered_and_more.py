@@ -0,0 +1,25 @@
+# Generated by Django 5.0 on 2024-09-09 19:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0036_musicartistactivity_years_and_more'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='musicartistactivity',
+            constraint=models.CheckConstraint(check=models.Q(('year_inactive__isnull', True), ('year_inactive__gte', models.F('year_active')), _connector='OR'), name='music_artist_activity_years_ordered'),
+        ),
+        migrations.AddConstraint(
+            model_name='musicartistxpersonactivity',
+            constraint=models.CheckConstraint(check=models.Q(('year_active__isnull', True), ('year_inactive__isnull', True), ('year_inactive__gte', models.F('year_active')), _connector='OR'), name='music_artist_x_person_activity_years_ordered'),
+        ),
+        migrations.AddConstraint(
+            model_name='personxpersonrelationshipactivity',
+            constraint=models.CheckConstraint(check=models.Q(('until_year__isnull', True), ('until_year__gte', models.F('from_year')), _connector='OR'), name='person_x_person_relationship_activity_years_ordered'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.0 on 2024-09-09 19:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0037_musicartistactivity_years_ordered_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='musicalbumedition',
+            index=models.Index(fields=['duration'], name='music_album_edition_duration'),
+        ),
+    ]
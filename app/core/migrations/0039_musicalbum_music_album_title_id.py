@@ -0,0 +1,17 @@
+# Generated by Django 5.0 on 2024-09-09 19:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0038_musicalbumedition_music_album_edition_duration'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='musicalbum',
+            index=models.Index(fields=['title', 'id'], name='music_album_title_id'),
+        ),
+    ]
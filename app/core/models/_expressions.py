@@ -0,0 +1,21 @@
+from django.contrib.postgres.fields import IntegerRangeField
+from django.db.models import Func, PositiveIntegerField, Subquery
+
+
+class SubqueryCount(Subquery):
+    """Counts the rows of a correlated subquery.
+
+    Unlike Count() over a join, each SubqueryCount is evaluated on its own, so
+    several of them on one queryset don't multiply rows together.
+    """
+
+    template = '(SELECT COUNT(*) FROM (%(subquery)s) _count)'
+    output_field = PositiveIntegerField()
+
+
+class YearRange(Func):
+    """Inclusive int4range between two year columns; NULL is unbounded."""
+
+    function = 'int4range'
+    template = "%(function)s(%(expressions)s, '[]')"
+    output_field = IntegerRangeField()
@@ -1,4 +1,51 @@
-from django.db.models import Case, F, Q, QuerySet, Sum, Value, When
+from django.db import connections
+from django.db.backends.postgresql.psycopg_any import NumericRange
+from django.db.models import (
+    BooleanField,
+    Case,
+    CharField,
+    Count,
+    DecimalField,
+    Exists,
+    F,
+    Max,
+    OuterRef,
+    Prefetch,
+    Q,
+    QuerySet,
+    Subquery,
+    Sum,
+    Value,
+    When,
+)
+from django.db.models.fields.json import KT
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from ._expressions import SubqueryCount
+
+# A year, or an inclusive (start, end) pair where None is open-ended
+AsOf = int | tuple[int | None, int | None]
+
+
+def year_range(as_of: AsOf) -> NumericRange:
+    if isinstance(as_of, int):
+        return NumericRange(as_of, as_of, '[]')
+    start, end = as_of
+    return NumericRange(start, end, '[]')
+
+
+def dated_during(activity: QuerySet, as_of: AsOf) -> Q:
+    """Rows with an activity overlapping `as_of`, or with no activity.
+
+    `activity` is correlated to the outer row; its `years` range column is
+    GiST indexed.
+    """
+
+    return (
+        Exists(activity.filter(years__overlap=year_range(as_of)))
+        | ~Exists(activity)
+    )
 
 
 class AccountQuerySet(QuerySet):
@@ -11,6 +58,85 @@ class AccountQuerySet(QuerySet):
         )
 
 
+class PointOfSaleQuerySet(QuerySet):
+    def with_totals(self) -> QuerySet:
+        """Annotates line item totals and how they compare to the txn.
+
+        line_item_count and priced_total cover all line items (only those
+        for catalog items carry a price); txn_ref_total and txn_total are the
+        linked Txn's reference total and sum of debits. txn_status is one of
+        PointOfSale.TxnStatus. Each total is its own correlated subquery, so
+        the whole list is one query.
+        """
+
+        from .catalog_item import CatalogItemXPointOfSaleLineItem
+        from .point_of_sale import PointOfSale, PointOfSaleLineItem
+        from .txn import TxnLineItem
+
+        priced = (
+            CatalogItemXPointOfSaleLineItem.objects
+            .filter(point_of_sale_line_item__point_of_sale=OuterRef('pk'))
+            .order_by()
+            .values('point_of_sale_line_item__point_of_sale')
+            .annotate(
+                total=Sum(
+                    F('quantity') * F('unit_price'),
+                    output_field=DecimalField()
+                )
+            )
+            .values('total')
+        )
+        debits = (
+            TxnLineItem.objects
+            .filter(txn=OuterRef('txn'), debit=True)
+            .order_by()
+            .values('txn')
+            .annotate(total=Sum('amount'))
+            .values('total')
+        )
+        status = PointOfSale.TxnStatus
+        return self.annotate(
+            line_item_count=SubqueryCount(
+                PointOfSaleLineItem.objects
+                .filter(point_of_sale=OuterRef('pk'))
+                .values('pk')
+            ),
+            priced_total=Coalesce(
+                Subquery(priced), Value(0), output_field=DecimalField()),
+            txn_ref_total=F('txn__ref_total'),
+            txn_total=Coalesce(
+                Subquery(debits), Value(0), output_field=DecimalField()),
+        ).annotate(
+            txn_status=Case(
+                When(txn__isnull=True, then=Value(status.UNLINKED)),
+                When(
+                    Q(txn_ref_total__isnull=False)
+                    & ~Q(txn_ref_total=F('priced_total')),
+                    then=Value(status.REF_TOTAL_MISMATCH)
+                ),
+                When(
+                    ~Q(txn_total=F('priced_total')),
+                    then=Value(status.TXN_TOTAL_MISMATCH)
+                ),
+                default=Value(status.MATCHED),
+                output_field=CharField(),
+            ),
+        )
+
+    def unreconciled(self) -> QuerySet:
+        """Linked points of sale whose totals disagree with their txn."""
+
+        from .point_of_sale import PointOfSale
+
+        return (
+            self.with_totals()
+            .exclude(txn_status__in=[
+                PointOfSale.TxnStatus.MATCHED,
+                PointOfSale.TxnStatus.UNLINKED,
+            ])
+        )
+
+
 class TxnQuerySet(QuerySet):
     def with_debits(self) -> QuerySet:
         return self.annotate(
@@ -29,3 +155,267 @@ class TxnQuerySet(QuerySet):
                 default=Value(False)
             )
         )
+
+
+class CatalogItemQuerySet(QuerySet):
+    """Filters over the free-form `eav` attributes.
+
+    Containment (`with_attributes`) is served by the jsonb_path_ops GIN index
+    on eav. `where_attribute` compares the text value of one key, which can
+    use an expression index from eav_key_index() when one exists for the key.
+    """
+
+    def with_attributes(self, **attributes) -> QuerySet:
+        """Items whose attributes include all the given key/value pairs."""
+
+        return self.filter(eav__contains=attributes)
+
+    def with_any_attribute_value(self, key: str, values) -> QuerySet:
+        """Items where `key` has one of `values`; one containment per value.
+        """
+
+        q = Q()
+        for value in values:
+            q |= Q(eav__contains={key: value})
+        return self.filter(q) if q else self.none()
+
+    def where_attribute(
+            self, key: str, value, lookup: str = 'exact') -> QuerySet:
+        """Compares the text value of `key`, e.g. lookup='in' or 'gte'."""
+
+        return (
+            self
+            .alias(eav_value=KT(f'eav__{key}'))
+            .filter(**{f'eav_value__{lookup}': value})
+        )
+
+    def attribute_facets(
+            self, keys: list[str] | None = None) -> dict[str, dict[str, int]]:
+        """Counts of each value of each attribute across this queryset.
+
+        Returns {key: {value: count}}, values in descending count order.
+        """
+
+        opts = self.model._meta
+        sql, params = self.order_by().values('pk').query.sql_with_params()
+        query = f"""
+            SELECT attribute.key, attribute.value, COUNT(*)
+            FROM {opts.db_table} item
+            CROSS JOIN LATERAL jsonb_each_text(
+                CASE WHEN jsonb_typeof(item.eav) = 'object' THEN item.eav END
+            ) attribute
+            WHERE item.{opts.pk.column} IN ({sql})
+        """
+        if keys:
+            query += ' AND attribute.key = ANY(%s)'
+            params = (*params, list(keys))
+        query += ' GROUP BY 1, 2 ORDER BY 1, 3 DESC, 2'
+        facets = {}
+        with connections[self.db].cursor() as cursor:
+            cursor.execute(query, params)
+            for key, value, count in cursor.fetchall():
+                facets.setdefault(key, {})[value] = count
+        return facets
+
+
+class MusicAlbumEditionQuerySet(QuerySet):
+    def update_statistics(self) -> int:
+        """Recomputes duration, track count and disc count from the tracks."""
+
+        from .music_album import MusicAlbumEditionXSongRecording
+
+        tracks = (
+            MusicAlbumEditionXSongRecording.objects
+            .filter(music_album_edition=OuterRef('pk'))
+            .order_by()
+            .values('music_album_edition')
+        )
+        return self.update(
+            duration=Subquery(
+                tracks
+                .annotate(total=Sum('song_recording__duration'))
+                .values('total')
+            ),
+            total_discs=Coalesce(
+                Subquery(
+                    tracks
+                    .annotate(total=Max('disc_number'))
+                    .values('total')
+                ),
+                1
+            ),
+            track_count=Coalesce(
+                Subquery(
+                    tracks
+                    .annotate(total=Count('pk'))
+                    .values('total')
+                ),
+                0
+            ),
+        )
+
+
+class MusicArtistQuerySet(QuerySet):
+    def with_is_active(self) -> QuerySet:
+        """Annotates is_active, following the rules of MusicArtist.is_active.
+
+        An artist without any activity records is considered active.
+        """
+
+        from .music_artist import MusicArtistActivity
+
+        activity = MusicArtistActivity.objects.filter(
+            music_artist=OuterRef('pk'))
+        return self.annotate(
+            is_active=Case(
+                When(
+                    Exists(activity.filter(year_inactive__isnull=True)),
+                    then=Value(True)
+                ),
+                When(Exists(activity), then=Value(False)),
+                default=Value(True),
+                output_field=BooleanField(),
+            )
+        )
+
+    def active_during(self, as_of: AsOf) -> QuerySet:
+        """Artists active in a year or range; undated artists included."""
+
+        from .music_artist import MusicArtistActivity
+
+        return self.filter(dated_during(
+            MusicArtistActivity.objects.filter(music_artist=OuterRef('pk')),
+            as_of
+        ))
+
+    def with_active_members(self) -> QuerySet:
+        """Prefetches memberships that aren't known to be inactive.
+
+        Stored as `active_members`, with each membership's person selected.
+        """
+
+        from .music_artist import MusicArtistXPerson
+
+        return self.prefetch_related(
+            Prefetch(
+                'music_artist_x_person_set',
+                queryset=(
+                    MusicArtistXPerson.objects
+                    .with_is_active()
+                    .exclude(is_active=False)
+                    .select_related('person')
+                    .order_by('person__preferred_name')
+                ),
+                to_attr='active_members',
+            )
+        )
+
+    def with_counts(self) -> QuerySet:
+        """Annotates album_count, arrangement_count and personnel_count.
+
+        Each count is a separate correlated subquery over its junction table,
+        rather than joins that fan out against each other.
+        """
+
+        from .music_album import MusicAlbumXMusicArtist
+        from .music_artist import (
+            MusicArtistXPerson,
+            MusicArtistXSongArrangement,
+        )
+
+        def count(model):
+            return SubqueryCount(
+                model.objects.filter(music_artist=OuterRef('pk')).values('pk')
+            )
+
+        return self.annotate(
+            album_count=count(MusicAlbumXMusicArtist),
+            arrangement_count=count(MusicArtistXSongArrangement),
+            personnel_count=count(MusicArtistXPerson),
+        )
+
+
+class MusicArtistXPersonQuerySet(QuerySet):
+    def active_during(self, as_of: AsOf) -> QuerySet:
+        """Memberships active in a year or range, in a band active then.
+
+        Memberships or artists without any activity records are included.
+        """
+
+        from .music_artist import (
+            MusicArtistActivity, MusicArtistXPersonActivity
+        )
+
+        return self.filter(
+            dated_during(
+                MusicArtistXPersonActivity.objects.filter(
+                    music_artist_x_person=OuterRef('pk')),
+                as_of
+            ),
+            dated_during(
+                MusicArtistActivity.objects.filter(
+                    music_artist=OuterRef('music_artist_id')),
+                as_of
+            ),
+        )
+
+    def with_is_active(self) -> QuerySet:
+        """Annotates is_active, following the rules of
+        MusicArtistXPerson.is_active.
+        """
+
+        from .music_artist import (
+            MusicArtistActivity, MusicArtistXPersonActivity
+        )
+
+        music_artist_activity = MusicArtistActivity.objects.filter(
+            music_artist=OuterRef('music_artist_id'))
+        activity = MusicArtistXPersonActivity.objects.filter(
+            music_artist_x_person=OuterRef('pk'))
+        latest_activity = activity.order_by(
+            F('year_active').desc(nulls_last=True))
+        return (
+            self
+            .alias(
+                latest_year_inactive=Subquery(
+                    latest_activity.values('year_inactive')[:1]
+                )
+            )
+            .annotate(
+                is_active=Case(
+                    When(
+                        person__date_of_death__isnull=False,
+                        then=Value(False)
+                    ),
+                    When(
+                        Exists(music_artist_activity)
+                        & ~Exists(
+                            music_artist_activity
+                            .filter(year_inactive__isnull=True)
+                        ),
+                        then=Value(False)
+                    ),
+                    When(~Exists(activity), then=Value(None)),
+                    When(latest_year_inactive__isnull=True, then=Value(True)),
+                    When(
+                        latest_year_inactive__lte=timezone.now().year,
+                        then=Value(False)
+                    ),
+                    default=Value(None),
+                    output_field=BooleanField(null=True),
+                )
+            )
+        )
+
+
+class PersonXPersonRelationshipQuerySet(QuerySet):
+    def active_during(self, as_of: AsOf) -> QuerySet:
+        """Relationships active in a year or range; undated ones included."""
+
+        from .person import PersonXPersonRelationshipActivity
+
+        return self.filter(dated_during(
+            PersonXPersonRelationshipActivity.objects.filter(
+                person_x_person_relationship=OuterRef('pk')),
+            as_of
+        ))
@@ -67,6 +67,46 @@ def resize_image(image_field: ImageFieldFile, sizes: Iterable) -> dict:
     return data
 
 
+def resize_image_data(
+        content: bytes,
+        file_name: str,
+        sizes: Iterable[tuple[str, tuple[int, int]]],
+) -> dict[str, tuple[str, bytes]]:
+    """Same as resize_image, but works on raw bytes instead of a field file.
+
+    Sizes are (name, dimensions) pairs rather than enum members, so that
+    everything passed in and returned can be pickled for a worker process.
+    """
+
+    data = {}
+    ext = os.path.splitext(file_name)[1][1:].lower()
+    if ext == 'jpg':
+        ext = 'jpeg'
+    with Image.open(BytesIO(content)) as image:
+        for size_name, dimensions in sizes:
+            width, height = dimensions
+            resized = content
+            if image.width > width or image.height > height:
+                new_image = BytesIO()
+                t = ImageOps.contain(image, dimensions)
+                t.save(new_image, ext)
+                resized = new_image.getvalue()
+            field_name = f'image_{size_name}'
+            data[field_name] = (
+                resized_image_name(file_name, size_name), resized)
+    return data
+
+
+def resized_image_name(file_name: str, size_name: str) -> str:
+    """Storage name of a resized image, as written by resize_image."""
+
+    name, ext = os.path.splitext(file_name)
+    ext = ext[1:].lower()
+    if ext == 'jpg':
+        ext = 'jpeg'
+    return f'{name}--{size_name}.{ext}'
+
+
 def traverse_depth(
         data_list: list[dict],
         key: str,
@@ -1,5 +1,7 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db.models import (
-    CharField, ForeignKey, PositiveSmallIntegerField,
+    CharField, ForeignKey, GeneratedField, PositiveSmallIntegerField,
     UniqueConstraint,
     CASCADE, PROTECT, SET_NULL,
 )
@@ -19,6 +21,20 @@ class Book(BaseAuditable):
     )
     # publisher
     # authors
+    search_vector = GeneratedField(
+        expression=SearchVector('title', config='simple'),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
+    class Meta:
+        indexes = [
+            GinIndex(fields=['search_vector'], name='book_search'),
+            GinIndex(
+                fields=['title'], name='book_title_trgm',
+                opclasses=['gin_trgm_ops'],
+            ),
+        ]
 
     def __str__(self) -> str:
         return f'{self.title}'
@@ -1,11 +1,15 @@
 from decimal import Decimal
 
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.core.validators import MinLengthValidator
 from django.db.models import (
     CASCADE,
     CharField,
     DecimalField,
     ForeignKey,
+    GeneratedField,
+    Index,
     IntegerField,
     JSONField,
     OneToOneField,
@@ -14,6 +18,7 @@ from django.db.models import (
     UniqueConstraint,
     TextChoices,
 )
+from django.db.models.fields.json import KT
 
 from django_base.models import BaseAuditable
 from django_base.models.fields import UpperCharField
@@ -21,9 +26,20 @@ from django_base.utils import default_related_names, pascal_case_to_snake_case
 from django_base.validators import validate_alphanumeric, validate_digit
 
 from core.validators import validate_isbn, validate_isbn_13_check_digit
+from . import _querysets
 from ._fields import CurrencyField
 
 
+def eav_key_index(key: str) -> Index:
+    """Expression index on the text value of one eav key.
+
+    Serves CatalogItem.objects.where_attribute(key, ...). Add one to
+    CatalogItem.Meta.indexes for keys that are filtered on often.
+    """
+
+    return Index(KT(f'eav__{key}'), name=f'catalog_item_eav_{key}'[:30])
+
+
 class CatalogItem(BaseAuditable):
     """An item with unique registries in other global systems.
 
@@ -88,8 +104,26 @@ class CatalogItem(BaseAuditable):
         max_length=12, unique=True, null=True, blank=True,
         validators=[MinLengthValidator(12), validate_digit]
     )
+    search_vector = GeneratedField(
+        expression=SearchVector('name', config='simple'),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
+    objects = _querysets.CatalogItemQuerySet.as_manager()
 
     class Meta:
+        indexes = [
+            GinIndex(
+                fields=['eav'], name='catalog_item_eav',
+                opclasses=['jsonb_path_ops'],
+            ),
+            GinIndex(fields=['search_vector'], name='catalog_item_search'),
+            GinIndex(
+                fields=['name'], name='catalog_item_name_trgm',
+                opclasses=['gin_trgm_ops'],
+            ),
+        ]
         verbose_name = 'CatalogItem'
         verbose_name_plural = verbose_name
 
@@ -2,12 +2,14 @@ from django.db.models import Manager, Prefetch
 
 
 class MusicArtistManager(Manager):
+    """Single artist pages; activity history is prefetched."""
+
     def get_queryset(self):
         from ..music_artist import MusicArtistActivity
-        from ..person import Person
 
         return (
             super().get_queryset()
+            .with_is_active()
             .prefetch_related(
                 Prefetch(
                     'music_artist_activity_set',
@@ -16,26 +18,21 @@ class MusicArtistManager(Manager):
                         .order_by('-year_inactive', '-year_active')
                     )
                 ),
-                Prefetch(
-                    'personnel',
-                    queryset=(
-                        Person.objects
-                        .prefetch_related(
-                            'music_artist_x_person_set'
-                            '__music_artist_x_person_activity_set'
-                        )
-                        .filter(
-                            music_artist_x_person__music_artist_x_person_activity__year_inactive__isnull=True,
-                        )
-                        .distinct()
-                        .order_by('preferred_name',)
-                    ),
-                    to_attr='active_members',
-                )
             )
         )
 
 
+class MusicArtistListManager(Manager):
+    """List pages; only the status and current members are fetched."""
+
+    def get_queryset(self):
+        return (
+            super().get_queryset()
+            .with_is_active()
+            .with_active_members()
+        )
+
+
 class MusicArtistXPersonManager(Manager):
     def get_queryset(self):
         from ..music_artist import (
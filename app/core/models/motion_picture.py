@@ -1,7 +1,10 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db.models import (
     CASCADE,
     CharField,
     ForeignKey,
+    GeneratedField,
     ManyToManyField,
     PositiveSmallIntegerField,
     PROTECT,
@@ -37,8 +40,20 @@ class MotionPicture(BaseAuditable):
         'Song', through='MotionPictureXSong',
         related_name='+', blank=True,
     )
+    search_vector = GeneratedField(
+        expression=SearchVector('title', 'disambiguator', config='simple'),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
 
     class Meta:
+        indexes = [
+            GinIndex(fields=['search_vector'], name='motion_picture_search'),
+            GinIndex(
+                fields=['title'], name='motion_picture_title_trgm',
+                opclasses=['gin_trgm_ops'],
+            ),
+        ]
         constraints = [
             UniqueConstraint(
                 fields=('title', 'disambiguator'),
@@ -1,12 +1,17 @@
 import enum
 import hashlib
 
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db.models import (
     BooleanField,
     CASCADE,
     CharField,
+    DurationField,
     ForeignKey,
+    GeneratedField,
     ImageField,
+    Index,
     Manager,
     ManyToManyField,
     PositiveSmallIntegerField,
@@ -23,6 +28,7 @@ from django_base.models import BaseAuditable
 from django_base.utils import default_related_names
 from django_base.validators import validate_year_not_future
 
+from . import _querysets
 from ._utils import resize_image
 
 
@@ -57,8 +63,22 @@ class MusicAlbum(BaseAuditable):
         related_name='+',
         blank=True
     )
+    search_vector = GeneratedField(
+        expression=SearchVector('title', 'disambiguator', config='simple'),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
 
     class Meta:
+        indexes = [
+            GinIndex(fields=['search_vector'], name='music_album_search'),
+            GinIndex(
+                fields=['title'], name='music_album_title_trgm',
+                opclasses=['gin_trgm_ops'],
+            ),
+            # Keyset pagination of the register
+            Index(fields=['title', 'id'], name='music_album_title_id'),
+        ]
         constraints = [
             UniqueConstraint(
                 fields=('title', 'disambiguator'),
@@ -144,8 +164,6 @@ class MusicAlbumEdition(BaseAuditable):
         **default_related_names(__qualname__)
     )
     name = CharField(max_length=63)
-    # TODO 2023-12-12: likely a property
-    total_discs = PositiveSmallIntegerField(default=1)
     year_copyright = PositiveSmallIntegerField(
         null=True, blank=True, validators=[validate_year_not_future]
     )
@@ -153,11 +171,23 @@ class MusicAlbumEdition(BaseAuditable):
         null=True, blank=True, validators=[validate_year_not_future]
     )
 
+    # Programmatic fields; maintained from tracks by signals
+    duration = DurationField(null=True, blank=True, editable=False)
+    total_discs = PositiveSmallIntegerField(default=1, editable=False)
+    track_count = PositiveSmallIntegerField(default=0, editable=False)
+
     song_recordings = ManyToManyField(
         'SongRecording', through='MusicAlbumEditionXSongRecording',
         related_name='+', blank=True,
     )
 
+    objects = _querysets.MusicAlbumEditionQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            Index(fields=['duration'], name='music_album_edition_duration'),
+        ]
+
     def __str__(self) -> str:
         return self.name
 
@@ -1,5 +1,9 @@
+from django.contrib.postgres.fields import IntegerRangeField
+from django.contrib.postgres.indexes import GinIndex, GistIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db.models import (
-    CharField, ForeignKey, PositiveSmallIntegerField, TextField, URLField,
+    CharField, CheckConstraint, F, ForeignKey, GeneratedField,
+    PositiveSmallIntegerField, Q, TextField, URLField,
     CASCADE,
     TextChoices,
     Manager,
@@ -15,7 +19,8 @@ from django_base.validators import (
     validate_year_not_future
 )
 
-from . import managers
+from . import _querysets, managers
+from ._expressions import YearRange
 
 
 class MusicArtist(BaseAuditable):
@@ -55,11 +60,26 @@ class MusicArtist(BaseAuditable):
         'MusicTag', through='MusicArtistXMusicTag',
         related_name='+', blank=True,
     )
+    search_vector = GeneratedField(
+        expression=SearchVector('name', 'disambiguator', config='simple'),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
 
-    objects = Manager()
-    with_related = managers.music_artist.MusicArtistManager()
+    objects = _querysets.MusicArtistQuerySet.as_manager()
+    with_related = managers.music_artist.MusicArtistManager.from_queryset(
+        _querysets.MusicArtistQuerySet)()
+    for_list = managers.music_artist.MusicArtistListManager.from_queryset(
+        _querysets.MusicArtistQuerySet)()
 
     class Meta:
+        indexes = [
+            GinIndex(fields=['search_vector'], name='music_artist_search'),
+            GinIndex(
+                fields=['name'], name='music_artist_name_trgm',
+                opclasses=['gin_trgm_ops'],
+            ),
+        ]
         constraints = [
             UniqueConstraint(
                 fields=('name', 'disambiguator'),
@@ -75,13 +95,12 @@ class MusicArtist(BaseAuditable):
 
     @cached_property
     def is_active(self) -> bool:
+        """Without activity records, or with any still open; the same rules
+        as MusicArtistQuerySet.with_is_active().
+        """
+
         activity = self.music_artist_activity_set.all()
-        if not activity:
-            return True
-        if activity[0].year_inactive:
-            return False
-        else:
-            return True
+        return not activity or any(x.year_inactive is None for x in activity)
 
     @cached_property
     def total_albums(self) -> int:
@@ -108,12 +127,28 @@ class MusicArtistActivity(BaseAuditable):
         null=True, blank=True,
         validators=[validate_year_not_future]
     )
+    years = GeneratedField(
+        expression=YearRange('year_active', 'year_inactive'),
+        output_field=IntegerRangeField(),
+        db_persist=True,
+    )
 
     class Meta:
+        indexes = [
+            GistIndex(fields=['years'], name='music_artist_activity_years'),
+        ]
         constraints = [
             UniqueConstraint(
                 fields=('music_artist', 'year_active'),
-                name='unique_music_artist_activity')
+                name='unique_music_artist_activity'),
+            # int4range() fails on a lower bound above the upper one
+            CheckConstraint(
+                check=(
+                    Q(year_inactive__isnull=True)
+                    | Q(year_inactive__gte=F('year_active'))
+                ),
+                name='music_artist_activity_years_ordered'
+            ),
         ]
 
     def __str__(self) -> str:
@@ -170,8 +205,11 @@ class MusicArtistXPerson(BaseAuditable):
     )
     notes = TextField(blank=True)
 
-    objects = Manager()
-    with_related = managers.music_artist.MusicArtistXPersonManager()
+    objects = _querysets.MusicArtistXPersonQuerySet.as_manager()
+    with_related = (
+        managers.music_artist.MusicArtistXPersonManager
+        .from_queryset(_querysets.MusicArtistXPersonQuerySet)()
+    )
 
     class Meta:
         constraints = [
@@ -189,13 +227,18 @@ class MusicArtistXPerson(BaseAuditable):
             f' {self.music_artist_id}-{self.person_id}'
         )
 
-    @property
+    @cached_property
     def is_active(self) -> bool | None:
         if not self.person.is_living:
             return False
         if not self.music_artist.is_active:
             return False
-        activity = self.music_artist_x_person_activity_set.first()
+        # Works from the prefetch cache when there is one
+        activity = max(
+            self.music_artist_x_person_activity_set.all(),
+            key=lambda x: x.year_active or 0,
+            default=None,
+        )
         if activity is None:
             return None
         if activity.year_inactive is None:
@@ -230,13 +273,29 @@ class MusicArtistXPersonActivity(BaseAuditable):
     )
     year_active = PositiveSmallIntegerField(null=True, blank=True)
     year_inactive = PositiveSmallIntegerField(null=True, blank=True)
+    years = GeneratedField(
+        expression=YearRange('year_active', 'year_inactive'),
+        output_field=IntegerRangeField(),
+        db_persist=True,
+    )
 
     class Meta:
+        indexes = [
+            GistIndex(fields=['years'], name='music_artist_member_years'),
+        ]
         constraints = [
             UniqueConstraint(
                 fields=('music_artist_x_person', 'year_active'),
                 name='unique_music_artist_x_person_activity_year_active'
-            )
+            ),
+            CheckConstraint(
+                check=(
+                    Q(year_active__isnull=True)
+                    | Q(year_inactive__isnull=True)
+                    | Q(year_inactive__gte=F('year_active'))
+                ),
+                name='music_artist_x_person_activity_years_ordered'
+            ),
         ]
         verbose_name = 'MusicArtist <-> Person Activity'
         verbose_name_plural = verbose_name
@@ -1,5 +1,8 @@
 import datetime
 
+from django.contrib.postgres.fields import IntegerRangeField
+from django.contrib.postgres.indexes import GinIndex, GistIndex, OpClass
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db.models import (
     CASCADE,
     CharField,
@@ -7,6 +10,8 @@ from django.db.models import (
     DateField,
     F,
     ForeignKey,
+    GeneratedField,
+    Index,
     ManyToManyField,
     PositiveSmallIntegerField,
     PROTECT,
@@ -16,11 +21,15 @@ from django.db.models import (
     TextField,
     UniqueConstraint,
 )
+from django.db.models.functions import Upper
 
 from django_base.models import BaseAuditable
 from django_base.utils import default_related_names
 from django_base.validators import validate_date_not_future
 
+from . import _querysets
+from ._expressions import YearRange
+
 
 class Person(BaseAuditable):
     """A person. Generally self-explanatory as an entity.
@@ -81,6 +90,31 @@ class Person(BaseAuditable):
         'SongPerformance', through='PersonXSongPerformance',
         related_name='+', blank=True
     )
+    search_vector = GeneratedField(
+        expression=SearchVector(
+            'preferred_name',
+            'first_name',
+            'middle_name',
+            'last_name',
+            'nickname',
+            config='simple',
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
+    class Meta:
+        indexes = [
+            GinIndex(fields=['search_vector'], name='person_search'),
+            GinIndex(
+                fields=['preferred_name'], name='person_preferred_name_trgm',
+                opclasses=['gin_trgm_ops'],
+            ),
+            Index(
+                OpClass(Upper('preferred_name'), name='text_pattern_ops'),
+                name='person_preferred_name_prefix',
+            ),
+        ]
 
     def __str__(self) -> str:
         return f'{self.preferred_name}'
@@ -161,6 +195,12 @@ class PersonXPersonRelation(BaseAuditable):
         PARENT = 'PARENT'
         SIBLING = 'SIBLING'
 
+        @classmethod
+        def get_sibling_members(cls):
+            return (
+                cls.SIBLING,
+            )
+
     person_a = ForeignKey(
         Person, on_delete=CASCADE,
         related_name='+'
@@ -225,6 +265,8 @@ class PersonXPersonRelationship(BaseAuditable):
         )
     )
 
+    objects = _querysets.PersonXPersonRelationshipQuerySet.as_manager()
+
     class Meta:
         constraints = [
             UniqueConstraint(
@@ -245,6 +287,25 @@ class PersonXPersonRelationshipActivity(BaseAuditable):
     )
     from_year = PositiveSmallIntegerField()
     until_year = PositiveSmallIntegerField(null=True, blank=True)
+    years = GeneratedField(
+        expression=YearRange('from_year', 'until_year'),
+        output_field=IntegerRangeField(),
+        db_persist=True,
+    )
+
+    class Meta:
+        indexes = [
+            GistIndex(fields=['years'], name='person_relationship_years'),
+        ]
+        constraints = [
+            CheckConstraint(
+                check=(
+                    Q(until_year__isnull=True)
+                    | Q(until_year__gte=F('from_year'))
+                ),
+                name='person_x_person_relationship_activity_years_ordered'
+            ),
+        ]
 
 
 class PersonXPhoto(BaseAuditable):
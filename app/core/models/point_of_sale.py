@@ -1,8 +1,8 @@
 from decimal import Decimal
 
 from django.db.models import (
-    CharField, DateField, FileField, ForeignKey, OneToOneField, TimeField,
-    TextChoices,
+    CharField, DateField, DecimalField, FileField, ForeignKey, OneToOneField,
+    TimeField, TextChoices,
     PROTECT, SET_NULL,
     F, Sum,
 )
@@ -10,6 +10,8 @@ from django.db.models import (
 from django_base.models import BaseAuditable
 from django_base.utils import default_related_names, pascal_case_to_snake_case
 
+from . import _querysets
+
 
 class PointOfSale(BaseAuditable):
     """A PointOfSale transaction, usually accompanied by a physical receipt.
@@ -18,6 +20,12 @@ class PointOfSale(BaseAuditable):
     the time of the transaction.
     """
 
+    class TxnStatus(TextChoices):
+        MATCHED = 'MATCHED', 'Matched'
+        REF_TOTAL_MISMATCH = 'REF_TOTAL_MISMATCH', 'Reference total differs'
+        TXN_TOTAL_MISMATCH = 'TXN_TOTAL_MISMATCH', 'Txn line items differ'
+        UNLINKED = 'UNLINKED', 'No txn'
+
     party_id: int
 
     barcode = CharField(max_length=255, null=True, blank=True)
@@ -33,18 +41,30 @@ class PointOfSale(BaseAuditable):
         related_name=pascal_case_to_snake_case(__qualname__)
     )
 
+    objects = _querysets.PointOfSaleQuerySet.as_manager()
+
     @property
     def line_item_total(self) -> Decimal:
+        """Sum of the priced line items, 0 without any.
+
+        Read from the priced_total annotation of
+        PointOfSale.objects.with_totals() when present; use that when
+        listing many.
+        """
+
+        if hasattr(self, 'priced_total'):
+            return self.priced_total
         qs = (
             self.line_items.all()
             .aggregate(
                 total=Sum(
-                    F('catalog_item_to_point_of_sale_line_item__quantity') *
-                    F('catalog_item_to_point_of_sale_line_item__unit_price')
+                    F('catalog_item_x_point_of_sale_line_item__quantity') *
+                    F('catalog_item_x_point_of_sale_line_item__unit_price'),
+                    output_field=DecimalField()
                 )
             )
         )
-        return qs['total']
+        return qs['total'] or Decimal(0)
 
 
 class PointOfSaleDocument(BaseAuditable):
@@ -1,10 +1,14 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db.models import (
     BooleanField, CharField, CheckConstraint, DurationField, ForeignKey,
+    GeneratedField, Index,
     ManyToManyField, TextField, UniqueConstraint, Q,
     TextChoices,
     CASCADE, PROTECT, SET_NULL,
     Manager,
 )
+from django.db.models.functions import Upper
 
 from django_base.models import BaseAuditable
 from django_base.utils import default_related_names
@@ -60,8 +64,24 @@ class Song(BaseAuditable):
         'Person', through='PersonXSong',
         related_name='+', blank=True,
     )
+    search_vector = GeneratedField(
+        expression=SearchVector('title', config='simple'),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
 
     class Meta:
+        indexes = [
+            GinIndex(fields=['search_vector'], name='song_search'),
+            GinIndex(
+                fields=['title'], name='song_title_trgm',
+                opclasses=['gin_trgm_ops'],
+            ),
+            Index(
+                OpClass(Upper('title'), name='text_pattern_ops'),
+                name='song_title_prefix',
+            ),
+        ]
         constraints = [
             UniqueConstraint(
                 fields=('title', 'disambiguator'),
@@ -98,11 +118,27 @@ class SongArrangement(BaseAuditable):
         Song, through='SongXSongArrangement',
         related_name='+', blank=True,
     )
+    search_vector = GeneratedField(
+        expression=SearchVector('title', 'description', config='simple'),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
 
     objects = Manager()
     originals = managers.song.SongArrangementOriginalsManager()
 
     class Meta:
+        indexes = [
+            GinIndex(fields=['search_vector'], name='song_arrangement_search'),
+            GinIndex(
+                fields=['title'], name='song_arrangement_title_trgm',
+                opclasses=['gin_trgm_ops'],
+            ),
+            Index(
+                OpClass(Upper('title'), name='text_pattern_ops'),
+                name='song_arrangement_title_prefix',
+            ),
+        ]
         constraints = [
             UniqueConstraint(
                 fields=('title', 'disambiguator', 'description'),
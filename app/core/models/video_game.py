@@ -1,5 +1,7 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db.models import (
-    CharField, DateField, ForeignKey,
+    CharField, DateField, ForeignKey, GeneratedField,
     CASCADE, PROTECT, SET_NULL, UniqueConstraint, ManyToManyField, PositiveSmallIntegerField, TextField,
 )
 
@@ -62,8 +64,20 @@ class VideoGame(BaseAuditable):
         'Person', through='PersonXVideoGame',
         related_name='+', blank=True,
     )
+    search_vector = GeneratedField(
+        expression=SearchVector('title', 'disambiguator', config='simple'),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
 
     class Meta:
+        indexes = [
+            GinIndex(fields=['search_vector'], name='video_game_search'),
+            GinIndex(
+                fields=['title'], name='video_game_title_trgm',
+                opclasses=['gin_trgm_ops'],
+            ),
+        ]
         constraints = [
             UniqueConstraint(
                 fields=('title', 'disambiguator'),
@@ -0,0 +1,198 @@
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.functions import Now
+from django.db.models.signals import (
+    m2m_changed, post_delete, post_save, pre_save,
+)
+from django.dispatch import receiver
+
+from .context_processors import clear_config_cache
+from .views.main import MUSIC_ALBUM_INITIALS_KEY
+from .models import (
+    Account,
+    Config,
+    MotionPicture,
+    MotionPictureXPerson,
+    MusicAlbum,
+    MusicAlbumArtwork,
+    MusicAlbumEdition,
+    MusicAlbumEditionXSongRecording,
+    MusicAlbumXMusicArtist,
+    MusicAlbumXPerson,
+    MusicArtist,
+    MusicArtistActivity,
+    MusicArtistXPerson,
+    MusicArtistXPersonActivity,
+    MusicalInstrument,
+    MusicalInstrumentXPerson,
+    Payee,
+    Person,
+    PersonXPhoto,
+    PersonXSong,
+    PersonXSongArrangement,
+    PersonXSongPerformance,
+    PersonXVideoGame,
+    Photo,
+    Song,
+    SongArrangement,
+    SongPerformance,
+    SongRecording,
+    Txn,
+    TxnLineItem,
+    VideoGame,
+)
+
+# Cached template fragments are keyed on the pk and timestamp_modified of the
+# object they display. Writes to anything else shown in the fragment bump
+# that timestamp, so the next render misses the cache.
+
+# (sender, model to touch, attribute of the sender holding its pk); on save
+# and delete
+TOUCH_PARENT = [
+    (MotionPictureXPerson, Person, 'person_id'),
+    (MusicAlbumArtwork, MusicAlbum, 'music_album_id'),
+    (MusicAlbumEdition, MusicAlbum, 'music_album_id'),
+    (MusicAlbumXMusicArtist, MusicAlbum, 'music_album_id'),
+    (MusicAlbumXMusicArtist, MusicArtist, 'music_artist_id'),
+    (MusicAlbumXPerson, Person, 'person_id'),
+    (MusicArtistActivity, MusicArtist, 'music_artist_id'),
+    (MusicArtistXPerson, MusicArtist, 'music_artist_id'),
+    (MusicArtistXPerson, Person, 'person_id'),
+    (MusicalInstrumentXPerson, Person, 'person_id'),
+    (PersonXPhoto, Person, 'person_id'),
+    (PersonXSong, Person, 'person_id'),
+    (PersonXSongArrangement, Person, 'person_id'),
+    (PersonXSongPerformance, Person, 'person_id'),
+    (PersonXVideoGame, Person, 'person_id'),
+    (TxnLineItem, Txn, 'txn_id'),
+]
+
+# (sender, model to touch, lookup from that model to the sender); on save
+# only, since deletes cascade through the junctions above
+TOUCH_RELATED = [
+    (Account, Txn, 'line_items__account'),
+    (MotionPicture, Person, 'motion_picture_x_person__motion_picture'),
+    (MusicAlbum, MusicArtist, 'music_albums'),
+    (MusicAlbum, Person, 'music_albums'),
+    (MusicArtist, MusicAlbum, 'music_artists'),
+    (MusicArtist, Person, 'music_artists'),
+    (MusicalInstrument, Person, 'musical_instruments'),
+    (Payee, Txn, 'payee'),
+    (Person, MusicArtist, 'personnel'),
+    (Photo, Person, 'featured_photo__photo'),
+    (Photo, Person, 'person_x_photo__photo'),
+    (Song, Person, 'person_x_song__song'),
+    (SongArrangement, MusicAlbumEdition,
+     'song_recordings__song_performance__song_arrangement'),
+    (SongArrangement, Person, 'song_performances__song_arrangement'),
+    (SongArrangement, Person,
+     'person_x_song_arrangement__song_arrangement'),
+    (SongPerformance, MusicAlbumEdition, 'song_recordings__song_performance'),
+    (SongPerformance, Person, 'song_performances'),
+    (SongRecording, MusicAlbumEdition, 'song_recordings'),
+    (VideoGame, Person, 'person_x_video_game__video_game'),
+]
+
+
+def touch(model, **filters) -> None:
+    model.objects.filter(**filters).update(timestamp_modified=Now())
+
+
+def touch_parent(model, attname: str):
+    def handler(sender, instance, raw=False, **kwargs) -> None:
+        pk = getattr(instance, attname)
+        if not raw and pk is not None:
+            touch(model, pk=pk)
+    return handler
+
+
+def touch_related(model, lookup: str):
+    def handler(sender, instance, raw=False, **kwargs) -> None:
+        if not raw:
+            touch(model, **{lookup: instance})
+    return handler
+
+
+for _sender, _model, _attname in TOUCH_PARENT:
+    _handler = touch_parent(_model, _attname)
+    post_save.connect(_handler, sender=_sender, weak=False)
+    post_delete.connect(_handler, sender=_sender, weak=False)
+
+for _sender, _model, _lookup in TOUCH_RELATED:
+    post_save.connect(
+        touch_related(_model, _lookup), sender=_sender, weak=False)
+
+
+@receiver(post_save, sender=MusicArtistXPersonActivity)
+@receiver(post_delete, sender=MusicArtistXPersonActivity)
+def music_artist_x_person_activity_changed(
+        sender, instance, raw=False, **kwargs) -> None:
+    # Personnel as of a year is cached on the artist
+    if not raw:
+        touch(
+            MusicArtist,
+            music_artist_x_person=instance.music_artist_x_person_id,
+        )
+
+
+@receiver(post_save, sender=Config)
+@receiver(post_delete, sender=Config)
+def config_changed(sender, **kwargs) -> None:
+    # Cleared before commit, another process could cache the old rows again
+    transaction.on_commit(clear_config_cache)
+
+
+@receiver(post_save, sender=MusicAlbum)
+@receiver(post_delete, sender=MusicAlbum)
+def music_album_changed(sender, **kwargs) -> None:
+    transaction.on_commit(lambda: cache.delete(MUSIC_ALBUM_INITIALS_KEY))
+
+
+@receiver(pre_save, sender=MusicAlbumEditionXSongRecording)
+def music_album_edition_x_song_recording_pre_save(
+        sender, instance, **kwargs) -> None:
+    # A track moved to another edition changes the statistics of both
+    instance._previous_music_album_edition_id = None
+    if instance.pk:
+        instance._previous_music_album_edition_id = (
+            sender.objects
+            .filter(pk=instance.pk)
+            .values_list('music_album_edition_id', flat=True)
+            .first()
+        )
+
+
+@receiver(post_save, sender=MusicAlbumEditionXSongRecording)
+@receiver(post_delete, sender=MusicAlbumEditionXSongRecording)
+def music_album_edition_x_song_recording_changed(
+        sender, instance, **kwargs) -> None:
+    pks = {
+        instance.music_album_edition_id,
+        getattr(instance, '_previous_music_album_edition_id', None),
+    }
+    pks.discard(None)
+    MusicAlbumEdition.objects.filter(pk__in=pks).update_statistics()
+    touch(MusicAlbumEdition, pk__in=pks)
+
+
+@receiver(m2m_changed, sender=MusicAlbumEdition.song_recordings.through)
+def music_album_edition_song_recordings_changed(
+        sender, instance, action, **kwargs) -> None:
+    # add(), set(), remove() and clear() skip the through model's signals.
+    # The relation has no reverse accessor, so instance is the edition.
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    MusicAlbumEdition.objects.filter(pk=instance.pk).update_statistics()
+    touch(MusicAlbumEdition, pk=instance.pk)
+
+
+@receiver(post_save, sender=SongRecording)
+def song_recording_saved(
+        sender, instance, update_fields=None, **kwargs) -> None:
+    if update_fields is not None and 'duration' not in update_fields:
+        return
+    (
+        MusicAlbumEdition.objects
+        .filter(music_album_edition_x_song_recording__song_recording=instance)
+        .update_statistics()
+    )
@@ -0,0 +1,23 @@
+"use strict";
+{
+    const $ = django.jQuery;
+
+    function init(elements) {
+        $(elements).not("[name*=__prefix__]").each(function (i, element) {
+            $(element).select2({
+                ajax: {
+                    data: (params) => ({term: params.term, page: params.page}),
+                },
+            });
+        });
+    }
+
+    document.addEventListener("DOMContentLoaded", function () {
+        init(document.querySelectorAll(".core-autocomplete"));
+    });
+
+    // Rows added to admin inlines after the page has loaded
+    document.addEventListener("formset:added", function (event) {
+        init(event.target.querySelectorAll(".core-autocomplete"));
+    });
+}
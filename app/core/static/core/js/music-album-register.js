@@ -0,0 +1,16 @@
+docReady(function () {
+    // Track listings are fetched the first time an album's editions open.
+    for (const details of document.querySelectorAll(".js-lazy-details")) {
+        details.addEventListener("toggle", function () {
+            if (!details.open || details.dataset.loaded) {
+                return;
+            }
+            details.dataset.loaded = "true";
+            fetch(details.dataset.url)
+                .then((response) => response.text())
+                .then((html) => {
+                    details.querySelector(".js-lazy-details__content").innerHTML = html;
+                });
+        });
+    }
+});
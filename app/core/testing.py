@@ -0,0 +1,44 @@
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test.utils import CaptureQueriesContext
+
+
+class _AssertMaxQueriesContext(CaptureQueriesContext):
+    def __init__(self, test_case, num: int, connection):
+        self.test_case = test_case
+        self.num = num
+        super().__init__(connection)
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        super().__exit__(exc_type, exc_value, traceback)
+        if exc_type is not None:
+            return
+        executed = len(self)
+        queries = '\n'.join(
+            f'{i}. {query["sql"]}'
+            for i, query in enumerate(self.captured_queries, start=1)
+        )
+        self.test_case.assertLessEqual(
+            executed, self.num,
+            f'{executed} queries executed, at most {self.num} expected\n'
+            f'Captured queries were:\n{queries}'
+        )
+
+
+class QueryBudgetMixin:
+    """TestCase mixin for query ceilings, as opposed to exact counts."""
+
+    def assertMaxQueries(
+            self, num: int, func=None, *args, using=DEFAULT_DB_ALIAS,
+            **kwargs):
+        context = _AssertMaxQueriesContext(self, num, connections[using])
+        if func is None:
+            return context
+        with context:
+            func(*args, **kwargs)
+
+    def assertViewMaxQueries(self, url: str, num: int, **kwargs):
+        """GETs `url` with the test client; returns the response."""
+
+        with self.assertMaxQueries(num):
+            response = self.client.get(url, **kwargs)
+        return response
@@ -1,7 +1,17 @@
-from django.test import TestCase
+from io import StringIO
 
+from django.test import (
+    override_settings,
+    SimpleTestCase,
+    TestCase,
+    TransactionTestCase,
+)
+from django.urls import reverse
 
-class BaseTest(TestCase):
+from core.testing import QueryBudgetMixin
+
+
+class BaseTest(QueryBudgetMixin, TestCase):
     @classmethod
     def create_account(cls):
         from core.models import Account
@@ -13,3 +23,345 @@ class BaseTest(TestCase):
         from core.models import Account
         self.create_account()
         self.assertTrue(Account.objects.first())
+
+    def test_search_query_ceiling(self):
+        url = reverse('core:search') + '?q=test'
+        response = self.assertViewMaxQueries(url, 1)
+        self.assertEqual(response.status_code, 200)
+
+
+class PointOfSaleTotalsTest(TestCase):
+    def test_unreconciled(self):
+        import datetime
+        from decimal import Decimal
+
+        from core.models import (
+            CatalogItem,
+            Party,
+            Payee,
+            PointOfSale,
+            PointOfSaleLineItem,
+            Txn,
+        )
+        from core.models.catalog_item import CatalogItemXPointOfSaleLineItem
+        today = datetime.date.today()
+        txn = Txn.objects.create(
+            payee=Payee.objects.create(name='TestPayee'),
+            txn_date=today,
+            ref_total=Decimal(10),
+        )
+        pos = PointOfSale.objects.create(
+            party=Party.objects.create(
+                name='TestParty', subtype=Party.Subtype.BUSINESS),
+            point_of_sale_date=today,
+            txn=txn,
+        )
+        CatalogItemXPointOfSaleLineItem.objects.create(
+            point_of_sale_line_item=PointOfSaleLineItem.objects.create(
+                point_of_sale=pos,
+                subtype=PointOfSaleLineItem.Subtype.CATALOGUE_ITEM,
+            ),
+            catalog_item=CatalogItem.objects.create(name='TestItem'),
+            quantity=2,
+            unit_price=Decimal(3),
+        )
+        [result] = PointOfSale.objects.unreconciled()
+        self.assertEqual(result.line_item_total, Decimal(6))
+        self.assertEqual(pos.line_item_total, Decimal(6))
+        self.assertEqual(
+            result.txn_status, PointOfSale.TxnStatus.REF_TOTAL_MISMATCH)
+
+
+class FamilyTreeTest(SimpleTestCase):
+    def setUp(self):
+        from core.models import PersonXPersonRelation
+        from core.utils.genealogy import FamilyTree
+
+        Relation = PersonXPersonRelation.Relation
+        # 10 is the parent of 1 and 2; 1 of 100, and so of its sibling 101;
+        # 2 of 200, recorded from the child's side
+        self.tree = FamilyTree.from_rows([
+            (10, 1, Relation.PARENT),
+            (10, 2, Relation.PARENT),
+            (1, 100, Relation.PARENT),
+            (100, 101, Relation.SIBLING),
+            (200, 2, Relation.CHILD),
+        ])
+
+    def test_parents(self):
+        self.assertEqual(self.tree.parents(100), {1})
+        self.assertEqual(self.tree.parents(101), {1})
+        self.assertEqual(self.tree.parents(200), {2})
+
+    def test_ancestors(self):
+        self.assertEqual(self.tree.ancestors(101), {1: 1, 10: 2})
+        self.assertEqual(self.tree.ancestors(101, max_depth=1), {1: 1})
+
+    def test_siblings(self):
+        self.assertEqual(self.tree.siblings(100), {101})
+        self.assertEqual(self.tree.siblings(1), {2})
+
+    def test_cousins(self):
+        self.assertEqual(self.tree.cousins(100), {200})
+        self.assertEqual(self.tree.cousins(200), {100, 101})
+        self.assertEqual(self.tree.cousins(1, degree=0, removed=1), {200})
+
+
+class ChainTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        from core.models import (
+            MusicAlbum,
+            MusicAlbumXMusicArtist,
+            MusicAlbumXVideoGame,
+            MusicArtist,
+            VideoGame,
+        )
+        cls.artists = MusicArtist.objects.bulk_create(
+            MusicArtist(name=f'Artist {i}') for i in range(3))
+        cls.albums = MusicAlbum.objects.bulk_create(
+            MusicAlbum(title=f'Album {i}') for i in range(2))
+        cls.video_game = VideoGame.objects.create(title='Game')
+        a, b, c = cls.artists
+        # a and b share both albums, b and c the second
+        MusicAlbumXMusicArtist.objects.bulk_create(
+            MusicAlbumXMusicArtist(music_album=album, music_artist=artist)
+            for album, artist in [
+                (cls.albums[0], a), (cls.albums[0], b),
+                (cls.albums[1], a), (cls.albums[1], b), (cls.albums[1], c),
+            ]
+        )
+        MusicAlbumXVideoGame.objects.create(
+            music_album=cls.albums[1], video_game=cls.video_game)
+
+    def test_two_hops(self):
+        from core.utils import network
+
+        vn = network.MUSIC_ARTIST_TO_VIDEO_GAME.build(weighted=True)
+        game = f'video_game-{self.video_game.pk}'
+        self.assertEqual(
+            {from_ for from_, to in vn.edges if to == game},
+            {f'music_artist-{x.pk}' for x in self.artists},
+        )
+        self.assertEqual(vn.nodes[game].label, 'Game')
+        self.assertEqual(vn.nodes[game].mass, 3)
+
+    def test_projection(self):
+        from core.models import MusicAlbumXMusicArtist
+        from core.utils.network import Chain, Hop
+
+        a, b, c = (x.pk for x in self.artists)
+        expected = {(a, b): 2, (a, c): 1, (b, c): 1}
+        hops = (
+            Hop(MusicAlbumXMusicArtist, 'music_artist', 'music_album'),
+            Hop(MusicAlbumXMusicArtist, 'music_album', 'music_artist'),
+        )
+        for in_database in (False, True):
+            with self.subTest(in_database=in_database):
+                chain = Chain(*hops, in_database=in_database)
+                edges, labels, _ = chain.resolve()
+                self.assertEqual(edges, expected)
+                self.assertEqual(labels[a], 'Artist 0')
+
+
+class CatalogImportTest(TestCase):
+    def test_subtype_errors_skip_rows(self):
+        from core.models import CatalogItemManufactured
+        from core.utils.catalog import import_catalog_items
+
+        result = import_catalog_items([
+            {'name': 'A', 'subtype': 'MANUFACTURED'},
+            # Blank manufacturer and part number collide with row 0
+            {'name': 'B', 'subtype': 'MANUFACTURED'},
+            {'name': 'C', 'subtype': 'DIGITAL_SONG',
+             'song_recording_id': '999999'},
+        ])
+        self.assertEqual(result.created, 1)
+        self.assertEqual(
+            sorted((i, column) for i, column, _ in result.errors),
+            [(1, 'manufacturer_id'), (2, 'song_recording_id')],
+        )
+        self.assertEqual(CatalogItemManufactured.objects.count(), 1)
+
+    def test_subtype_change_replaces_subtype_row(self):
+        from core.models import (
+            CatalogItemDigitalSong,
+            CatalogItemManufactured,
+        )
+        from core.utils.catalog import import_catalog_items
+
+        row = {'name': 'A', 'asin': 'B000000001', 'subtype': 'MANUFACTURED'}
+        import_catalog_items([row])
+        result = import_catalog_items([{**row, 'subtype': 'DIGITAL_SONG'}])
+        self.assertEqual(result.updated, 1)
+        self.assertFalse(CatalogItemManufactured.objects.exists())
+        self.assertEqual(CatalogItemDigitalSong.objects.count(), 1)
+
+
+class ParseAsOfTest(SimpleTestCase):
+    def test_parse_as_of(self):
+        from core.utils.network import parse_as_of
+
+        self.assertEqual(parse_as_of('1999'), 1999)
+        self.assertEqual(parse_as_of('1990-1995'), (1990, 1995))
+        self.assertEqual(parse_as_of('1990-'), (1990, None))
+        self.assertEqual(parse_as_of('-1995'), (None, 1995))
+        for value in ('', '-', 'abc', '1995-1990'):
+            with self.subTest(value=value):
+                self.assertIsNone(parse_as_of(value))
+
+
+class MusicArtistIsActiveTest(TestCase):
+    def test_property_matches_annotation(self):
+        from core.models import MusicArtist, MusicArtistActivity
+
+        histories = {
+            'Undated': [],
+            'Broke up': [(1990, 1995)],
+            'Reunited': [(1990, 1995), (2000, None)],
+            'Reunited, then broke up': [(2000, 2005), (1990, 1995)],
+        }
+        for name, years in histories.items():
+            music_artist = MusicArtist.objects.create(name=name)
+            MusicArtistActivity.objects.bulk_create(
+                MusicArtistActivity(
+                    music_artist=music_artist,
+                    year_active=year_active,
+                    year_inactive=year_inactive,
+                )
+                for year_active, year_inactive in years
+            )
+        annotated = dict(
+            MusicArtist.objects.with_is_active()
+            .values_list('name', 'is_active')
+        )
+        self.assertEqual(annotated, {
+            'Undated': True,
+            'Broke up': False,
+            'Reunited': True,
+            'Reunited, then broke up': False,
+        })
+        for music_artist in MusicArtist.objects.all():
+            with self.subTest(name=music_artist.name):
+                self.assertEqual(
+                    music_artist.is_active, annotated[music_artist.name])
+
+
+def image_content(size: tuple[int, int], color: str) -> bytes:
+    from io import BytesIO
+
+    from PIL import Image
+
+    buffer = BytesIO()
+    Image.new('RGB', size, color).save(buffer, 'jpeg')
+    return buffer.getvalue()
+
+
+@override_settings(STORAGES={
+    'default': {'BACKEND': 'django.core.files.storage.InMemoryStorage'},
+    'staticfiles': {
+        'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage',
+    },
+})
+class BackfillImagesTest(TransactionTestCase):
+    # The command closes connections before forking its workers
+    def test_backfill(self):
+        import hashlib
+
+        from django.core.files.base import ContentFile
+        from django.core.files.storage import default_storage
+        from django.core.management import call_command
+        from PIL import Image
+
+        from core.models import MusicAlbum, MusicAlbumArtwork, Photo
+
+        photo_content = image_content((2000, 1000), 'red')
+        artwork_content = image_content((800, 800), 'blue')
+        photo = Photo.objects.create(
+            image_full=ContentFile(photo_content, name='photo.jpg'))
+        artwork = MusicAlbumArtwork.objects.create(
+            music_album=MusicAlbum.objects.create(title='Album'),
+            image_full=ContentFile(artwork_content, name='artwork.jpg'),
+        )
+        # As if uploaded before the resized images and digests existed
+        for model in (Photo, MusicAlbumArtwork):
+            model.objects.update(
+                image_full_sha256=None, image_small='', image_thumbnail='')
+
+        call_command('backfill_images', workers=1, stdout=StringIO())
+        photo.refresh_from_db()
+        artwork.refresh_from_db()
+        expected_sizes = {
+            photo: {
+                'image_large': (1280, 640),
+                'image_small': (250, 125),
+                'image_thumbnail': (100, 50),
+            },
+            artwork: {
+                'image_large': (800, 800),
+                'image_small': (250, 250),
+                'image_thumbnail': (100, 100),
+            },
+        }
+        contents = {photo: photo_content, artwork: artwork_content}
+        for obj, sizes in expected_sizes.items():
+            with self.subTest(model=type(obj).__name__):
+                self.assertEqual(
+                    obj.image_full_sha256,
+                    hashlib.sha256(contents[obj]).hexdigest())
+                for field_name, size in sizes.items():
+                    with Image.open(getattr(obj, field_name)) as image:
+                        self.assertEqual(image.size, size)
+
+        files = set(default_storage.listdir('')[1])
+        call_command(
+            'backfill_images', workers=1, regenerate=True, stdout=StringIO())
+        self.assertEqual(set(default_storage.listdir('')[1]), files)
+
+
+@override_settings(STORAGES={
+    'default': {'BACKEND': 'django.core.files.storage.InMemoryStorage'},
+    'staticfiles': {
+        'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage',
+    },
+})
+class ImageViewTest(TestCase):
+    def setUp(self):
+        import hashlib
+
+        from django.core.files.base import ContentFile
+
+        from core.models import Photo
+
+        content = image_content((400, 400), 'green')
+        self.sha256 = hashlib.sha256(content).hexdigest()
+        self.photo = Photo.objects.create(
+            image_full=ContentFile(content, name='photo.jpg'))
+        self.url = reverse(
+            'core:image', args=['photo', self.photo.pk, 'small'])
+
+    def test_conditional_response(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        etag = f'"{self.sha256}-small"'
+        self.assertEqual(response['ETag'], etag)
+        self.assertIn('no-cache', response['Cache-Control'])
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_versioned_url_is_immutable(self):
+        response = self.client.get(self.url, {'v': self.sha256})
+        self.assertIn('immutable', response['Cache-Control'])
+        response = self.client.get(self.url, {'v': 'outdated'})
+        self.assertNotIn('immutable', response['Cache-Control'])
+        self.assertIn('no-cache', response['Cache-Control'])
+
+    def test_missing_digest_is_stored(self):
+        from core.models import Photo
+
+        Photo.objects.update(image_full_sha256=None)
+        response = self.client.get(self.url)
+        self.assertEqual(response['ETag'], f'"{self.sha256}-small"')
+        self.photo.refresh_from_db()
+        self.assertEqual(self.photo.image_full_sha256, self.sha256)
@@ -17,6 +17,7 @@ _catalog_item_urls = make_urls([
     path('', views.models.CatalogItemListView.as_view(), name='list'),
     path('<int:pk>/',
          views.models.CatalogItemDetailView.as_view(), name='detail'),
+    path('facets/', views.models.catalog_item_facets, name='facets'),
 ])
 
 _music_album_urls = make_urls([
@@ -45,6 +46,7 @@ _person_urls = make_urls([
     path('', views.models.PersonListView.as_view(), name='list'),
     path('<int:pk>/', include([
         path('', views.models.PersonDetailView.as_view(), name='detail'),
+        path('credits/', views.models.person_credits, name='credits'),
     ])),
 ])
 
@@ -67,6 +69,10 @@ _vehicle_urls = make_urls([
 
 urlpatterns = [
     path('', views.main.index, name='index'),
+    path('autocomplete/<str:kind>/',
+         views.autocomplete.autocomplete, name='autocomplete'),
+    path('images/<str:model_name>/<int:pk>/<str:size>/',
+         views.images.image, name='image'),
     path('models/', include([
         path('account/',
              include(_account_urls, namespace='account')),
@@ -88,17 +94,32 @@ urlpatterns = [
         path('vehicle/',
              include(_vehicle_urls, namespace='vehicle')),
     ])),
-    path('music-album-register/',
-         views.main.MusicAlbumRegisterView.as_view(),
-         name='music-album-register'),
+    path('music-album-register/', include([
+        path('',
+             views.main.MusicAlbumRegisterView.as_view(),
+             name='music-album-register'),
+        path('<int:pk>/editions/',
+             views.main.MusicAlbumRegisterEditionsView.as_view(),
+             name='music-album-register-editions'),
+    ])),
     path('networks/', include([
         path('', views.networks.NetworkIndex.as_view(), name='network-index'),
         path('film-games-and-music/',
              views.networks.FilmGamesAndMusicNetworkView.as_view()),
+        path('film-games-and-music/clusters/<str:cluster_id>/',
+             views.networks.film_games_and_music_cluster,
+             name='film-games-and-music-cluster'),
+        path('music/', views.networks.MusicNetworkView.as_view()),
         path('music-artists/', views.networks.MusicArtistNetworkView.as_view()),
         path('music-tags/', views.networks.MusicTagNetworkView.as_view()),
         path('person/', views.networks.PersonRelationView.as_view()),
+        path('person/<int:pk>/family/',
+             views.networks.PersonFamilyTreeView.as_view(),
+             name='person-family-tree'),
+        path('songs/', views.networks.SongNetworkView.as_view()),
     ])),
+    path('query-stats/', views.main.query_stats_view, name='query-stats'),
+    path('search/', views.search.search, name='search'),
     path('txn-register/', include([
         path('', views.main.AccountListView.as_view(), name='account-list'),
         path('<int:account_pk>/', include([
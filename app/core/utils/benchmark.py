@@ -0,0 +1,345 @@
+"""Synthetic data and timed cases for the `benchmark` management command.
+
+generate() fills the database with a deterministic, scaled data set: scale 1 is
+roughly the size of the current data, scale 10 is ten times that. Cases time
+the network builders, VisNetwork merging and serialization, the account
+hierarchy and the two register views against it.
+"""
+
+from dataclasses import dataclass
+import datetime
+from decimal import Decimal
+import random
+import statistics
+import time
+from typing import Any, Callable
+
+from django.contrib.auth.models import AnonymousUser
+from django.db import connection
+from django.db.models import Count
+from django.test import RequestFactory
+
+from schemaviz import VisNetwork
+
+from core import views
+from core.middleware import QueryRecorder
+from core.models import (
+    Account,
+    MotionPicture,
+    MotionPictureXPerson,
+    MusicAlbum,
+    MusicAlbumEdition,
+    MusicAlbumEditionXSongRecording,
+    MusicAlbumXMusicArtist,
+    MusicAlbumXPerson,
+    MusicAlbumXVideoGame,
+    MusicArtist,
+    MusicArtistXPerson,
+    MusicArtistXSong,
+    MusicArtistXSongPerformance,
+    Payee,
+    Person,
+    PersonXSong,
+    PersonXSongPerformance,
+    PersonXVideoGame,
+    Song,
+    SongArrangement,
+    SongPerformance,
+    SongRecording,
+    SongXSongArrangement,
+    Txn,
+    TxnLineItem,
+    VideoGame,
+)
+from . import network
+
+# Rows per unit of scale
+BASE_COUNTS = {
+    'account': 50,
+    'motion_picture': 20,
+    'music_album': 100,
+    'music_artist': 50,
+    'payee': 20,
+    'person': 200,
+    'song': 1000,
+    'txn': 2000,
+    'video_game': 20,
+}
+
+TRACKS_PER_EDITION = 10
+
+
+def generate(scale: int = 1, seed: int = 0) -> dict[str, int]:
+    """Creates the data set and returns the number of rows per model."""
+
+    rng = random.Random(seed)
+    counts = {k: v * scale for k, v in BASE_COUNTS.items()}
+
+    def sample(objs: list, k: int) -> list:
+        return rng.sample(objs, min(k, len(objs)))
+
+    persons = Person.objects.bulk_create(
+        Person(preferred_name=f'Benchmark Person {i}')
+        for i in range(counts['person'])
+    )
+    artists = MusicArtist.objects.bulk_create(
+        MusicArtist(name=f'Benchmark Artist {i}')
+        for i in range(counts['music_artist'])
+    )
+    MusicArtistXPerson.objects.bulk_create(
+        MusicArtistXPerson(music_artist=artist, person=person)
+        for artist in artists
+        for person in sample(persons, 4)
+    )
+
+    # Songs, each with one arrangement, performance and recording
+    songs = Song.objects.bulk_create(
+        Song(title=f'Benchmark Song {i}') for i in range(counts['song'])
+    )
+    arrangements = SongArrangement.objects.bulk_create(
+        SongArrangement(title=song.title) for song in songs
+    )
+    SongXSongArrangement.objects.bulk_create(
+        SongXSongArrangement(song=song, song_arrangement=arrangement)
+        for song, arrangement in zip(songs, arrangements)
+    )
+    performances = SongPerformance.objects.bulk_create(
+        SongPerformance(song_arrangement=arrangement)
+        for arrangement in arrangements
+    )
+    recordings = SongRecording.objects.bulk_create(
+        SongRecording(
+            duration=datetime.timedelta(seconds=rng.randint(90, 600)),
+            song_performance=performance,
+        )
+        for performance in performances
+    )
+    MusicArtistXSong.objects.bulk_create(
+        MusicArtistXSong(music_artist=rng.choice(artists), song=song)
+        for song in songs
+    )
+    PersonXSong.objects.bulk_create(
+        PersonXSong(person=rng.choice(persons), song=song)
+        for song in songs
+    )
+    MusicArtistXSongPerformance.objects.bulk_create(
+        MusicArtistXSongPerformance(
+            music_artist=rng.choice(artists), song_performance=performance)
+        for performance in performances
+    )
+    PersonXSongPerformance.objects.bulk_create(
+        PersonXSongPerformance(person=person, song_performance=performance)
+        for performance in performances
+        for person in sample(persons, 2)
+    )
+
+    # Albums, each with one edition of consecutive recordings
+    albums = MusicAlbum.objects.bulk_create(
+        MusicAlbum(title=f'Benchmark Album {i}')
+        for i in range(counts['music_album'])
+    )
+    editions = MusicAlbumEdition.objects.bulk_create(
+        MusicAlbumEdition(music_album=album, name='Standard')
+        for album in albums
+    )
+    MusicAlbumEditionXSongRecording.objects.bulk_create(
+        MusicAlbumEditionXSongRecording(
+            music_album_edition=edition,
+            song_recording=recordings[
+                (i * TRACKS_PER_EDITION + track) % len(recordings)],
+            disc_number=1,
+            track_number=track + 1,
+        )
+        for i, edition in enumerate(editions)
+        for track in range(min(TRACKS_PER_EDITION, len(recordings)))
+    )
+    MusicAlbumEdition.objects.update_statistics()
+    MusicAlbumXMusicArtist.objects.bulk_create(
+        MusicAlbumXMusicArtist(music_album=album, music_artist=artist)
+        for album in albums
+        for artist in sample(artists, rng.choice((1, 1, 1, 2)))
+    )
+    MusicAlbumXPerson.objects.bulk_create(
+        MusicAlbumXPerson(music_album=album, person=person)
+        for album in albums
+        for person in sample(persons, 2)
+    )
+
+    motion_pictures = MotionPicture.objects.bulk_create(
+        MotionPicture(title=f'Benchmark Film {i}')
+        for i in range(counts['motion_picture'])
+    )
+    MotionPictureXPerson.objects.bulk_create(
+        MotionPictureXPerson(motion_picture=motion_picture, person=person)
+        for motion_picture in motion_pictures
+        for person in sample(persons, 5)
+    )
+    video_games = VideoGame.objects.bulk_create(
+        VideoGame(title=f'Benchmark Game {i}')
+        for i in range(counts['video_game'])
+    )
+    PersonXVideoGame.objects.bulk_create(
+        PersonXVideoGame(person=person, video_game=video_game)
+        for video_game in video_games
+        for person in sample(persons, 3)
+    )
+    MusicAlbumXVideoGame.objects.bulk_create(
+        MusicAlbumXVideoGame(music_album=album, video_game=video_game)
+        for video_game in video_games
+        for album in sample(albums, 1)
+    )
+
+    # Ledger: a shallow account tree and two-line transactions
+    accounts = []
+    for i in range(counts['account']):
+        # Parents come from earlier batches, see bulk_create below
+        parent = rng.choice(accounts[:i - i % 10]) if i >= 10 else None
+        accounts.append(Account(
+            name=f'Benchmark Account {i}',
+            parent_account=parent,
+            subtype=rng.choice(Account.Subtype.values),
+        ))
+    # Parents need primary keys before their children are inserted
+    for i in range(0, len(accounts), 10):
+        Account.objects.bulk_create(accounts[i:i + 10])
+    payees = Payee.objects.bulk_create(
+        Payee(name=f'Benchmark Payee {i}') for i in range(counts['payee'])
+    )
+    start = datetime.date.today() - datetime.timedelta(days=365 * 5)
+    txns = Txn.objects.bulk_create(
+        Txn(
+            payee=rng.choice(payees),
+            txn_date=start + datetime.timedelta(days=rng.randrange(365 * 5)),
+        )
+        for _ in range(counts['txn'])
+    )
+    line_items = []
+    for txn in txns:
+        amount = Decimal(rng.randint(100, 100000)) / 100
+        debit_account, credit_account = sample(accounts, 2)
+        line_items += [
+            TxnLineItem(
+                txn=txn, account=debit_account, amount=amount, debit=True),
+            TxnLineItem(
+                txn=txn, account=credit_account, amount=amount, debit=False),
+        ]
+    TxnLineItem.objects.bulk_create(line_items)
+    return counts
+
+
+@dataclass
+class Case:
+    name: str
+    run: Callable[[Any], Any]
+    # Untimed; its return value is passed to run
+    setup: Callable[[], Any] = lambda: None
+
+
+NETWORK_BUILDERS = (
+    network.person_to_motion_picture,
+    network.person_to_music_artist,
+    network.music_artist_via_music_album,
+    network.person_to_music_artist_via_music_album,
+    network.music_album_x_video_game,
+    network.person_to_music_artist_via_song,
+    network.person_to_music_artist_via_song_performance,
+    network.person_to_video_game,
+    network.person_via_song,
+    network.person_via_song_performance,
+)
+
+
+def build_networks() -> list[VisNetwork]:
+    return [builder() for builder in NETWORK_BUILDERS]
+
+
+def extend_networks(
+        networks: list[VisNetwork], **kwargs) -> VisNetwork:
+    vn = VisNetwork()
+    for other in networks:
+        vn.extend(other, **kwargs)
+    return vn
+
+
+def render_view(view, **kwargs):
+    request = RequestFactory().get('/')
+    request.user = AnonymousUser()
+    return view(request, **kwargs).render()
+
+
+def busiest_account_pk() -> int:
+    return (
+        Account.objects
+        .annotate(line_item_count=Count('txn_line_item'))
+        .order_by('-line_item_count')
+        .values_list('pk', flat=True)
+        .first()
+    )
+
+
+def get_cases() -> list[Case]:
+    cases = [
+        Case(f'network.{builder.__name__}', lambda _, f=builder: f())
+        for builder in NETWORK_BUILDERS
+    ]
+    cases += [
+        Case('VisNetwork.extend', extend_networks, build_networks),
+        Case(
+            'VisNetwork.extend aggregate_edges',
+            lambda networks: extend_networks(networks, aggregate_edges=True),
+            build_networks,
+        ),
+        Case(
+            'VisNetwork.to_json',
+            lambda vn: vn.to_json(),
+            lambda: extend_networks(build_networks()),
+        ),
+        Case(
+            'VisNetwork.to_compact',
+            lambda vn: vn.to_compact(),
+            lambda: extend_networks(build_networks()),
+        ),
+        Case(
+            'Account.objects.get_hierarchy_list',
+            lambda _: Account.objects.get_hierarchy_list(),
+        ),
+        Case(
+            'Account.objects.get_hierarchy_flat',
+            lambda _: Account.objects.get_hierarchy_flat(),
+        ),
+        Case(
+            'TxnRegisterView',
+            lambda pk: render_view(
+                views.main.TxnRegisterView.as_view(), account_pk=pk),
+            busiest_account_pk,
+        ),
+        Case(
+            'MusicAlbumRegisterView',
+            lambda _: render_view(
+                views.main.MusicAlbumRegisterView.as_view()),
+        ),
+    ]
+    return cases
+
+
+def time_case(case: Case, repeat: int) -> dict:
+    """Runs a case `repeat` times; returns timings in seconds."""
+
+    timings = []
+    queries = 0
+    for _ in range(repeat):
+        arg = case.setup()
+        recorder = QueryRecorder()
+        with connection.execute_wrapper(recorder):
+            start = time.perf_counter()
+            case.run(arg)
+            timings.append(time.perf_counter() - start)
+        queries = recorder.count
+    return {
+        'name': case.name,
+        'repeat': repeat,
+        'min': min(timings),
+        'median': statistics.median(timings),
+        'mean': statistics.fmean(timings),
+        'queries': queries,
+    }
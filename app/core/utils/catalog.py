@@ -0,0 +1,300 @@
+"""Bulk import of CatalogItems and their subtypes.
+
+Rows are plain dictionaries, e.g. from a CSV export of a purchase history:
+CatalogItem fields (`name`, `subtype` and the identifier columns), plus the
+subtype fields `manufacturer_id`, `part_number`, `music_album_production_id`
+or `song_recording_id`.
+
+A batch is validated as a whole, then matched against existing items with one
+IN lookup per identifier column, then its subtype fields are checked with one
+lookup per related or unique column, then written with one upsert per table.
+Identifiers left empty on a row never clear the value of an existing item.
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+import re
+from typing import Iterable
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import Q
+
+from core.models import (
+    CatalogItem,
+    CatalogItemDigitalSong,
+    CatalogItemManufactured,
+    CatalogItemMusicAlbumProduction,
+)
+from core.validators import gtin_check_digit, isbn_10_check_digit
+
+IDENTIFIERS = ('asin', 'ean_13', 'isbn', 'isbn_13', 'ismn', 'upc_a')
+
+# Subtype model and the fields it takes from a row
+SUBTYPES = {
+    CatalogItem.Subtype.DIGITAL_SONG: (
+        CatalogItemDigitalSong, ('song_recording_id',)),
+    CatalogItem.Subtype.MANUFACTURED: (
+        CatalogItemManufactured, ('manufacturer_id', 'part_number')),
+    CatalogItem.Subtype.MUSIC_ALBUM: (
+        CatalogItemMusicAlbumProduction, ('music_album_production_id',)),
+}
+
+# Unique subtype columns, and whether NULLs count as equal
+UNIQUE_SUBTYPE_FIELDS = {
+    CatalogItem.Subtype.DIGITAL_SONG: (('song_recording_id',), False),
+    CatalogItem.Subtype.MANUFACTURED: (
+        ('manufacturer_id', 'part_number'), True),
+}
+
+_separators = re.compile(r'[\s-]')
+
+
+@dataclass
+class ImportResult:
+    created: int = 0
+    updated: int = 0
+    # (row index, field, message)
+    errors: list[tuple[int, str, str]] = field(default_factory=list)
+
+
+def normalize(row: dict) -> dict:
+    """Strips separators from identifiers; empty values become None."""
+
+    row = dict(row)
+    for column in IDENTIFIERS:
+        value = _separators.sub('', str(row.get(column) or '')).upper()
+        row[column] = value or None
+    row['name'] = str(row.get('name') or '').strip()
+    row['subtype'] = str(row.get('subtype') or '').strip().upper()
+    return row
+
+
+def identifier_errors(column: str, value: str) -> str | None:
+    """Message describing what is wrong with an identifier, if anything."""
+
+    if column == 'asin':
+        if len(value) != 10 or not value.isalnum():
+            return "must be 10 letters or digits"
+    elif column == 'isbn':
+        if len(value) != 10 or not value[:9].isdigit():
+            return "must be 9 digits and a check digit"
+        if value[9] != isbn_10_check_digit(value[:9]):
+            return "invalid check digit"
+    else:
+        length = 12 if column == 'upc_a' else 13
+        if len(value) != length or not value.isdigit():
+            return f"must be {length} digits"
+        if int(value[-1]) != gtin_check_digit(value[:-1]):
+            return "invalid check digit"
+    return None
+
+
+def validate(rows: list[dict]) -> list[tuple[int, str, str]]:
+    """Checks every row of a batch, including duplicates within it."""
+
+    errors = []
+    for column in IDENTIFIERS:
+        seen = {}
+        for i, row in enumerate(rows):
+            value = row[column]
+            if value is None:
+                continue
+            message = identifier_errors(column, value)
+            if message is None and value in seen:
+                message = f"duplicate of row {seen[value]}"
+            if message:
+                errors.append((i, column, message))
+            seen.setdefault(value, i)
+    for i, row in enumerate(rows):
+        if not row['name']:
+            errors.append((i, 'name', "required"))
+        if row['subtype'] and row['subtype'] not in SUBTYPES:
+            errors.append((i, 'subtype', "unknown subtype"))
+    return errors
+
+
+def match_existing(rows: list[dict]) -> tuple[dict[int, int], list]:
+    """Maps row index to the pk of the existing item it identifies.
+
+    A row whose identifiers point at different items is reported as an error.
+    """
+
+    matches = {}
+    errors = []
+    for column in IDENTIFIERS:
+        values = {row[column] for row in rows if row[column] is not None}
+        if not values:
+            continue
+        existing = dict(
+            CatalogItem.objects
+            .filter(**{f'{column}__in': values})
+            .values_list(column, 'pk')
+        )
+        for i, row in enumerate(rows):
+            pk = existing.get(row[column])
+            if pk is None:
+                continue
+            if matches.setdefault(i, pk) != pk:
+                errors.append(
+                    (i, column, f"matches item {pk}, not {matches[i]}"))
+    # One upsert can't write the same item twice
+    seen = {}
+    for i, pk in sorted(matches.items()):
+        if seen.setdefault(pk, i) != i:
+            errors.append(
+                (i, 'id', f"matches the same item as row {seen[pk]}"))
+    return matches, errors
+
+
+def subtype_values(model, fields: tuple[str, ...], row: dict) -> dict:
+    """Subtype fields of a row; missing values take the field default.
+
+    Raises ValidationError for a value the field can't hold.
+    """
+
+    values = {}
+    for attname in fields:
+        field_ = model._meta.get_field(attname)
+        value = row.get(attname)
+        if value in ('', None):
+            values[attname] = field_.get_default()
+        else:
+            values[attname] = field_.to_python(value)
+    return values
+
+
+def subtype_errors(
+        rows: list[dict],
+        matches: dict[int, int]) -> list[tuple[int, str, str]]:
+    """Checks subtype fields: related rows must exist, and unique columns
+    must stay unique within the batch and against other items.
+    """
+
+    errors = []
+    # Subtype to [(row index, subtype values)]
+    entries = defaultdict(list)
+    for i, row in enumerate(rows):
+        if row['subtype'] not in SUBTYPES:
+            continue
+        model, fields = SUBTYPES[row['subtype']]
+        try:
+            entries[row['subtype']].append(
+                (i, subtype_values(model, fields, row)))
+        except ValidationError as e:
+            errors.append((i, 'subtype', ' '.join(e.messages)))
+
+    for subtype, (model, fields) in SUBTYPES.items():
+        for attname in fields:
+            field_ = model._meta.get_field(attname)
+            if not field_.is_relation:
+                continue
+            pks = {
+                values[attname] for _, values in entries[subtype]
+                if values[attname] is not None
+            }
+            if not pks:
+                continue
+            existing = set(
+                field_.related_model.objects
+                .filter(pk__in=pks)
+                .values_list('pk', flat=True)
+            )
+            for i, values in entries[subtype]:
+                pk = values[attname]
+                if pk is not None and pk not in existing:
+                    errors.append((i, attname, f"{pk} does not exist"))
+
+    for subtype, (fields, nulls_equal) in UNIQUE_SUBTYPE_FIELDS.items():
+        model = SUBTYPES[subtype][0]
+        keys = {}
+        for i, values in entries[subtype]:
+            key = tuple(values[x] for x in fields)
+            if None in key and not nulls_equal:
+                continue
+            if key in keys:
+                errors.append(
+                    (i, fields[0], f"duplicate of row {keys[key]}"))
+            keys.setdefault(key, i)
+        if not keys:
+            continue
+        q = Q()
+        for n, attname in enumerate(fields):
+            column = {key[n] for key in keys}
+            q_column = Q(**{f'{attname}__in': column - {None}})
+            if None in column:
+                q_column |= Q(**{f'{attname}__isnull': True})
+            q &= q_column
+        existing = model.objects.filter(q).values_list(
+            *fields, 'catalog_item_id')
+        for *key, pk in existing:
+            i = keys.get(tuple(key))
+            if i is not None and matches.get(i) != pk:
+                errors.append((i, fields[0], f"already used by item {pk}"))
+    return errors
+
+
+def import_catalog_items(rows: Iterable[dict]) -> ImportResult:
+    """Validates, matches and upserts one batch; rows with errors are skipped.
+    """
+
+    rows = [normalize(row) for row in rows]
+    result = ImportResult()
+    result.errors = validate(rows)
+    matches, match_errors = match_existing(rows)
+    result.errors += match_errors
+    result.errors += subtype_errors(rows, matches)
+    invalid = {i for i, _, _ in result.errors}
+    valid = [i for i in range(len(rows)) if i not in invalid]
+    existing = CatalogItem.objects.in_bulk(
+        {matches[i] for i in valid if i in matches})
+
+    items = []
+    for i in valid:
+        row = rows[i]
+        item = existing.get(matches.get(i)) or CatalogItem()
+        item.name = row['name']
+        item.subtype = row['subtype'] or item.subtype
+        for column in IDENTIFIERS:
+            if row[column] is not None:
+                setattr(item, column, row[column])
+        items.append(item)
+    result.updated = sum(1 for item in items if item.pk is not None)
+    result.created = len(items) - result.updated
+
+    with transaction.atomic():
+        # Items changing subtype lose the row of their previous one
+        for subtype, (model, _) in SUBTYPES.items():
+            model.objects.filter(
+                catalog_item__in=[
+                    item.pk for item in items
+                    if item.pk is not None and item.subtype != subtype
+                ]
+            ).delete()
+        CatalogItem.objects.bulk_create(
+            items,
+            update_conflicts=True,
+            unique_fields=['id'],
+            update_fields=['name', 'subtype', *IDENTIFIERS,
+                           'timestamp_modified'],
+        )
+        for subtype, (model, fields) in SUBTYPES.items():
+            subtype_objs = [
+                model(
+                    catalog_item_id=item.pk,
+                    **subtype_values(model, fields, rows[i])
+                )
+                for i, item in zip(valid, items)
+                if rows[i]['subtype'] == subtype
+            ]
+            if subtype_objs:
+                model.objects.bulk_create(
+                    subtype_objs,
+                    update_conflicts=True,
+                    unique_fields=['catalog_item'],
+                    update_fields=[
+                        *(model._meta.get_field(x).name for x in fields),
+                        'timestamp_modified',
+                    ],
+                )
+    return result
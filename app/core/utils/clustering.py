@@ -0,0 +1,215 @@
+"""Community detection and level of detail for large networks.
+
+A network is partitioned with weighted label propagation, then served as a
+coarse graph with one node per cluster; each cluster's members and internal
+edges are fetched when it's expanded. The partition is cached under the graph
+version, which changes whenever a table the network is built from does.
+"""
+
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+import hashlib
+import random
+from typing import Callable, Iterable
+
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Model
+
+from schemaviz.utils import Edge, Node, VisNetwork, edge_width
+
+CACHE_TIMEOUT = 60 * 60 * 24
+
+# Coarse graphs show at most this many clusters; the rest are pooled
+MAX_CLUSTERS = 300
+
+# Pooled clusters are split so none expands to more nodes than this
+MAX_POOLED_NODES = 500
+
+OTHER = 'other'
+
+
+def adjacency(vn: VisNetwork) -> dict[str, Counter]:
+    """Undirected, weighted adjacency; an edge without a value weighs 1."""
+
+    adjacent = {node_id: Counter() for node_id in vn.nodes}
+    for (from_, to), edges in vn.edges.items():
+        if from_ == to:
+            continue
+        weight = sum(edge.value or 1 for edge in edges)
+        adjacent[from_][to] += weight
+        adjacent[to][from_] += weight
+    return adjacent
+
+
+def label_propagation(
+        vn: VisNetwork,
+        max_iterations: int = 20,
+        seed: int = 0) -> dict[str, str]:
+    """Maps each node id to a cluster id.
+
+    Every node starts in its own cluster and repeatedly joins the cluster
+    with the most edge weight among its neighbours, until nothing changes.
+    Visiting order and ties are decided by `seed`, so results are stable.
+    """
+
+    rng = random.Random(seed)
+    adjacent = adjacency(vn)
+    labels = {node_id: node_id for node_id in adjacent}
+    order = sorted(adjacent)
+    for _ in range(max_iterations):
+        rng.shuffle(order)
+        changed = False
+        for node_id in order:
+            weights = Counter()
+            for neighbour, weight in adjacent[node_id].items():
+                weights[labels[neighbour]] += weight
+            if not weights:
+                continue
+            best = max(weights.values())
+            candidates = sorted(k for k, v in weights.items() if v == best)
+            if labels[node_id] in candidates:
+                continue
+            labels[node_id] = rng.choice(candidates)
+            changed = True
+        if not changed:
+            break
+    return labels
+
+
+@dataclass
+class Clustering:
+    network: VisNetwork
+    # Cluster id to member node ids, largest cluster first
+    clusters: dict[str, list[str]] = field(default_factory=dict)
+    # Node id to cluster id
+    assignments: dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def from_network(cls, vn: VisNetwork) -> 'Clustering':
+        members = defaultdict(list)
+        for node_id, label in label_propagation(vn).items():
+            members[label].append(node_id)
+        ranked = sorted(members.values(), key=lambda x: (-len(x), min(x)))
+        clusters = {}
+        pooled = []
+        for i, node_ids in enumerate(ranked):
+            if i < MAX_CLUSTERS:
+                clusters[str(i)] = sorted(node_ids)
+            else:
+                pooled += sorted(node_ids)
+        for i in range(0, len(pooled), MAX_POOLED_NODES):
+            clusters[f'{OTHER}-{i // MAX_POOLED_NODES}'] = (
+                pooled[i:i + MAX_POOLED_NODES])
+        assignments = {
+            node_id: cluster_id
+            for cluster_id, node_ids in clusters.items()
+            for node_id in node_ids
+        }
+        return cls(vn, clusters, assignments)
+
+    def cluster_node(self, cluster_id: str) -> Node:
+        node_ids = self.clusters[cluster_id]
+        if cluster_id.startswith(OTHER):
+            label = f'{len(node_ids)} others'
+        else:
+            # Named after its heaviest member
+            top = max(
+                (self.network.nodes[x] for x in node_ids),
+                key=lambda node: (node.mass or 0, node.label),
+            )
+            label = top.label
+            if len(node_ids) > 1:
+                label += f' +{len(node_ids) - 1}'
+        return Node(
+            id=f'cluster-{cluster_id}',
+            label=label,
+            group='cluster',
+            value=len(node_ids),
+        )
+
+    def coarse(self) -> VisNetwork:
+        """One node per cluster, linked by the weight between clusters."""
+
+        vn = VisNetwork()
+        for cluster_id in self.clusters:
+            vn.add_node(self.cluster_node(cluster_id))
+        weights = Counter()
+        for (from_, to), edges in self.network.edges.items():
+            a, b = self.assignments[from_], self.assignments[to]
+            if a != b:
+                weights[tuple(sorted((a, b)))] += sum(
+                    edge.value or 1 for edge in edges)
+        for (a, b), weight in weights.items():
+            from_, to = f'cluster-{a}', f'cluster-{b}'
+            vn.edges[(from_, to)].append(Edge(
+                from_=from_, to=to, value=weight, width=edge_width(weight)))
+        return vn
+
+    def expand(
+            self,
+            cluster_id: str,
+            expanded: Iterable[str] = ()) -> VisNetwork:
+        """Members and internal edges of one cluster.
+
+        Edges to members of the `expanded` clusters, already shown by
+        member, are kept as they are; edges to any other cluster are summed
+        into one edge to its cluster node.
+        """
+
+        members = set(self.clusters[cluster_id])
+        expanded = set(expanded) - {cluster_id}
+        vn = VisNetwork()
+        for node_id in self.clusters[cluster_id]:
+            vn.add_node(self.network.nodes[node_id])
+        for (from_, to), edges in self.network.edges.items():
+            if from_ in members and to in members:
+                vn.edges[(from_, to)] = edges
+            elif from_ in members or to in members:
+                outside = to if from_ in members else from_
+                if self.assignments[outside] in expanded:
+                    vn.edges[(from_, to)] = edges
+                    continue
+                inside = from_ if from_ in members else to
+                key = (inside, f'cluster-{self.assignments[outside]}')
+                weight = sum(edge.value or 1 for edge in edges)
+                if key in vn.edges:
+                    weight += vn.edges[key][0].value
+                vn.edges[key] = [Edge(
+                    from_=key[0], to=key[1],
+                    value=weight, width=edge_width(weight), dashes=True,
+                )]
+        return vn
+
+
+def graph_version(models: list[type[Model]]) -> str:
+    """Changes whenever a row of any of the models is added, removed or
+    modified; one query.
+    """
+
+    qn = connection.ops.quote_name
+    sql = ' UNION ALL '.join(
+        f"SELECT %s, COUNT(*), MAX(timestamp_modified)::text"
+        f" FROM {qn(model._meta.db_table)}"
+        for model in models
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [model._meta.label for model in models])
+        rows = sorted(cursor.fetchall())
+    return hashlib.md5(repr(rows).encode()).hexdigest()
+
+
+def get_clustering(
+        name: str,
+        build: Callable[[], VisNetwork],
+        models: list[type[Model]]) -> tuple[str, Clustering]:
+    """The cached clustering of a network and the version it's cached under.
+    """
+
+    version = graph_version(models)
+    key = f'core:clustering:{name}:{version}'
+    clustering = cache.get(key)
+    if clustering is None:
+        clustering = Clustering.from_network(build())
+        cache.set(key, clustering, CACHE_TIMEOUT)
+    return version, clustering
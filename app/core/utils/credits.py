@@ -0,0 +1,138 @@
+"""Everything a person is credited on, fetched in a fixed number of queries.
+
+get_credits() runs one values_list query per junction table for any number of
+persons, so the cost doesn't grow with how prolific someone is.
+"""
+
+from dataclasses import asdict, dataclass, field
+from typing import Callable, Iterable
+
+from django.db.models import Model
+from django.urls import reverse
+
+from core.models import (
+    MotionPictureXPerson,
+    MusicalInstrumentXPerson,
+    MusicAlbumXPerson,
+    MusicArtistXPerson,
+    PersonXPhoto,
+    PersonXSong,
+    PersonXSongArrangement,
+    PersonXSongPerformance,
+    PersonXVideoGame,
+)
+
+
+@dataclass(frozen=True)
+class CreditSource:
+    kind: str
+    title: str
+    model: type[Model]
+    # Foreign key from the junction to the credited object
+    target: str
+    # Lookup, relative to the junction, of the label shown
+    label: str
+    url: Callable[[int], str] | None = None
+
+
+def detail_url(url_name: str) -> Callable[[int], str]:
+    return lambda pk: reverse(url_name, args=[pk])
+
+
+SOURCES = (
+    CreditSource(
+        'music_artists', "Music Artists", MusicArtistXPerson,
+        'music_artist', 'music_artist__name',
+        detail_url('core:music-artist:detail'),
+    ),
+    CreditSource(
+        'music_albums', "Music Albums", MusicAlbumXPerson,
+        'music_album', 'music_album__title',
+        detail_url('core:music-album:detail'),
+    ),
+    CreditSource(
+        'songs', "Songs", PersonXSong, 'song', 'song__title',
+    ),
+    CreditSource(
+        'song_arrangements', "Arrangements", PersonXSongArrangement,
+        'song_arrangement', 'song_arrangement__title',
+    ),
+    CreditSource(
+        'song_performances', "Performances", PersonXSongPerformance,
+        'song_performance', 'song_performance__song_arrangement__title',
+        detail_url('core:song-performance:detail'),
+    ),
+    CreditSource(
+        'motion_pictures', "Motion Pictures", MotionPictureXPerson,
+        'motion_picture', 'motion_picture__title',
+    ),
+    CreditSource(
+        'video_games', "Video Games", PersonXVideoGame,
+        'video_game', 'video_game__title',
+    ),
+    CreditSource(
+        'musical_instruments', "Instruments", MusicalInstrumentXPerson,
+        'musical_instrument', 'musical_instrument__name',
+    ),
+    CreditSource(
+        'photos', "Photos", PersonXPhoto, 'photo', 'photo__short_description',
+        lambda pk: reverse('core:image', args=['photo', pk, 'small']),
+    ),
+)
+
+SOURCES_BY_KIND = {source.kind: source for source in SOURCES}
+
+
+@dataclass
+class Credit:
+    id: int
+    label: str
+    url: str | None = None
+
+
+@dataclass
+class CreditSection:
+    kind: str
+    title: str
+    credits: list[Credit] = field(default_factory=list)
+
+
+def get_credits(
+        person_ids: Iterable[int],
+        kinds: Iterable[str] | None = None,
+) -> dict[int, list[CreditSection]]:
+    """Maps each person to one section per credit kind, in SOURCES order.
+
+    Sections are present even when empty; credits are ordered by label.
+    """
+
+    person_ids = list(person_ids)
+    sources = SOURCES
+    if kinds is not None:
+        sources = [SOURCES_BY_KIND[kind] for kind in kinds]
+    credits = {
+        pk: {
+            source.kind: CreditSection(source.kind, source.title)
+            for source in sources
+        }
+        for pk in person_ids
+    }
+    for source in sources:
+        rows = (
+            source.model.objects
+            .filter(person_id__in=person_ids)
+            .order_by(source.label, f'{source.target}_id')
+            .values_list('person_id', f'{source.target}_id', source.label)
+        )
+        for person_id, pk, label in rows:
+            url = source.url(pk) if source.url else None
+            credits[person_id][source.kind].credits.append(
+                Credit(pk, label or str(pk), url))
+    return {pk: list(sections.values()) for pk, sections in credits.items()}
+
+
+def to_json(sections: list[CreditSection]) -> dict:
+    return {
+        section.kind: [asdict(credit) for credit in section.credits]
+        for section in sections
+    }
@@ -0,0 +1,214 @@
+"""Family tree traversal over PersonXPersonRelation.
+
+Relations are loaded with one values_list query into an adjacency index, kept
+per process and rebuilt only when the relation table changes. The index
+stores each fact once; inverses are inferred when read:
+
+- PARENT and MOTHER rows make A a parent of B; CHILD rows make B a parent of A
+- GRANDPARENT and GRANDCHILD rows link two generations when the parent in
+  between isn't recorded
+- SIBLING rows apply both ways, and siblings of siblings are siblings. A
+  group of recorded siblings shares its recorded parents; people who only
+  share one parent (half-siblings) are siblings without sharing the other
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+import threading
+
+from django.db.models import Count, Max
+
+from core.models import PersonXPersonRelation
+
+Relation = PersonXPersonRelation.Relation
+
+
+@dataclass
+class FamilyTree:
+    # Keyed by person pk
+    _parents: defaultdict[int, set] = field(
+        default_factory=lambda: defaultdict(set))
+    _children: defaultdict[int, set] = field(
+        default_factory=lambda: defaultdict(set))
+    _grandparents: defaultdict[int, set] = field(
+        default_factory=lambda: defaultdict(set))
+    _grandchildren: defaultdict[int, set] = field(
+        default_factory=lambda: defaultdict(set))
+    # Person pk to the pk representing their sibling group
+    _group: dict[int, int] = field(default_factory=dict)
+    _group_members: defaultdict[int, set] = field(
+        default_factory=lambda: defaultdict(set))
+
+    @classmethod
+    def from_rows(cls, rows) -> 'FamilyTree':
+        """Builds the index from (person_a, person_b, relation) rows."""
+
+        tree = cls()
+        siblings = []
+        for person_a, person_b, relation in rows:
+            if relation in (Relation.PARENT, Relation.MOTHER):
+                tree._add_parent(person_b, person_a)
+            elif relation == Relation.CHILD:
+                tree._add_parent(person_a, person_b)
+            elif relation == Relation.GRANDPARENT:
+                tree._add_grandparent(person_b, person_a)
+            elif relation == Relation.GRANDCHILD:
+                tree._add_grandparent(person_a, person_b)
+            elif relation == Relation.SIBLING:
+                siblings.append((person_a, person_b))
+        for person_a, person_b in siblings:
+            tree._join(person_a, person_b)
+        for pk in tree._group:
+            tree._group_members[tree._find(pk)].add(pk)
+        return tree
+
+    @classmethod
+    def load(cls) -> 'FamilyTree':
+        return cls.from_rows(
+            PersonXPersonRelation.objects
+            .values_list('person_a', 'person_b', 'relation')
+        )
+
+    def _add_parent(self, child: int, parent: int) -> None:
+        self._parents[child].add(parent)
+        self._children[parent].add(child)
+
+    def _add_grandparent(self, grandchild: int, grandparent: int) -> None:
+        self._grandparents[grandchild].add(grandparent)
+        self._grandchildren[grandparent].add(grandchild)
+
+    def _find(self, pk: int) -> int:
+        group = self._group.setdefault(pk, pk)
+        while group != self._group[group]:
+            self._group[group] = self._group[self._group[group]]
+            group = self._group[group]
+        return group
+
+    def _join(self, a: int, b: int) -> None:
+        self._group[self._find(a)] = self._find(b)
+
+    def _recorded_siblings(self, pk: int) -> set[int]:
+        if pk not in self._group:
+            return set()
+        return self._group_members[self._find(pk)] - {pk}
+
+    def parents(self, pk: int) -> set[int]:
+        """Recorded parents of the person and of their recorded siblings."""
+
+        parents = set(self._parents.get(pk, set()))
+        for sibling in self._recorded_siblings(pk):
+            parents |= self._parents.get(sibling, set())
+        return parents
+
+    def children(self, pk: int) -> set[int]:
+        children = set()
+        for child in self._children.get(pk, set()):
+            children |= self._recorded_siblings(child) | {child}
+        return children
+
+    def siblings(self, pk: int) -> set[int]:
+        """Recorded siblings and anyone sharing a parent."""
+
+        siblings = self._recorded_siblings(pk)
+        for parent in self.parents(pk):
+            siblings |= self.children(parent)
+        return siblings - {pk}
+
+    def _walk(self, pk: int, step, skip, max_depth) -> dict[int, int]:
+        """Generations reached through `step`, or two at a time via `skip`."""
+
+        found = {pk: 0}
+        levels = defaultdict(set, {1: step(pk), 2: set(skip.get(pk, ()))})
+        depth = 1
+        while levels and (max_depth is None or depth <= max_depth):
+            current = levels.pop(depth, set()) - found.keys()
+            for person in current:
+                found[person] = depth
+                levels[depth + 1] |= step(person)
+                levels[depth + 2] |= skip.get(person, set())
+            depth += 1
+        del found[pk]
+        return found
+
+    def ancestors(self, pk: int, max_depth: int = None) -> dict[int, int]:
+        """Maps each ancestor to their generation; parents are 1."""
+
+        return self._walk(pk, self.parents, self._grandparents, max_depth)
+
+    def descendants(self, pk: int, max_depth: int = None) -> dict[int, int]:
+        """Maps each descendant to their generation; children are 1."""
+
+        return self._walk(pk, self.children, self._grandchildren, max_depth)
+
+    def cousins(self, pk: int, degree: int = 1, removed: int = 0) -> set[int]:
+        """Nth cousins, optionally `removed` generations below.
+
+        Degree 0 gives siblings, or their descendants when removed. People
+        who share a closer common ancestor are excluded.
+        """
+
+        if degree == 0:
+            if removed == 0:
+                return self.siblings(pk)
+            return {
+                x for sibling in self.siblings(pk)
+                for x, depth in self.descendants(sibling, removed).items()
+                if depth == removed
+            } - {pk}
+        ancestors = self.ancestors(pk, degree + 1)
+        closer = {pk}
+        for ancestor, depth in ancestors.items():
+            if depth <= degree:
+                closer |= self.descendants(ancestor).keys()
+        generation = degree + 1 + removed
+        cousins = set()
+        for ancestor, depth in ancestors.items():
+            if depth == degree + 1:
+                cousins |= {
+                    x for x, d in self.descendants(ancestor, generation)
+                    .items()
+                    if d == generation
+                }
+        return cousins - closer
+
+    def relatives(self, pk: int) -> dict[int, str]:
+        """Immediate relatives, as "other is this person's ...".
+
+        Includes relations inferred from the inverse or symmetric side.
+        """
+
+        relatives = {}
+        for other in self._grandchildren.get(pk, set()):
+            relatives[other] = Relation.GRANDCHILD
+        for other in self._grandparents.get(pk, set()):
+            relatives[other] = Relation.GRANDPARENT
+        for other in self.siblings(pk):
+            relatives[other] = Relation.SIBLING
+        for other in self.children(pk):
+            relatives[other] = Relation.CHILD
+        for other in self.parents(pk):
+            relatives[other] = Relation.PARENT
+        return relatives
+
+
+_lock = threading.Lock()
+_cached: tuple[tuple, FamilyTree] | None = None
+
+
+def get_family_tree() -> FamilyTree:
+    """The index for the current relations, shared within the process.
+
+    A row count and the latest modification time decide whether to rebuild,
+    which catches edits made by other processes.
+    """
+
+    global _cached
+    version = tuple(
+        PersonXPersonRelation.objects
+        .aggregate(Count('pk'), Max('timestamp_modified'))
+        .values()
+    )
+    with _lock:
+        if _cached is None or _cached[0] != version:
+            _cached = (version, FamilyTree.load())
+        return _cached[1]
@@ -1,13 +1,32 @@
+"""Builders of VisNetworks from the relations between models.
+
+Most networks are a chain of junction tables from one kind of node to
+another, e.g. Person -> MusicAlbumXPerson -> MusicAlbum ->
+MusicAlbumXMusicArtist -> MusicArtist. Those are described with Chain and
+Hop; each hop is one values_list query, restricted by a subquery of the hop
+before it, and the hops are joined in Python with dictionaries. Chains that
+fan out are joined and counted in SQL instead. Networks that style edges from
+model instances are built by hand below.
+"""
+
 from collections import defaultdict
-import itertools
-from typing import Callable
+from dataclasses import dataclass
+from typing import Callable, NamedTuple
+
+from django.db import connection
+from django.db.models import Model, QuerySet
 
 from schemaviz.utils import Edge, Node, VisNetwork
 
 from core.models import (
+    MotionPictureXMusicAlbum,
     MotionPictureXPerson,
+    MotionPictureXSong,
+    MusicAlbumEdition,
+    MusicAlbumEditionXSongRecording,
     MusicAlbumXMusicArtist,
     MusicAlbumXPerson,
+    MusicAlbumXVideoGame,
     MusicArtistXPerson,
     MusicArtistXSong,
     MusicArtistXSongPerformance,
@@ -15,9 +34,41 @@ from core.models import (
     PersonXPersonRelationship,
     PersonXSong,
     PersonXSongPerformance,
-    PersonXVideoGame, MusicAlbumXVideoGame,
+    PersonXVideoGame,
+    SongPerformance,
+    SongRecording,
+    SongXSongArrangement,
 )
 
+# Label field of each kind of node, keyed by the foreign key name used for it
+NODE_LABELS = {
+    'motion_picture': 'title',
+    'music_album': 'title',
+    'music_artist': 'name',
+    'person': 'preferred_name',
+    'song': 'title',
+    'video_game': 'title',
+}
+
+
+def parse_as_of(value: str) -> int | tuple[int | None, int | None] | None:
+    """Reads an `as_of` parameter: "1999", "1990-1995", "1990-" or "-1995".
+
+    Returns None when the value is empty or malformed, including a range
+    that ends before it starts.
+    """
+
+    start, sep, end = value.strip().partition('-')
+    try:
+        if not sep:
+            return int(start) if start else None
+        as_of = (int(start) if start else None, int(end) if end else None)
+    except ValueError:
+        return None
+    if None not in as_of and as_of[0] > as_of[1]:
+        return None
+    return as_of if as_of != (None, None) else None
+
 
 def resolve_edge_kwargs(
         edge_kwargs: dict | Callable = None,
@@ -28,157 +79,297 @@ def resolve_edge_kwargs(
         return edge_kwargs
 
 
-def person_to_motion_picture(
-        edge_kwargs: dict | Callable = None,
-        accumulate_mass: bool = True,
-        accumulate_values: bool = True) -> VisNetwork:
-    vn = VisNetwork()
-    edge_kwargs = edge_kwargs or {}
-    qs = (
-        MotionPictureXPerson.objects
-        .select_related('motion_picture', 'person')
-    )
-    for edge in qs:
-        motion_picture = edge.motion_picture
-        motion_picture_node = Node.from_motion_picture(motion_picture)
-        motion_picture_node = vn.get_or_add_node(motion_picture_node)
-        person = edge.person
-        person_node = Node.from_person(person)
-        vn.add_node(person_node)
-        edge_key = (person_node.id, motion_picture_node.id)
-        if edge_key not in vn.edges:
-            kwargs = resolve_edge_kwargs(edge_kwargs, edge)
-            vn.edges[edge_key].append(Edge(
-                from_=person_node.id,
-                to=motion_picture_node.id,
+@dataclass(frozen=True)
+class Hop:
+    """One step through `model`, from the row `from_` names to `to`.
+
+    Either may be 'id' to step through a model that isn't a junction, e.g.
+    Hop(SongPerformance, 'song_arrangement', 'id').
+    """
+
+    model: type[Model]
+    from_: str
+    to: str
+
+    def column(self, name: str) -> str:
+        return self.model._meta.get_field(name).attname
+
+
+class ChainEdge(NamedTuple):
+    from_id: int
+    to_id: int
+    # Number of distinct paths between the two nodes
+    paths: int
+
+
+class Chain:
+    """Network between the first and last node kinds of a chain of hops.
+
+    When both ends are the same kind of node, e.g. artists who share an
+    album, the result is a projection: self-loops are dropped and each pair
+    is linked once.
+
+    With in_database, the hops are joined and grouped by pair in SQL instead,
+    and only the pairs with their path counts come back. That suits chains
+    that fan out, such as projections over compilation albums.
+    """
+
+    def __init__(self, *hops: Hop, in_database: bool = False):
+        self.hops = hops
+        self.from_group = hops[0].from_
+        self.to_group = hops[-1].to
+        self.in_database = in_database
+
+    @property
+    def is_projection(self) -> bool:
+        return self.from_group == self.to_group
+
+    def get_querysets(self) -> list[QuerySet]:
+        """One queryset per hop, each limited to rows the last one reached.
+        """
+
+        querysets = [self.hops[0].model.objects.order_by()]
+        for previous, hop in zip(self.hops, self.hops[1:]):
+            reached = querysets[-1].values(previous.column(previous.to))
+            querysets.append(
+                hop.model.objects.order_by()
+                .filter(**{f'{hop.column(hop.from_)}__in': reached})
+            )
+        return querysets
+
+    def resolve(self) -> tuple[dict, dict, dict]:
+        """Paths from each start to each end, plus the labels of both.
+
+        Returns ({(from_id, to_id): paths}, from labels, to labels).
+        """
+
+        if self.in_database:
+            return self.resolve_in_database()
+        first, last = self.hops[0], self.hops[-1]
+        querysets = self.get_querysets()
+        from_labels = {}
+        to_labels = {}
+        # Current node -> {start node: paths}
+        reached = defaultdict(lambda: defaultdict(int))
+        for i, (hop, qs) in enumerate(zip(self.hops, querysets)):
+            fields = [hop.column(hop.from_), hop.column(hop.to)]
+            if i == 0:
+                fields.append(f'{first.from_}__{NODE_LABELS[first.from_]}')
+            if i == len(self.hops) - 1:
+                fields.append(f'{last.to}__{NODE_LABELS[last.to]}')
+            following = defaultdict(lambda: defaultdict(int))
+            for row in qs.values_list(*fields):
+                from_id, to_id = row[:2]
+                if i == 0:
+                    from_labels[from_id] = row[2]
+                    starts = {from_id: 1}
+                else:
+                    starts = reached.get(from_id, {})
+                if i == len(self.hops) - 1 and starts:
+                    to_labels[to_id] = row[-1]
+                for start, paths in starts.items():
+                    following[to_id][start] += paths
+            reached = following
+        edges = {}
+        for to_id, starts in reached.items():
+            for from_id, paths in starts.items():
+                if self.is_projection:
+                    if from_id == to_id or from_id > to_id:
+                        continue
+                edges[(from_id, to_id)] = paths
+        return edges, from_labels, to_labels
+
+    def get_sql(self) -> str:
+        """SELECT of (from_id, to_id, paths), one row per pair."""
+
+        qn = connection.ops.quote_name
+        first, last = self.hops[0], self.hops[-1]
+
+        def column(i: int, name: str) -> str:
+            field = self.hops[i].model._meta.get_field(name)
+            return f'h{i}.{qn(field.column)}'
+
+        from_column = column(0, first.from_)
+        to_column = column(len(self.hops) - 1, last.to)
+        sql = (
+            f'SELECT {from_column}, {to_column}, COUNT(*)'
+            f' FROM {qn(first.model._meta.db_table)} h0'
+        )
+        for i, hop in enumerate(self.hops[1:], 1):
+            previous = self.hops[i - 1]
+            sql += (
+                f' JOIN {qn(hop.model._meta.db_table)} h{i}'
+                f' ON {column(i, hop.from_)} = {column(i - 1, previous.to)}'
+            )
+        if self.is_projection:
+            sql += f' WHERE {from_column} < {to_column}'
+        return sql + ' GROUP BY 1, 2'
+
+    def resolve_in_database(self) -> tuple[dict, dict, dict]:
+        with connection.cursor() as cursor:
+            cursor.execute(self.get_sql())
+            edges = {(a, b): paths for a, b, paths in cursor.fetchall()}
+        first, last = self.hops[0], self.hops[-1]
+        from_ids = {a for a, _ in edges}
+        to_ids = {b for _, b in edges}
+        if self.is_projection:
+            from_ids = to_ids = from_ids | to_ids
+        from_labels = self.get_labels(first, first.from_, from_ids)
+        to_labels = (
+            from_labels if self.is_projection
+            else self.get_labels(last, last.to, to_ids)
+        )
+        return edges, from_labels, to_labels
+
+    @staticmethod
+    def get_labels(hop: Hop, name: str, ids: set[int]) -> dict[int, str]:
+        model = hop.model._meta.get_field(name).related_model
+        return dict(
+            model.objects
+            .filter(pk__in=ids)
+            .values_list('pk', NODE_LABELS[name])
+        )
+
+    def build(
+            self,
+            edge_kwargs: dict | Callable = None,
+            accumulate_mass: bool = True,
+            accumulate_values: bool = True,
+            weighted: bool = False) -> VisNetwork:
+        """The network, with edges from the first kind to the last.
+
+        A callable edge_kwargs is passed a ChainEdge. Each edge adds 1 to the
+        mass of the node it points to. When weighted, each edge's value is
+        its number of paths, e.g. albums shared.
+        """
+
+        vn = VisNetwork()
+        edge_kwargs = edge_kwargs or {}
+        edges, from_labels, to_labels = self.resolve()
+        for (from_id, to_id), paths in edges.items():
+            from_node = vn.get_or_add_node(Node(
+                id=f'{self.from_group}-{from_id}',
+                label=from_labels[from_id],
+                group=self.from_group,
+            ))
+            to_node = vn.get_or_add_node(Node(
+                id=f'{self.to_group}-{to_id}',
+                label=to_labels[to_id],
+                group=self.to_group,
+            ))
+            kwargs = resolve_edge_kwargs(
+                edge_kwargs, ChainEdge(from_id, to_id, paths))
+            if weighted:
+                kwargs = {'value': paths, **kwargs}
+            vn.edges[(from_node.id, to_node.id)].append(Edge(
+                from_=from_node.id,
+                to=to_node.id,
                 **kwargs
             ))
             if accumulate_mass:
-                motion_picture_node.mass = motion_picture_node.mass or 1
-                motion_picture_node.mass += 1
+                to_node.mass = (to_node.mass or 0) + 1
             if accumulate_values:
-                motion_picture_node.value = motion_picture_node.mass
-    return vn
+                to_node.value = to_node.mass
+        return vn
+
+
+MUSIC_ARTIST_VIA_MUSIC_ALBUM = Chain(
+    Hop(MusicAlbumXMusicArtist, 'music_artist', 'music_album'),
+    Hop(MusicAlbumXMusicArtist, 'music_album', 'music_artist'),
+    in_database=True,
+)
+MUSIC_ARTIST_TO_VIDEO_GAME = Chain(
+    Hop(MusicAlbumXMusicArtist, 'music_artist', 'music_album'),
+    Hop(MusicAlbumXVideoGame, 'music_album', 'video_game'),
+)
+PERSON_TO_MOTION_PICTURE = Chain(
+    Hop(MotionPictureXPerson, 'person', 'motion_picture'),
+)
+PERSON_TO_MUSIC_ARTIST_VIA_MUSIC_ALBUM = Chain(
+    Hop(MusicAlbumXPerson, 'person', 'music_album'),
+    Hop(MusicAlbumXMusicArtist, 'music_album', 'music_artist'),
+)
+PERSON_TO_MUSIC_ARTIST_VIA_SONG = Chain(
+    Hop(PersonXSong, 'person', 'song'),
+    Hop(MusicArtistXSong, 'song', 'music_artist'),
+    in_database=True,
+)
+PERSON_TO_MUSIC_ARTIST_VIA_SONG_PERFORMANCE = Chain(
+    Hop(PersonXSongPerformance, 'person', 'song_performance'),
+    Hop(MusicArtistXSongPerformance, 'song_performance', 'music_artist'),
+    in_database=True,
+)
+PERSON_VIA_SONG = Chain(
+    Hop(PersonXSong, 'person', 'song'),
+    Hop(PersonXSong, 'song', 'person'),
+    in_database=True,
+)
+PERSON_VIA_SONG_PERFORMANCE = Chain(
+    Hop(PersonXSongPerformance, 'person', 'song_performance'),
+    Hop(PersonXSongPerformance, 'song_performance', 'person'),
+    in_database=True,
+)
+PERSON_TO_VIDEO_GAME = Chain(
+    Hop(PersonXVideoGame, 'person', 'video_game'),
+)
+
+
+def person_to_motion_picture(
+        edge_kwargs: dict | Callable = None,
+        accumulate_mass: bool = True,
+        accumulate_values: bool = True) -> VisNetwork:
+    return PERSON_TO_MOTION_PICTURE.build(
+        edge_kwargs, accumulate_mass, accumulate_values)
 
 
 def music_artist_via_music_album(
         edge_kwargs: dict | Callable = None) -> VisNetwork:
     """Networks where two or more artists worked on an album together.
 
-    Links the artists together.
+    Links the artists together, weighted by the number of albums shared.
     """
 
-    vn = VisNetwork()
-    edge_kwargs = edge_kwargs or {}
-    album_to_artist_map = defaultdict(list)
-    qs = (
-        MusicAlbumXMusicArtist.objects
-        .select_related('music_album', 'music_artist')
-        .order_by('music_artist_id')
-    )
-    for edge in qs:
-        album_to_artist_map[edge.music_album.pk].append(edge.music_artist)
-    for album, artists in album_to_artist_map.items():
-        artist_combinations = itertools.combinations(artists, 2)
-        for c in artist_combinations:
-            artist_a, artist_b = c[0], c[1]
-            node_a = Node.from_music_artist(artist_a)
-            vn.add_node(node_a)
-            node_b = Node.from_music_artist(artist_b)
-            vn.add_node(node_b)
-            edge_key = (node_a.id, node_b.id)
-            if edge_key not in vn.edges:
-                kwargs = resolve_edge_kwargs(edge_kwargs)
-                vn.edges[edge_key].append(Edge(
-                    from_=node_a.id,
-                    to=node_b.id,
-                    **kwargs
-                ))
-    return vn
+    return MUSIC_ARTIST_VIA_MUSIC_ALBUM.build(
+        edge_kwargs, accumulate_mass=False, accumulate_values=False,
+        weighted=True)
 
 
 def person_to_music_artist_via_music_album(
-        edge_kwargs: dict = None,
+        edge_kwargs: dict | Callable = None,
         accumulate_mass: bool = True,
         accumulate_values: bool = True) -> VisNetwork:
-    vn = VisNetwork()
-    edge_kwargs = edge_kwargs or {}
-    album_to_person_map = defaultdict(list)
-    qs = (
-        MusicAlbumXPerson.objects
-        .select_related('music_album', 'person')
-        .order_by('person_id')
-    )
-    for edge in qs:
-        album_to_person_map[edge.music_album.pk].append(edge.person)
-    qs = (
-        MusicAlbumXMusicArtist.objects
-        .select_related('music_album', 'music_artist')
-        .filter(music_album_id__in=album_to_person_map.keys())
-    )
-    for edge in qs:
-        music_artist = edge.music_artist
-        music_artist_node = Node.from_music_artist(music_artist)
-        music_artist_node = vn.get_or_add_node(music_artist_node)
-        for person in album_to_person_map.get(edge.music_album.pk, []):
-            person_node = Node.from_person(person)
-            vn.add_node(person_node)
-            edge_key = (person_node.id, music_artist_node.id)
-            if edge_key not in vn.edges:
-                vn.edges[edge_key].append(Edge(
-                    from_=person_node.id,
-                    to=music_artist_node.id,
-                    **edge_kwargs
-                ))
-                if accumulate_mass:
-                    music_artist_node.mass = music_artist_node.mass or 1
-                    music_artist_node.mass += 1
-                if accumulate_values:
-                    music_artist_node.value = music_artist_node.mass
-    return vn
+    return PERSON_TO_MUSIC_ARTIST_VIA_MUSIC_ALBUM.build(
+        edge_kwargs, accumulate_mass, accumulate_values)
 
 
 def music_album_x_video_game(
         edge_kwargs: dict | Callable = None) -> VisNetwork:
-    vn = VisNetwork()
-    edge_kwargs = edge_kwargs or {}
-    album_to_video_game_map = defaultdict(list)
-    qs = (
-        MusicAlbumXVideoGame.objects
-        .select_related('music_album', 'video_game')
-    )
-    for edge in qs:
-        album_to_video_game_map[edge.music_album.pk].append(edge.video_game)
-    qs = (
-        MusicAlbumXMusicArtist.objects
-        .select_related('music_album', 'music_artist')
-        .filter(music_album_id__in=album_to_video_game_map.keys())
-    )
-    for edge in qs:
-        music_artist = edge.music_artist
-        music_artist_node = Node.from_music_artist(music_artist)
-        music_artist_node = vn.get_or_add_node(music_artist_node)
-        for video_game in album_to_video_game_map.get(edge.music_album.pk, []):
-            video_game_node = Node.from_video_game(video_game)
-            vn.add_node(video_game_node)
-            edge_key = (music_artist_node.id, video_game_node.id)
-            if edge_key not in vn.edges:
-                kwargs = resolve_edge_kwargs(edge_kwargs, edge)
-                vn.edges[edge_key].append(Edge(
-                    from_=music_artist_node.id,
-                    to=video_game_node.id,
-                    **kwargs
-                ))
-    return vn
+    """Music artists linked to the video games their albums appear in."""
+
+    return MUSIC_ARTIST_TO_VIDEO_GAME.build(
+        edge_kwargs, accumulate_mass=False, accumulate_values=False)
 
 
 def person_to_music_artist(
         edge_kwargs: dict | Callable = None,
         accumulate_mass: bool = True,
-        accumulate_values: bool = True) -> VisNetwork:
+        accumulate_values: bool = True,
+        as_of=None) -> VisNetwork:
+    """Band memberships; `as_of` limits them to a year or (start, end).
+
+    Each edge has is_active annotated, so edge_kwargs can style by status
+    without a query per edge.
+    """
+
     vn = VisNetwork()
     edge_kwargs = edge_kwargs or {}
-    qs = MusicArtistXPerson.with_related.all()
+    qs = (
+        MusicArtistXPerson.objects
+        .with_is_active()
+        .select_related('music_artist', 'person')
+    )
+    if as_of is not None:
+        qs = qs.active_during(as_of)
     for edge in qs:
         music_artist = edge.music_artist
         music_artist_node = Node.from_music_artist(music_artist)
@@ -237,12 +428,15 @@ def person_x_person_relation(
 
 def person_x_person_relationship(
         queryset=None,
-        edge_kwargs: dict | Callable = None) -> VisNetwork:
+        edge_kwargs: dict | Callable = None,
+        as_of=None) -> VisNetwork:
     if not queryset:
         queryset = (
             PersonXPersonRelationship.objects
             .select_related('person_a', 'person_b')
         )
+    if as_of is not None:
+        queryset = queryset.active_during(as_of)
     return person_x_person(queryset, edge_kwargs)
 
 
@@ -250,119 +444,63 @@ def person_to_music_artist_via_song(
         edge_kwargs: dict | Callable = None,
         accumulate_mass: bool = True,
         accumulate_values: bool = True) -> VisNetwork:
-    vn = VisNetwork()
-    edge_kwargs = edge_kwargs or {}
-    song_to_person_map = defaultdict(list)
-    qs = (
-        PersonXSong.objects
-        .select_related('person', 'song')
-    )
-    for edge in qs:
-        song_to_person_map[edge.song.pk].append(edge.person)
-    qs = (
-        MusicArtistXSong.objects
-        .select_related('music_artist', 'song')
-        .filter(song_id__in=song_to_person_map.keys())
-    )
-    for edge in qs:
-        music_artist = edge.music_artist
-        music_artist_node = Node.from_music_artist(music_artist)
-        music_artist_node = vn.get_or_add_node(music_artist_node)
-        for person in song_to_person_map.get(edge.song.pk, []):
-            person_node = Node.from_person(person)
-            vn.add_node(person_node)
-            edge_key = (person_node.id, music_artist_node.id)
-            if edge_key not in vn.edges:
-                kwargs = resolve_edge_kwargs(edge_kwargs, edge)
-                vn.edges[edge_key].append(Edge(
-                    from_=person_node.id,
-                    to=music_artist_node.id,
-                    **kwargs
-                ))
-                if accumulate_mass:
-                    music_artist_node.mass = music_artist_node.mass or 0
-                    music_artist_node.mass += 1
-                if accumulate_values:
-                    music_artist_node.value = music_artist_node.mass
-    return vn
+    return PERSON_TO_MUSIC_ARTIST_VIA_SONG.build(
+        edge_kwargs, accumulate_mass, accumulate_values)
 
 
 def person_to_music_artist_via_song_performance(
         edge_kwargs: dict | Callable = None,
         accumulate_mass: bool = True,
         accumulate_values: bool = True) -> VisNetwork:
-    vn = VisNetwork()
-    edge_kwargs = edge_kwargs or {}
-    song_performance_to_person_map = defaultdict(list)
-    qs = (
-        PersonXSongPerformance.objects
-        .select_related('person', 'song_performance')
-    )
-    for edge in qs:
-        (
-            song_performance_to_person_map[edge.song_performance.pk]
-            .append(edge.person)
-        )
-    qs = (
-        MusicArtistXSongPerformance.objects
-        .select_related('music_artist', 'song_performance')
-        .filter(
-            song_performance_id__in=song_performance_to_person_map.keys()
-        )
-    )
-    for edge in qs:
-        music_artist = edge.music_artist
-        music_artist_node = Node.from_music_artist(music_artist)
-        music_artist_node = vn.get_or_add_node(music_artist_node)
-        persons = song_performance_to_person_map.get(
-            edge.song_performance.pk, [])
-        for person in persons:
-            person_node = Node.from_person(person)
-            vn.add_node(person_node)
-            edge_key = (person_node.id, music_artist_node.id)
-            if edge_key not in vn.edges:
-                kwargs = resolve_edge_kwargs(edge_kwargs, edge)
-                vn.edges[edge_key].append(Edge(
-                    from_=person_node.id,
-                    to=music_artist_node.id,
-                    **kwargs
-                ))
-                if accumulate_mass:
-                    music_artist_node.mass = music_artist_node.mass or 0
-                    music_artist_node.mass += 1
-                if accumulate_values:
-                    music_artist_node.value = music_artist_node.mass
-    return vn
+    return PERSON_TO_MUSIC_ARTIST_VIA_SONG_PERFORMANCE.build(
+        edge_kwargs, accumulate_mass, accumulate_values)
 
 
 def person_to_video_game(
         edge_kwargs: dict | Callable = None,
         accumulate_mass: bool = True,
         accumulate_values: bool = True) -> VisNetwork:
-    vn = VisNetwork()
-    edge_kwargs = edge_kwargs or {}
-    qs = (
-        PersonXVideoGame.objects
-        .select_related('person', 'video_game')
-    )
-    for edge in qs:
-        person = edge.person
-        person_node = Node.from_person(person)
-        vn.add_node(person_node)
-        video_game = edge.video_game
-        video_game_node = Node.from_video_game(video_game)
-        video_game_node = vn.get_or_add_node(video_game_node)
-        edge_key = (person_node.id, video_game_node.id)
-        if edge_key not in vn.edges:
-            kwargs = resolve_edge_kwargs(edge_kwargs, edge)
-            vn.edges[edge_key].append(Edge(
-                from_=person_node.id,
-                to=video_game_node.id,
-                **kwargs
-            ))
-            if accumulate_mass:
-                video_game_node.mass = video_game_node.mass or 0
-                video_game_node.mass += 1
-            if accumulate_values:
-                video_game_node.value = video_game_node.mass
-    return vn
+    return PERSON_TO_VIDEO_GAME.build(
+        edge_kwargs, accumulate_mass, accumulate_values)
+
+
+def person_via_song(edge_kwargs: dict | Callable = None) -> VisNetwork:
+    """Co-writers, weighted by the number of songs shared."""
+
+    return PERSON_VIA_SONG.build(
+        edge_kwargs, accumulate_mass=False, accumulate_values=False,
+        weighted=True)
+
+
+def person_via_song_performance(
+        edge_kwargs: dict | Callable = None) -> VisNetwork:
+    """People who performed together, weighted by performances shared."""
+
+    return PERSON_VIA_SONG_PERFORMANCE.build(
+        edge_kwargs, accumulate_mass=False, accumulate_values=False,
+        weighted=True)
+
+
+# Songs and what they're related to, for SongNetworkView
+SONG_NETWORK = (
+    Chain(Hop(MusicArtistXSong, 'music_artist', 'song')),
+    Chain(Hop(PersonXSong, 'person', 'song')),
+    Chain(Hop(MotionPictureXSong, 'motion_picture', 'song')),
+    Chain(
+        Hop(MusicAlbumEdition, 'music_album', 'id'),
+        Hop(MusicAlbumEditionXSongRecording,
+            'music_album_edition', 'song_recording'),
+        Hop(SongRecording, 'id', 'song_performance'),
+        Hop(SongPerformance, 'id', 'song_arrangement'),
+        Hop(SongXSongArrangement, 'song_arrangement', 'song'),
+    ),
+)
+
+# Albums and what they're related to, for MusicNetworkView
+MUSIC_NETWORK = (
+    Chain(Hop(MotionPictureXMusicAlbum, 'motion_picture', 'music_album')),
+    Chain(Hop(MusicAlbumXMusicArtist, 'music_artist', 'music_album')),
+    Chain(Hop(MusicAlbumXPerson, 'person', 'music_album')),
+    Chain(Hop(MusicAlbumXVideoGame, 'video_game', 'music_album')),
+    Chain(Hop(MusicArtistXPerson, 'person', 'music_artist')),
+)
@@ -0,0 +1,112 @@
+"""Site-wide search over names and titles.
+
+Each searchable model has a generated, GIN-indexed ``search_vector`` column
+and a trigram index on its name or title. A search runs one indexed query per
+model, combined with UNION ALL and ranked in the database, so type-ahead does
+not fall back to LIKE scans over every table.
+"""
+
+from dataclasses import dataclass
+import re
+
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    TrigramWordSimilarity,
+)
+from django.db.models import CharField, F, Model, Q, QuerySet, Value
+
+from core.models import (
+    Book,
+    CatalogItem,
+    MotionPicture,
+    MusicAlbum,
+    MusicArtist,
+    Person,
+    Song,
+    SongArrangement,
+    VideoGame,
+)
+
+
+@dataclass(frozen=True)
+class SearchTarget:
+    kind: str
+    model: type[Model]
+    label_field: str
+    # URL pattern name taking the primary key, if the model has a page
+    url_name: str = ''
+
+
+TARGETS = (
+    SearchTarget(
+        'music_artist', MusicArtist, 'name', 'core:music-artist:detail'),
+    SearchTarget(
+        'music_album', MusicAlbum, 'title', 'core:music-album:detail'),
+    SearchTarget('song', Song, 'title'),
+    SearchTarget('song_arrangement', SongArrangement, 'title'),
+    SearchTarget('person', Person, 'preferred_name', 'core:person:detail'),
+    SearchTarget('motion_picture', MotionPicture, 'title'),
+    SearchTarget('video_game', VideoGame, 'title'),
+    SearchTarget('book', Book, 'title'),
+    SearchTarget(
+        'catalog_item', CatalogItem, 'name', 'core:catalog-item:detail'),
+)
+
+TARGETS_BY_KIND = {x.kind: x for x in TARGETS}
+
+
+def build_query(text: str) -> SearchQuery | None:
+    """Every word must match, the last one as a prefix for type-ahead."""
+
+    terms = re.findall(r'\w+', text)
+    if not terms:
+        return None
+    terms[-1] += ':*'
+    return SearchQuery(' & '.join(terms), config='simple', search_type='raw')
+
+
+def target_queryset(
+        target: SearchTarget,
+        text: str,
+        query: SearchQuery,
+        limit: int,
+) -> QuerySet:
+    """Ranked (pk, kind, label, rank) rows for one model."""
+
+    similar = {f'{target.label_field}__trigram_word_similar': text}
+    return (
+        target.model.objects
+        .filter(Q(search_vector=query) | Q(**similar))
+        .annotate(
+            kind=Value(target.kind, output_field=CharField()),
+            label=F(target.label_field),
+            rank=(
+                SearchRank(F('search_vector'), query)
+                + TrigramWordSimilarity(text, target.label_field)
+            ),
+        )
+        .order_by('-rank')
+        .values_list('pk', 'kind', 'label', 'rank')[:limit]
+    )
+
+
+def search(
+        text: str,
+        kinds: list[str] | None = None,
+        limit: int = 20,
+) -> list[tuple[int, str, str, float]]:
+    """Returns up to `limit` (pk, kind, label, rank) rows, best first."""
+
+    query = build_query(text)
+    if query is None:
+        return []
+    targets = [x for x in TARGETS if not kinds or x.kind in kinds]
+    if not targets:
+        return []
+    first, *rest = [
+        target_queryset(target, text, query, limit) for target in targets
+    ]
+    if rest:
+        first = first.union(*rest, all=True).order_by('-rank')[:limit]
+    return list(first)
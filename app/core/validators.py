@@ -1,4 +1,6 @@
 __all__ = [
+    'gtin_check_digit',
+    'isbn_10_check_digit',
     'validate_isbn',
     'validate_isbn_13_check_digit',
 ]
@@ -17,6 +19,28 @@ validate_isbn = RegexValidator(
 )
 
 
+def gtin_check_digit(digits: str) -> int:
+    """Check digit for a GTIN (UPC-A, EAN-13, ISBN-13, ISMN) body.
+
+    Weights alternate 3 and 1 starting from the rightmost digit of the body,
+    which makes the same function work for every GTIN length.
+    """
+
+    digit_sum = sum(
+        int(d) * (3 if i % 2 == 0 else 1)
+        for i, d in enumerate(reversed(digits))
+    )
+    return (10 - digit_sum % 10) % 10
+
+
+def isbn_10_check_digit(digits: str) -> str:
+    """Check character for the first nine digits of an ISBN-10."""
+
+    digit_sum = sum(int(d) * (10 - i) for i, d in enumerate(digits))
+    check = (11 - digit_sum % 11) % 11
+    return 'X' if check == 10 else str(check)
+
+
 def validate_isbn_13_check_digit(value) -> None:
     """Validation using the ISBN algorithm.
 
@@ -28,13 +52,7 @@ def validate_isbn_13_check_digit(value) -> None:
     10 - 3 = 7  <-- check digit
     """
     value = str(value)
-    digit_sum = 0
-    for i, d in enumerate(value[:12]):
-        if i % 2 == 0:
-            digit_sum += int(d)
-        else:
-            digit_sum += 3 * int(d)
-    if int(value[-1]) != 10 - digit_sum % 10:
+    if int(value[-1]) != gtin_check_digit(value[:12]):
         raise ValidationError(
             _('ISBN-13 invalid check digit'),
             params={'value': value}
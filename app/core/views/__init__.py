@@ -1 +1 @@
-from . import beer, main, models, networks
+from . import autocomplete, beer, images, main, models, networks, search
@@ -0,0 +1,52 @@
+from django.core.exceptions import PermissionDenied
+from django.http import Http404, JsonResponse
+from django.views.decorators.http import require_safe
+
+from ..forms import fields
+from ..models import Person, Song, SongPerformance, SongRecording
+
+FIELDS = {
+    'person': (fields.PersonChoiceField, Person),
+    'song': (fields.SongChoiceField, Song),
+    'song-performance': (fields.SongPerformanceChoiceField, SongPerformance),
+    'song-recording': (fields.SongRecordingChoiceField, SongRecording),
+}
+
+PAGE_SIZE = 20
+
+
+@require_safe
+async def autocomplete(request, kind: str):
+    """Options for an AutocompleteChoiceField, in the format select2 expects.
+
+    `term` is matched as a case-insensitive prefix; `page` starts at 1.
+    """
+
+    if kind not in FIELDS:
+        raise Http404
+    user = await request.auser()
+    if not user.is_staff:
+        raise PermissionDenied
+    field_class, model = FIELDS[kind]
+    field = field_class(model.objects.all())
+    term = request.GET.get('term', '').strip()
+    try:
+        page = max(int(request.GET.get('page', 1)), 1)
+    except ValueError:
+        page = 1
+    offset = (page - 1) * PAGE_SIZE
+    # One extra row tells select2 whether there is another page
+    objs = [
+        obj async for obj in
+        field.search(term)[offset:offset + PAGE_SIZE + 1]
+    ]
+    return JsonResponse({
+        'results': [
+            {
+                'id': str(field.prepare_value(obj)),
+                'text': field.label_from_instance(obj),
+            }
+            for obj in objs[:PAGE_SIZE]
+        ],
+        'pagination': {'more': len(objs) > PAGE_SIZE},
+    })
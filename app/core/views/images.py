@@ -0,0 +1,92 @@
+import hashlib
+
+from django.core.files.base import ContentFile
+from django.db import IntegrityError, transaction
+from django.http import FileResponse, Http404
+from django.shortcuts import get_object_or_404
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.views.decorators.http import require_safe
+
+from core.models import MusicAlbumArtwork, Photo
+from core.models._utils import resize_image_data, resized_image_name
+
+MODELS = {
+    'music-album-artwork': MusicAlbumArtwork,
+    'photo': Photo,
+}
+
+# Versioned URLs (?v=<sha256>) never change content, so they can be cached
+# indefinitely. Anything else is revalidated against the ETag.
+MAX_AGE = 60 * 60 * 24 * 365
+
+
+def get_image_file(obj, size_name: str):
+    """Returns an open file for the given size, creating it when missing.
+
+    Sizes with a column on the model are stored there; sizes that only exist
+    in ImageSize are kept in storage next to the others, under the same naming
+    convention, and looked up by name.
+    """
+
+    if size_name == 'full':
+        return obj.image_full.open()
+    field = getattr(obj, f'image_{size_name}', None)
+    if field:
+        return field.open()
+    storage = obj.image_full.storage
+    file_name = resized_image_name(obj.image_full.name, size_name)
+    if not storage.exists(file_name):
+        dimensions = obj.ImageSize[size_name.upper()].value
+        with obj.image_full.open() as f:
+            content = f.read()
+        images = resize_image_data(
+            content, obj.image_full.name, [(size_name, dimensions)])
+        file_name, resized = images[f'image_{size_name}']
+        file_name = storage.save(file_name, ContentFile(resized))
+        if field is not None:
+            type(obj).objects.filter(pk=obj.pk).update(
+                **{f'image_{size_name}': file_name})
+    return storage.open(file_name)
+
+
+@require_safe
+def image(request, model_name: str, pk: int, size: str):
+    """Serves one size of a Photo or MusicAlbumArtwork.
+
+    Responds with 304 when If-None-Match matches the image digest.
+    """
+
+    model = MODELS.get(model_name)
+    if model is None:
+        raise Http404
+    size_name = size.lower()
+    if size_name != 'full' and size.upper() not in model.ImageSize.__members__:
+        raise Http404
+    obj = get_object_or_404(model, pk=pk)
+    if not obj.image_full:
+        raise Http404
+    sha256 = obj.image_full_sha256
+    if sha256 is None:
+        # Not yet backfilled; the digest is still needed for the ETag, and
+        # stored so the next request doesn't hash the file again
+        with obj.image_full.open() as f:
+            sha256 = hashlib.file_digest(f, 'sha256').hexdigest()
+        try:
+            with transaction.atomic():
+                model.objects.filter(
+                    pk=obj.pk, image_full_sha256__isnull=True
+                ).update(image_full_sha256=sha256)
+        except IntegrityError:
+            # The same image stored twice; backfill_images reports these
+            pass
+    etag = f'"{sha256}-{size_name}"'
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        response = FileResponse(get_image_file(obj, size_name))
+    response['ETag'] = etag
+    if request.GET.get('v') == sha256:
+        patch_cache_control(
+            response, public=True, max_age=MAX_AGE, immutable=True)
+    else:
+        patch_cache_control(response, public=True, no_cache=True)
+    return response
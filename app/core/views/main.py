@@ -1,8 +1,15 @@
-from django.db.models import Case, Count, F, Prefetch, Q, Sum, When
-from django.shortcuts import render
+import string
+
+from django.contrib.admin.views.decorators import staff_member_required
+from django.core.cache import cache
+from django.db.models import Case, Count, F, Prefetch, Q, QuerySet, When
+from django.db.models.functions import Left, Upper
+from django.shortcuts import get_object_or_404, render
+from django.utils.functional import SimpleLazyObject
 
 from django_ccbv import ListView, TemplateView
 
+from core.middleware import query_stats
 from core.models import (
     Account,
     MusicAlbum,
@@ -15,10 +22,40 @@ from core.models import (
 )
 
 
+MUSIC_ALBUM_INITIALS_KEY = 'core:music-album-initials'
+
+
+def lazy_details(objects: list, queryset: QuerySet) -> list:
+    """Sets `details` on each object: its row from `queryset`, loaded for
+    all of them the first time any is read.
+
+    Lists of cached fragments key on the objects and read details inside the
+    fragment, so a page of cache hits skips the joins and prefetches.
+    """
+
+    rows = SimpleLazyObject(
+        lambda: queryset.in_bulk([obj.pk for obj in objects]))
+    for obj in objects:
+        obj.details = SimpleLazyObject(lambda pk=obj.pk: rows[pk])
+    return objects
+
+
 def index(request):
     return render(request, 'core/main.html')
 
 
+@staff_member_required
+def query_stats_view(request):
+    """Query totals per view recorded by QueryBudgetMiddleware."""
+
+    view_stats = [
+        (view_name, stats, stats.duplicates.most_common(3))
+        for view_name, stats in query_stats.items()
+    ]
+    return render(
+        request, 'core/query-stats.html', {'view_stats': view_stats})
+
+
 class AccountListView(ListView):
     model = Account
     queryset = (
@@ -42,41 +79,27 @@ class AccountListView(ListView):
 
 
 class MusicAlbumRegisterView(TemplateView):
+    """Albums in title order, one page at a time.
+
+    Pages are keyed on (title, pk) of the last album shown, or the first
+    when going back, rather than an offset. Track listings are loaded per
+    album from MusicAlbumRegisterEditionsView.
+    """
+
+    paginate_by = 25
     template_name = 'core/music-album-register.html'
 
-    def get_context_data(self, **kwargs) -> dict:
-        context = super().get_context_data(**kwargs)
-        music_albums = (
+    def get_queryset(self):
+        return MusicAlbum.objects.order_by('title', 'pk')
+
+    def get_details_queryset(self):
+        """What the cached album fragments show; see lazy_details()."""
+
+        return (
             MusicAlbum.objects
             .select_related('cover_artwork')
+            .annotate(edition_count=Count('music_album_edition'))
             .prefetch_related(
-                Prefetch(
-                    'music_album_edition_set',
-                    queryset=(
-                        MusicAlbumEdition.objects
-                        .annotate(
-                            duration=Sum(
-                                'music_album_edition_x_song_recording'
-                                '__song_recording__duration'
-                            ),
-                            track_count=Count(
-                                'music_album_edition_x_song_recording'
-                            )
-                        )
-                        .prefetch_related(
-                            Prefetch(
-                                'music_album_edition_x_song_recording_set',
-                                queryset=(
-                                    MusicAlbumEditionXSongRecording.objects
-                                    .select_related(
-                                        'song_recording__song_performance__song_arrangement'
-                                    )
-                                    .order_by('disc_number', 'track_number')
-                                )
-                            )
-                        )
-                    )
-                ),
                 Prefetch(
                     'music_artists',
                     queryset=MusicArtist.objects.order_by('name')
@@ -89,18 +112,129 @@ class MusicAlbumRegisterView(TemplateView):
                     )
                 )
             )
-            .order_by('title')
         )
-        # TODO: Debug
-        music_albums = music_albums.filter(
-            Q(title__startswith='Chr')
-            | Q(title__startswith='Star O')
-            | Q(title__startswith='To F')
-            | Q(title__startswith='Under')
-            | Q(title__startswith='Valk')
-            | Q(title__startswith='X')
+
+    @staticmethod
+    def get_initials() -> set[str]:
+        """Title initials; cached until an album is saved or deleted."""
+
+        def initials() -> set[str]:
+            return set(
+                MusicAlbum.objects
+                .annotate(initial=Upper(Left('title', 1)))
+                .values_list('initial', flat=True)
+                .distinct()
+            )
+
+        return cache.get_or_set(MUSIC_ALBUM_INITIALS_KEY, initials, None)
+
+    @staticmethod
+    def get_cursor(pk: str) -> dict | None:
+        if not pk.isdigit():
+            return None
+        return MusicAlbum.objects.filter(pk=pk).values('title', 'pk').first()
+
+    @staticmethod
+    def before(cursor: dict) -> Q:
+        return (
+            Q(title__lt=cursor['title'])
+            | Q(title=cursor['title'], pk__lt=cursor['pk'])
+        )
+
+    @staticmethod
+    def after(cursor: dict) -> Q:
+        return (
+            Q(title__gt=cursor['title'])
+            | Q(title=cursor['title'], pk__gt=cursor['pk'])
+        )
+
+    def get_context_data(self, **kwargs) -> dict:
+        context = super().get_context_data(**kwargs)
+        music_albums = self.get_queryset()
+        letter = self.request.GET.get('letter', '').upper()[:1]
+        before = self.get_cursor(self.request.GET.get('before', ''))
+        after = self.get_cursor(self.request.GET.get('after', ''))
+        if before:
+            # Seek backwards on the (title, pk) index, then flip the page
+            music_albums = list(
+                music_albums
+                .filter(self.before(before))
+                .order_by('-title', '-pk')[:self.paginate_by + 1]
+            )
+            has_previous = len(music_albums) > self.paginate_by
+            music_albums = music_albums[:self.paginate_by][::-1]
+            has_next = True
+        else:
+            if after:
+                music_albums = music_albums.filter(self.after(after))
+            elif letter.isalpha():
+                # Initials are case-insensitive, the title order may not be;
+                # start from the first album with the initial instead
+                first = (
+                    MusicAlbum.objects
+                    .filter(title__istartswith=letter)
+                    .order_by('title', 'pk')
+                    .values('title', 'pk')
+                    .first()
+                )
+                if first:
+                    music_albums = music_albums.filter(
+                        self.after(first) | Q(pk=first['pk']))
+                else:
+                    music_albums = music_albums.none()
+            music_albums = list(music_albums[:self.paginate_by + 1])
+            has_next = len(music_albums) > self.paginate_by
+            music_albums = music_albums[:self.paginate_by]
+            has_previous = bool(after)
+            if letter.isalpha() and not after and music_albums:
+                first = music_albums[0]
+                has_previous = MusicAlbum.objects.filter(
+                    self.before({'title': first.title, 'pk': first.pk})
+                ).exists()
+        initials = self.get_initials()
+        context.update({
+            'letters': [
+                (x, x in initials) for x in string.ascii_uppercase
+            ],
+            'music_albums': lazy_details(
+                music_albums, self.get_details_queryset()),
+            'next_after': (
+                music_albums[-1].pk if has_next and music_albums else None),
+            'previous_before': (
+                music_albums[0].pk if has_previous and music_albums else None),
+        })
+        return context
+
+
+class MusicAlbumRegisterEditionsView(TemplateView):
+    """HTML fragment of one album's editions and their tracks."""
+
+    template_name = 'core/_music-album-register--editions.html'
+
+    def get_context_data(self, **kwargs) -> dict:
+        context = super().get_context_data(**kwargs)
+        music_album = get_object_or_404(MusicAlbum, pk=kwargs['pk'])
+        editions = (
+            MusicAlbumEdition.objects
+            .filter(music_album=music_album)
+            .prefetch_related(
+                Prefetch(
+                    'music_album_edition_x_song_recording_set',
+                    queryset=(
+                        MusicAlbumEditionXSongRecording.objects
+                        .select_related(
+                            'song_recording__song_performance__song_arrangement'
+                        )
+                        .order_by('disc_number', 'track_number')
+                    )
+                )
+            )
+            .order_by('pk')
         )
-        context['music_albums'] = music_albums
+        context.update({
+            'editions': editions,
+            'music_album': music_album,
+        })
         return context
 
 
@@ -112,10 +246,14 @@ class TxnRegisterView(TemplateView):
         account = (
             Account.objects.get(pk=kwargs['account_pk'])
         )
-        # Still have to do a prefetch related
-        txns = (
+        txns = list(
             Txn.objects
             .filter(line_items__account=account)
+            .order_by('-txn_date')
+        )
+        # Read inside the cached fragments only
+        lazy_details(txns, (
+            Txn.objects
             .prefetch_related(
                 Prefetch(
                     'line_items',
@@ -126,8 +264,7 @@ class TxnRegisterView(TemplateView):
                 )
             )
             .select_related('payee')
-            .order_by('-txn_date')
-        )
+        ))
         line_items = (
             TxnLineItem.objects
             .filter(account=account)
@@ -5,6 +5,7 @@ from .main import (
     PersonDetailView,
     PersonListView,
     VehicleListView,
+    person_credits,
 )
 from .account import (
     AccountListView,
@@ -12,6 +13,7 @@ from .account import (
 from .catalog_item import (
     CatalogItemDetailView,
     CatalogItemListView,
+    catalog_item_facets,
 )
 from .music_artist import (
     MusicArtistDetailView,
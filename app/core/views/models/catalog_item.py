@@ -1,3 +1,9 @@
+import json
+import math
+
+from django.http import JsonResponse
+from django.views.decorators.http import require_safe
+
 from django_ccbv import DetailView, ListView
 
 from core.models import CatalogItem
@@ -11,3 +17,42 @@ class CatalogItemListView(ListView):
 class CatalogItemDetailView(DetailView):
     model = CatalogItem
     template_name = 'core/models/catalog-item--detail.html'
+
+
+def _json_values(values: list[str]) -> list:
+    """Facet values are text; "5" and "true" also match JSON 5 and true."""
+
+    matches = []
+    for value in values:
+        matches.append(value)
+        try:
+            parsed = json.loads(value)
+        except ValueError:
+            continue
+        # NaN and Infinity aren't valid in jsonb
+        if isinstance(parsed, bool) or (
+                isinstance(parsed, (int, float)) and math.isfinite(parsed)):
+            matches.append(parsed)
+    return matches
+
+
+@require_safe
+def catalog_item_facets(request):
+    """Attribute value counts over the matching CatalogItems, as JSON.
+
+    Parameters named `eav.<key>` filter on attribute values (repeat one to
+    match any of its values); `key` (repeatable) restricts the facets
+    returned.
+    """
+
+    qs = CatalogItem.objects.all()
+    for param in request.GET:
+        if param.startswith('eav.') and len(param) > 4:
+            values = request.GET.getlist(param)
+            # Containment, which the catalog_item_eav GIN index serves
+            qs = qs.with_any_attribute_value(param[4:], _json_values(values))
+    keys = request.GET.getlist('key') or None
+    return JsonResponse({
+        'count': qs.count(),
+        'facets': qs.attribute_facets(keys),
+    })
@@ -1,8 +1,12 @@
-from django.db.models import Prefetch
+from django.http import JsonResponse
+from django.shortcuts import get_object_or_404
+from django.utils.functional import SimpleLazyObject
+from django.views.decorators.http import require_safe
 
 from django_ccbv.views.generic import DetailView, ListView
 
 from core.models import *
+from core.utils import credits
 
 
 class MusicAlbumListView(ListView):
@@ -36,22 +40,36 @@ class PersonListView(ListView):
 
 class PersonDetailView(DetailView):
     model = Person
-    queryset = (
-        Person.objects
-        .select_related('featured_photo__photo')
-        .prefetch_related(
-            Prefetch(
-                'music_albums',
-                queryset=MusicAlbum.objects.order_by('title')
-            ),
-            Prefetch(
-                'music_artists',
-                queryset=MusicArtist.objects.order_by('name')
-            )
-        )
-    )
+    queryset = Person.objects.select_related('featured_photo__photo')
     template_name = 'core/models/person--detail.html'
 
+    def get_context_data(self, **kwargs) -> dict:
+        context = super().get_context_data(**kwargs)
+        pk = self.object.pk
+        # Lazy, so a cached page doesn't fetch them
+        context['credits'] = SimpleLazyObject(
+            lambda: credits.get_credits([pk])[pk])
+        return context
+
+
+@require_safe
+def person_credits(request, pk: int):
+    """Every credit of a person as JSON, grouped by kind.
+
+    `kind` (repeatable) restricts the kinds returned.
+    """
+
+    person = get_object_or_404(Person, pk=pk)
+    kinds = request.GET.getlist('kind') or None
+    if kinds and not set(kinds) <= credits.SOURCES_BY_KIND.keys():
+        return JsonResponse({'error': "unknown kind"}, status=400)
+    sections = credits.get_credits([person.pk], kinds)[person.pk]
+    return JsonResponse({
+        'id': person.pk,
+        'preferred_name': person.preferred_name,
+        'credits': credits.to_json(sections),
+    })
+
 
 class VehicleListView(ListView):
     model = Vehicle
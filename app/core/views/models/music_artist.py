@@ -1,17 +1,42 @@
+from django.utils import timezone
+
 from django_ccbv import DetailView, ListView
 
-from core.models import MusicArtist
+from core.models import MusicArtist, MusicArtistXPerson, Person
+from core.utils.network import parse_as_of
 
 
 class MusicArtistListView(ListView):
     model = MusicArtist
     ordering = ('name',)
     paginate_by = 50
-    queryset = MusicArtist.with_related
+    queryset = MusicArtist.for_list
     template_name = 'core/models/music-artist--list.html'
 
 
 class MusicArtistDetailView(DetailView):
+    """`as_of` (a year or "start-end") limits personnel to that period."""
+
     model = MusicArtist
     queryset = MusicArtist.with_related
     template_name = 'core/models/music-artist--detail.html'
+
+    def get_context_data(self, **kwargs) -> dict:
+        context = super().get_context_data(**kwargs)
+        as_of = parse_as_of(self.request.GET.get('as_of', ''))
+        personnel = self.object.personnel.all()
+        if as_of is not None:
+            memberships = (
+                MusicArtistXPerson.objects
+                .filter(music_artist=self.object)
+                .active_during(as_of)
+            )
+            personnel = Person.objects.filter(
+                pk__in=memberships.values('person'))
+        context.update({
+            'as_of': as_of,
+            'personnel': personnel,
+            # Membership status depends on it; part of the cache key
+            'year': timezone.now().year,
+        })
+        return context
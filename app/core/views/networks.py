@@ -1,3 +1,8 @@
+from django.http import Http404, JsonResponse
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from django.views.decorators.http import require_safe
+
 from django_ccbv.views import TemplateView
 
 from schemaviz import (
@@ -13,9 +18,35 @@ from schemaviz import (
 )
 
 from ..models import (
+    MotionPicture,
+    MotionPictureXPerson,
+    MusicAlbum,
+    MusicAlbumXMusicArtist,
     MusicAlbumXMusicTag,
+    MusicAlbumXPerson,
+    MusicAlbumXVideoGame,
+    MusicArtist,
+    MusicArtistActivity,
+    MusicArtistXPerson,
+    MusicArtistXPersonActivity,
+    MusicArtistXSong,
+    MusicArtistXSongPerformance,
+    Person,
+    PersonXPersonRelation,
+    PersonXSong,
+    PersonXSongPerformance,
+    PersonXVideoGame,
+    VideoGame,
 )
-from ..utils import network
+from ..utils import clustering, genealogy, network
+
+
+def serialize(request, vn: VisNetwork) -> dict:
+    """VisNetwork.to_compact(), or to_json() when ?transport=json."""
+
+    if request.GET.get('transport') == 'json':
+        return vn.to_json()
+    return vn.to_compact()
 
 
 class NetworkIndex(TemplateView):
@@ -35,23 +66,67 @@ class MusicNetworkView(TemplateView):
 
     def get_context_data(self, **kwargs) -> dict:
         context = super().get_context_data(**kwargs)
+        vis_data = VisNetwork()
+        for chain in network.MUSIC_NETWORK:
+            vis_data.extend(chain.build())
+        context.update({
+            'vis_data': serialize(self.request, vis_data),
+            'vis_options': VisOptions().to_dict(),
+        })
         return context
 
 
 class FilmGamesAndMusicNetworkView(TemplateView):
+    """People, artists, films and games together.
+
+    Past `max_nodes`, the clusters of the network are shown instead, and
+    each is expanded through film_games_and_music_cluster.
+    """
+
     template_name = 'core/network.html'
+    max_nodes = 1000
+    # Tables the network is built from, for its cache version
+    models = [
+        MotionPicture, MotionPictureXPerson, MusicAlbum,
+        MusicAlbumXMusicArtist, MusicAlbumXPerson, MusicAlbumXVideoGame,
+        MusicArtist, MusicArtistActivity, MusicArtistXPerson,
+        MusicArtistXPersonActivity, MusicArtistXSong,
+        MusicArtistXSongPerformance, Person, PersonXSong,
+        PersonXSongPerformance, PersonXVideoGame, VideoGame,
+    ]
+
+    @staticmethod
+    def build_network() -> VisNetwork:
+        # Parallel edges from different sources are merged into one edge
+        vis_data = VisNetwork()
+        for source, builder in (
+                ("Film", network.person_to_motion_picture),
+                ("Member", network.person_to_music_artist),
+                ("Shared album", network.music_artist_via_music_album),
+                ("Album", network.person_to_music_artist_via_music_album),
+                ("Game", network.music_album_x_video_game),
+                ("Song", network.person_to_music_artist_via_song),
+                ("Performance",
+                 network.person_to_music_artist_via_song_performance),
+                ("Game", network.person_to_video_game),
+        ):
+            vis_data.extend(builder(), aggregate_edges=True, source=source)
+        return vis_data
+
+    @classmethod
+    def get_clustering(cls) -> clustering.Clustering:
+        _, result = clustering.get_clustering(
+            'film-games-and-music', cls.build_network, cls.models)
+        return result
 
     def get_context_data(self, **kwargs) -> dict:
         context = super().get_context_data(**kwargs)
-        vis_data = network.person_to_motion_picture()
-        vis_data.extend(network.person_to_music_artist())
-        vis_data.extend(network.music_artist_via_music_album())
-        vis_data.extend(
-            network.person_to_music_artist_via_music_album())
-        vis_data.extend(network.music_album_x_video_game())
-        vis_data.extend(network.person_to_music_artist_via_song())
-        vis_data.extend(network.person_to_music_artist_via_song_performance())
-        vis_data.extend(network.person_to_video_game())
+        clusters = self.get_clustering()
+        vis_data = clusters.network
+        if len(vis_data.nodes) > self.max_nodes:
+            vis_data = clusters.coarse()
+            context['cluster_url'] = reverse(
+                'core:film-games-and-music-cluster', args=['__cluster__'])
 
         vis_options = VisOptions(
             nodes=NodeOptions(
@@ -70,12 +145,25 @@ class FilmGamesAndMusicNetworkView(TemplateView):
             )
         )
         context.update({
-            'vis_data': vis_data.to_json(),
+            'vis_data': serialize(self.request, vis_data),
             'vis_options': vis_options.to_dict()
         })
         return context
 
 
+@require_safe
+def film_games_and_music_cluster(request, cluster_id: str):
+    """Members and edges of one cluster of FilmGamesAndMusicNetworkView."""
+
+    clusters = FilmGamesAndMusicNetworkView.get_clustering()
+    if cluster_id not in clusters.clusters:
+        raise Http404("No such cluster")
+    # Clusters the client already shows by member, e.g. ?expanded=3,12
+    expanded = request.GET.get('expanded', '').split(',')
+    return JsonResponse(serialize(
+        request, clusters.expand(cluster_id, expanded)))
+
+
 class MusicArtistNetworkView(TemplateView):
     """Explores edges that relate Music Artists to people.
 
@@ -97,8 +185,10 @@ class MusicArtistNetworkView(TemplateView):
 
     def get_context_data(self, **kwargs) -> dict:
         context = super().get_context_data(**kwargs)
+        as_of = network.parse_as_of(self.request.GET.get('as_of', ''))
         vis_data = network.person_to_music_artist(
-            edge_kwargs=self.get_music_artist_x_person_edge_kwargs
+            edge_kwargs=self.get_music_artist_x_person_edge_kwargs,
+            as_of=as_of,
         )
         vis_data.extend(network.music_artist_via_music_album(
             edge_kwargs={
@@ -132,7 +222,7 @@ class MusicArtistNetworkView(TemplateView):
             ),
         )
         context.update({
-            'vis_data': vis_data.to_json(),
+            'vis_data': serialize(self.request, vis_data),
             'vis_options': vis_options.to_dict(),
         })
         return context
@@ -170,7 +260,7 @@ class MusicTagNetworkView(TemplateView):
                 to=music_tag_key,
             ))
         context.update({
-            'vis_data': vn.to_json(),
+            'vis_data': serialize(self.request, vn),
         })
         return context
 
@@ -214,15 +304,100 @@ class PersonRelationView(TemplateView):
             edge_kwargs=self.get_person_x_person_relation_edge_kwargs)
         vis_data.extend(
             network.person_x_person_relationship(
-                edge_kwargs=self.get_person_x_person_relationship_edge_kwargs
+                edge_kwargs=self.get_person_x_person_relationship_edge_kwargs,
+                as_of=network.parse_as_of(self.request.GET.get('as_of', '')),
             ), allow_duplicate_edges=True)
-        context['vis_data'] = vis_data.to_json()
+        context['vis_data'] = serialize(self.request, vis_data)
+        return context
+
+
+class PersonFamilyTreeView(TemplateView):
+    """Family of one person, up to `generations` above and below.
+
+    Built from the cached family tree index rather than the full edge dump,
+    so only the people shown are fetched.
+    """
+
+    template_name = 'core/network.html'
+    default_generations = 2
+    max_generations = 4
+
+    def get_generations(self) -> int:
+        try:
+            generations = int(self.request.GET.get('generations', ''))
+        except ValueError:
+            return self.default_generations
+        return max(1, min(generations, self.max_generations))
+
+    def get_context_data(self, **kwargs) -> dict:
+        context = super().get_context_data(**kwargs)
+        person = get_object_or_404(Person, pk=self.kwargs['pk'])
+        generations = self.get_generations()
+        tree = genealogy.get_family_tree()
+        members = {person.pk} | tree.siblings(person.pk)
+        members |= tree.ancestors(person.pk, generations).keys()
+        members |= tree.descendants(person.pk, generations).keys()
+
+        vn = VisNetwork()
+        for member in Person.objects.filter(pk__in=members):
+            node = Node.from_person(member)
+            if member.pk == person.pk:
+                node.mass = 3
+                node.value = 3
+            vn.add_node(node)
+        for member in members:
+            member_id = f'person-{member}'
+            for other, relation in tree.relatives(member).items():
+                other_id = f'person-{other}'
+                if other not in members or (
+                        relation == PersonXPersonRelation.Relation.SIBLING
+                        and other < member):
+                    continue
+                if relation in (
+                        PersonXPersonRelation.Relation.PARENT,
+                        PersonXPersonRelation.Relation.GRANDPARENT):
+                    vn.edges[(other_id, member_id)] = [Edge(
+                        from_=other_id,
+                        to=member_id,
+                        arrows='to',
+                        **self.get_person_x_person_relation_edge_kwargs(
+                            relation),
+                    )]
+                elif relation == PersonXPersonRelation.Relation.SIBLING:
+                    vn.edges[(member_id, other_id)] = [Edge(
+                        from_=member_id,
+                        to=other_id,
+                        **self.get_person_x_person_relation_edge_kwargs(
+                            relation),
+                    )]
+        context.update({
+            'person': person,
+            'vis_data': serialize(self.request, vn),
+            'vis_options': VisOptions().to_dict(),
+        })
         return context
 
+    @staticmethod
+    def get_person_x_person_relation_edge_kwargs(relation) -> dict:
+        if relation == PersonXPersonRelation.Relation.SIBLING:
+            return {'color': EdgeColor(color='#BB0000'), 'width': 2}
+        if relation == PersonXPersonRelation.Relation.GRANDPARENT:
+            return {'color': EdgeColor(color='#4488FF'), 'dashes': True}
+        return {'color': EdgeColor(color='#4488FF'), 'width': 3}
+
 
 class SongNetworkView(TemplateView):
+    """Songs and their artists, writers, films and albums."""
+
     template_name = 'core/network.html'
 
     def get_context_data(self, **kwargs) -> dict:
         context = super().get_context_data(**kwargs)
+        vis_data = VisNetwork()
+        for chain in network.SONG_NETWORK:
+            vis_data.extend(chain.build())
+        context.update({
+            'vis_data': serialize(self.request, vis_data),
+            'vis_options': VisOptions().to_dict(),
+        })
         return context
@@ -0,0 +1,35 @@
+from django.http import JsonResponse
+from django.urls import reverse
+from django.views.decorators.http import require_safe
+
+from ..utils import search as search_utils
+
+MAX_LIMIT = 50
+
+
+@require_safe
+def search(request):
+    """Ranked matches across all searchable models, as JSON.
+
+    `q` is the search text; `kind` (repeatable) restricts the models searched
+    and `limit` caps the number of results.
+    """
+
+    text = request.GET.get('q', '').strip()
+    kinds = request.GET.getlist('kind')
+    try:
+        limit = min(int(request.GET.get('limit', 20)), MAX_LIMIT)
+    except ValueError:
+        limit = 20
+    results = []
+    if len(text) >= 2 and limit > 0:
+        for pk, kind, label, rank in search_utils.search(text, kinds, limit):
+            url_name = search_utils.TARGETS_BY_KIND[kind].url_name
+            results.append({
+                'id': pk,
+                'kind': kind,
+                'label': label,
+                'rank': round(rank, 4),
+                'url': reverse(url_name, args=[pk]) if url_name else None,
+            })
+    return JsonResponse({'results': results})
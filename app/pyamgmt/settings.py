@@ -55,6 +55,7 @@ INSTALLED_APPS = [
     'django.contrib.contenttypes',
     'django.contrib.sessions',
     'django.contrib.messages',
+    'django.contrib.postgres',
     'django.contrib.staticfiles',
     # Third-party apps
     'debug_toolbar',
@@ -102,6 +103,14 @@ LOGGING = {
 
 LOGIN_REDIRECT_URL = '/'
 
+# See core.middleware
+QUERY_BUDGET = {
+    'MAX_QUERIES': 50,
+    'MAX_DURATION': 0.5,
+    'MAX_DUPLICATES': 5,
+    'VIEWS': {},
+}
+
 # env
 MEDIA_ROOT = Path.home() / 'var' / 'www' / 'pyamgmt' / 'media'
 
@@ -110,6 +119,7 @@ MEDIA_URL = '/media/'
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'core.middleware.QueryBudgetMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     # 'django.middleware.locale.LocaleMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -173,6 +183,14 @@ ARANGO_URL = f'{ARANGO_HOST}:{ARANGO_PORT}/'
 
 ASSET_URL = env.ASSET_URL
 
+# See schemaviz.utils.get_apps_dataset
+SCHEMAVIZ = {
+    # Build the schema graph when the process starts, not on first request
+    'PRECOMPUTE': False,
+    # Written by the schemaviz_dataset command; ignored once out of date
+    'DATASET_PATH': None,
+}
+
 STATIC_RESOURCES = {}
 
 VITE_CLIENT_URL = env.VITE_CLIENT_URL if DEBUG else ''
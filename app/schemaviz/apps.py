@@ -1,6 +1,12 @@
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class SchemavizConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'schemaviz'
+
+    def ready(self) -> None:
+        if getattr(settings, 'SCHEMAVIZ', {}).get('PRECOMPUTE'):
+            from .utils import get_apps_dataset
+            get_apps_dataset()
@@ -0,0 +1,33 @@
+"""Precomputes the schema graph served by schemaviz.views.MainView.
+
+Run after migrating, e.g. as part of a deploy; processes then read the file
+instead of walking every model. A file from an older migration state is
+ignored, so a stale one only costs the rebuild it was meant to save.
+"""
+
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from schemaviz.utils import dataset_path, write_apps_dataset
+
+
+class Command(BaseCommand):
+    help = "Writes the schemaviz dataset to a static JSON file."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            'path', nargs='?', type=Path,
+            help="Defaults to SCHEMAVIZ['DATASET_PATH'].",
+        )
+
+    def handle(self, *args, **options) -> None:
+        path = options['path'] or dataset_path()
+        if path is None:
+            raise CommandError(
+                "No path given and SCHEMAVIZ['DATASET_PATH'] is not set")
+        data = write_apps_dataset(path)
+        self.stdout.write(
+            f"Wrote {len(data['nodes'])} models and {len(data['edges'])}"
+            f" relations to {path}"
+        )
@@ -1,10 +1,20 @@
+from array import array
+import base64
 from collections import defaultdict
-from dataclasses import asdict, dataclass, field
+from dataclasses import asdict, dataclass, field, replace
 from enum import auto, StrEnum
+from functools import cache
+import hashlib
 from itertools import chain
-from typing import Protocol, Self
+import json
+from pathlib import Path
+import sys
+import threading
+from typing import Iterable, Protocol, Self
 
 from django.apps import apps
+from django.conf import settings
+from django.db.migrations.loader import MigrationLoader
 from django.db.models.fields.related import RelatedField
 
 
@@ -151,6 +161,8 @@ class EdgeOptions:
     length: int | None = None
     physics: bool | None = None
     smooth: dict | bool | None = None
+    title: str | None = None
+    value: int | None = None
     width: int | None = None
 
 
@@ -160,12 +172,22 @@ class Edge(EdgeOptions):
     to: str
 
 
+def edge_width(weight: int) -> int:
+    """Width for an edge standing for `weight` parallel edges; 1 for 1."""
+
+    return min(weight.bit_length(), 10)
+
+
 @dataclass(slots=True)
 class VisNetwork:
     nodes: dict[str, Node] = field(default_factory=dict)
     edges: defaultdict[tuple[str, str], list[Edge]] = field(
         default_factory=lambda: defaultdict(list)
     )
+    # Networks that contributed to each aggregated edge; not serialized
+    _edge_sources: dict[tuple[str, str], list[str]] = field(
+        default_factory=dict
+    )
 
     def add_node(self, node: Node) -> None:
         if node.id not in self.nodes:
@@ -184,27 +206,60 @@ class VisNetwork:
             combine: bool = True,
             overwrite_nodes: bool = False,
             allow_duplicate_edges: bool = False,
+            aggregate_edges: bool = False,
+            source: str = '',
     ) -> None:
-        if combine:
-            # only certain attributes should be combined
-            for k, node in network.nodes.items():
-                if k not in self.nodes:
-                    self.add_node(node)
-                    continue
-                if self.nodes[k].mass and node.mass:
-                    self.nodes[k].mass += node.mass
-                if self.nodes[k].value and node.value:
-                    self.nodes[k].value += node.value
-        if overwrite_nodes:
-            self.nodes.update(network.nodes)
-        else:
-            network.nodes.update(self.nodes)
-            self.nodes = network.nodes
+        """Merges another network into this one; `network` is not modified.
+
+        Nodes new to this network are copied. Existing nodes take the other
+        node when overwrite_nodes, or else add its mass and value when
+        combine.
+
+        Repeated edges are dropped, kept side by side when
+        allow_duplicate_edges, or merged into one edge when aggregate_edges.
+        A merged edge's value is the total weight of the edges it stands
+        for (an edge without a value weighs 1), its width follows from that,
+        and its title lists each `source` that contributed.
+        """
+
+        for k, node in network.nodes.items():
+            existing = self.nodes.get(k)
+            if existing is None or overwrite_nodes:
+                self.nodes[k] = replace(node)
+            elif combine:
+                # only certain attributes should be combined
+                if existing.mass and node.mass:
+                    existing.mass += node.mass
+                if existing.value and node.value:
+                    existing.value += node.value
         for key, lst in network.edges.items():
-            if allow_duplicate_edges:
+            if aggregate_edges:
+                self._aggregate_edges(key, lst, source)
+            elif allow_duplicate_edges:
                 self.edges[key].extend(lst)
             elif key not in self.edges:
-                self.edges[key] = lst
+                self.edges[key] = list(lst)
+
+    def _aggregate_edges(
+            self, key: tuple[str, str], edges: list[Edge], source: str
+    ) -> None:
+        current = self.edges.get(key)
+        if not edges:
+            return
+        weight = sum(edge.value or 1 for edge in edges)
+        if current:
+            weight += sum(edge.value or 1 for edge in current)
+            first = current[0]
+        else:
+            first = edges[0]
+        sources = self._edge_sources.setdefault(key, [])
+        if source and source not in sources:
+            sources.append(source)
+        title = None
+        if sources:
+            title = f'{", ".join(sources)} ({weight})'
+        self.edges[key] = [replace(
+            first, value=weight, width=edge_width(weight), title=title)]
 
     def collect_mass(self, use_for_value: bool = True) -> None:
         """For each 'to' in edges, add that to the mass of the node."""
@@ -228,6 +283,68 @@ class VisNetwork:
         data['edges'] = list(chain(*data['edges'].values()))
         return data
 
+    def to_compact(self) -> dict:
+        """A smaller equivalent of to_json() for large networks.
+
+        Strings (ids, labels, groups) are stored once in `strings`, and
+        options shared by many nodes or edges once in a palette. `ids` holds
+        the string of every node id referenced, nodes first; ids of edge
+        endpoints that aren't nodes here follow. Node columns are parallel
+        lists. `edges` is base64 of little-endian Int32 quads of (from index,
+        to index, style index, value or -1). Decoded by decodeNetwork() in
+        core/assets/vis.ts.
+        """
+
+        strings = {}
+        palettes = {'node': {}, 'edge': {}}
+
+        def intern(text: str) -> int:
+            return strings.setdefault(text, len(strings))
+
+        def style(kind: str, options: dict) -> int:
+            key = json.dumps(options, sort_keys=True)
+            return palettes[kind].setdefault(key, len(palettes[kind]))
+
+        index = {node_id: i for i, node_id in enumerate(self.nodes)}
+        columns = {k: [] for k in ('label', 'group', 'mass', 'value', 'style')}
+        for node in self.nodes.values():
+            options = asdict(node, dict_factory=vis_dict_factory)
+            del options['id']
+            columns['label'].append(intern(options.pop('label')))
+            columns['group'].append(intern(options.pop('group', '')))
+            columns['mass'].append(options.pop('mass', None))
+            columns['value'].append(options.pop('value', None))
+            columns['style'].append(style('node', options))
+        ids = list(self.nodes)
+        packed = array('i')
+        for edge in chain(*self.edges.values()):
+            options = asdict(edge, dict_factory=vis_dict_factory)
+            endpoints = []
+            for key in ('from', 'to'):
+                node_id = options.pop(key)
+                if node_id not in index:
+                    index[node_id] = len(ids)
+                    ids.append(node_id)
+                endpoints.append(index[node_id])
+            value = options.pop('value', None)
+            packed.extend((
+                *endpoints,
+                style('edge', options),
+                -1 if value is None else value,
+            ))
+        if sys.byteorder == 'big':
+            packed.byteswap()
+        ids = [intern(node_id) for node_id in ids]
+        return {
+            'format': 'compact',
+            'strings': list(strings),
+            'ids': ids,
+            'nodes': columns,
+            'nodeStyles': [json.loads(x) for x in palettes['node']],
+            'edges': base64.b64encode(packed.tobytes()).decode('ascii'),
+            'edgeStyles': [json.loads(x) for x in palettes['edge']],
+        }
+
 
 @dataclass(slots=True)
 class LayoutOptions:
@@ -291,7 +408,11 @@ class VisOptions:
 
 
 # noinspection PyProtectedMember
-def apps_dataset() -> dict:
+def build_apps_dataset() -> dict:
+    """Walks every installed model; see get_apps_dataset() for the cached
+    version.
+    """
+
     vn = VisNetwork()
     for mdl in apps.get_models():
         label = mdl._meta.label
@@ -324,3 +445,101 @@ def apps_dataset() -> dict:
                 vn.edges[(label, related_label)].append(edge)
     vn.collect_mass()
     return vn.to_json()
+
+
+@cache
+def migration_state() -> str:
+    """Identifies the schema by the latest migration of each app on disk.
+
+    Models only change with a deploy, i.e., a new process, so this is read
+    once per process.
+    """
+
+    loader = MigrationLoader(None, ignore_no_migrations=True)
+    leaves = sorted(loader.graph.leaf_nodes())
+    return hashlib.md5(repr(leaves).encode()).hexdigest()
+
+
+def dataset_path() -> Path | None:
+    path = getattr(settings, 'SCHEMAVIZ', {}).get('DATASET_PATH')
+    return Path(path) if path else None
+
+
+def write_apps_dataset(path: Path) -> dict:
+    """Writes the dataset with the migration state it was built for."""
+
+    data = {'migration_state': migration_state(), **build_apps_dataset()}
+    path.write_text(json.dumps(data, separators=(',', ':')))
+    return data
+
+
+def read_apps_dataset(path: Path) -> dict | None:
+    """The dataset written to `path`, unless missing or out of date."""
+
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+    if data.pop('migration_state', None) != migration_state():
+        return None
+    return data
+
+
+_lock = threading.Lock()
+_cached: tuple[str, dict] | None = None
+
+
+def get_apps_dataset() -> dict:
+    """The dataset for the current migration state, shared within the
+    process; read from SCHEMAVIZ['DATASET_PATH'] when that is up to date.
+    """
+
+    global _cached
+    state = migration_state()
+    with _lock:
+        if _cached is None or _cached[0] != state:
+            path = dataset_path()
+            data = read_apps_dataset(path) if path else None
+            _cached = (state, data or build_apps_dataset())
+        return _cached[1]
+
+
+def neighborhood(data: dict, label: str, depth: int) -> set[str]:
+    """Models within `depth` relations of a model, in either direction."""
+
+    adjacent = defaultdict(set)
+    for edge in data['edges']:
+        adjacent[edge['from']].add(edge['to'])
+        adjacent[edge['to']].add(edge['from'])
+    found = {label}
+    frontier = {label}
+    for _ in range(depth):
+        frontier = set().union(*(adjacent[x] for x in frontier)) - found
+        found |= frontier
+    return found
+
+
+def apps_dataset(
+        app_labels: Iterable[str] = (),
+        model: str = '',
+        depth: int = 1) -> dict:
+    """The schema as vis data, optionally limited to models of some apps
+    and/or the neighborhood of one model (an app_label.ModelName label).
+    """
+
+    data = get_apps_dataset()
+    keep = {node['id'] for node in data['nodes']}
+    if app_labels:
+        app_labels = set(app_labels)
+        keep = {x for x in keep if x.partition('.')[0] in app_labels}
+    if model:
+        keep &= neighborhood(data, model, depth)
+    if len(keep) == len(data['nodes']):
+        return data
+    return {
+        'nodes': [node for node in data['nodes'] if node['id'] in keep],
+        'edges': [
+            edge for edge in data['edges']
+            if edge['from'] in keep and edge['to'] in keep
+        ],
+    }
@@ -1,3 +1,5 @@
+from django.apps import apps
+from django.http import Http404
 from django_ccbv.views import TemplateView
 
 from core.models import Account
@@ -6,13 +8,33 @@ from .utils import apps_dataset
 
 
 class MainView(TemplateView):
+    max_depth = 5
     template_name = 'schemaviz/main.html'
 
     def get_context_data(self, **kwargs) -> dict:
+        """Filtered by ?app=core&app=auth and/or ?model=core.Person&depth=2.
+        """
+
         context = super().get_context_data(**kwargs)
+        model = self.request.GET.get('model', '')
+        if model:
+            try:
+                # Lookups ignore case; graph nodes use the exact label
+                model = apps.get_model(model)._meta.label
+            except (LookupError, ValueError):
+                raise Http404("No such model")
+        try:
+            depth = int(self.request.GET.get('depth', 1))
+        except ValueError:
+            depth = 1
+        depth = min(max(depth, 0), self.max_depth)
         context.update({
             # 'vis_data': apps_as_dataset(),
-            'vis_data': apps_dataset(),
+            'vis_data': apps_dataset(
+                app_labels=self.request.GET.getlist('app'),
+                model=model,
+                depth=depth,
+            ),
         })
         return context
 